@@ -0,0 +1,82 @@
+"""
+Hashing throughput of the upload path.
+
+Compares the original 4 KiB read loop of Upload.upload with the Hasher engine using large reads,
+memory-mapped reads and a process pool hashing many files at once.
+
+Usage:
+    python benchmarks/hashing.py [--size-mb 256] [--files 8] [--processes 4]
+"""
+import argparse
+import hashlib
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from streamtape.Hasher import Hasher  # noqa: E402
+
+
+def legacy_sha256(file_path: str) -> str:
+	sha256_hash = hashlib.sha256()
+	with open(file_path, "rb") as f:
+		for byte_block in iter(lambda: f.read(4096), b""):
+			sha256_hash.update(byte_block)
+
+	return sha256_hash.hexdigest()
+
+
+def measure(name: str, total_bytes: int, func) -> float:
+	started = time.perf_counter()
+	func()
+	elapsed = time.perf_counter() - started
+	throughput = total_bytes / elapsed / 1e9
+	print(f"{name:<40} {elapsed:8.3f} s {throughput:8.2f} GB/s")
+
+	return throughput
+
+
+def main():
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument("--size-mb", type=int, default=256, help="size of every test file in MiB")
+	parser.add_argument("--files", type=int, default=8, help="number of test files for the batch runs")
+	parser.add_argument("--processes", type=int, default=os.cpu_count(), help="size of the process pool")
+	args = parser.parse_args()
+
+	with tempfile.TemporaryDirectory() as directory:
+		paths = []
+		block = os.urandom(1024 * 1024)
+		for index in range(args.files):
+			path = os.path.join(directory, f"file{index}.bin")
+			with open(path, "wb") as f:
+				for _ in range(args.size_mb):
+					f.write(block)
+			paths.append(path)
+
+		single = args.size_mb * 1024 * 1024
+		batch = single * len(paths)
+		# Warm the page cache, so every run measures hashing and not the disk
+		legacy_sha256(paths[0])
+		for path in paths:
+			Hasher().hash_file(path)
+
+		print(f"single file ({args.size_mb} MiB)")
+		baseline = measure("4 KiB read loop (legacy)", single, lambda: legacy_sha256(paths[0]))
+		for read_size in (64 * 1024, 1024 * 1024, 8 * 1024 * 1024):
+			measure(f"{read_size // 1024} KiB readinto", single,
+					lambda: Hasher(read_size=read_size, use_mmap=False).hash_file(paths[0]))
+		best = measure("8 MiB mmap", single, lambda: Hasher().hash_file(paths[0]))
+		print(f"speedup vs legacy: {best / baseline:.2f}x\n")
+
+		print(f"batch ({len(paths)} x {args.size_mb} MiB)")
+		baseline = measure("4 KiB read loop, sequential", batch, lambda: [legacy_sha256(path) for path in paths])
+		measure("8 MiB mmap, threads", batch, lambda: list(Hasher().hash_many(paths, max_workers=args.processes)))
+		with Hasher(processes=args.processes) as hasher:
+			best = measure(f"8 MiB mmap, {args.processes} processes", batch, lambda: list(hasher.hash_many(paths)))
+		print(f"speedup vs legacy: {best / baseline:.2f}x")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,55 @@
+"""
+Import cost of the package for short-lived scripts.
+
+Every measurement runs in a fresh interpreter, so nothing is cached in sys.modules. Compares importing the
+streamtape.Client facade (which defers the endpoint modules and requests until they are used) with
+importing every endpoint class up front and with importing requests alone.
+
+Usage:
+    python benchmarks/import_time.py [--runs 10]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+CASES = {
+	"requests"                  : "import requests",
+	"streamtape.Client"         : "from streamtape import Client",
+	"Client + first endpoint"   : "from streamtape import Client; Client('user', 'password').files",
+	"all endpoint classes"      : (
+		"from streamtape.FileManager import FileManager; from streamtape.Upload import Upload; "
+		"from streamtape.Stream import Stream; from streamtape.Remote import Remote; "
+		"from streamtape.Convertation import Convertation; from streamtape.Account import Account"
+	),
+}
+
+
+def measure(statement: str) -> float:
+	code = f"import time; started = time.perf_counter(); {statement}; print(time.perf_counter() - started)"
+	output = subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True, capture_output=True, text=True)
+
+	return float(output.stdout.strip()) * 1000
+
+
+def main():
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument("--runs", type=int, default=10)
+	args = parser.parse_args()
+
+	for name, statement in CASES.items():
+		timings = [measure(statement) for _ in range(args.runs)]
+		print(f"{name:<30} median {statistics.median(timings):8.2f} ms   min {min(timings):8.2f} ms")
+
+	loaded = subprocess.run(
+		[sys.executable, "-c", "import sys; from streamtape import Client; print('requests' in sys.modules)"],
+		cwd=ROOT, check=True, capture_output=True, text=True
+	).stdout.strip()
+	print(f"requests imported by `from streamtape import Client`: {loaded}")
+
+
+if __name__ == "__main__":
+	main()
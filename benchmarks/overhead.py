@@ -0,0 +1,248 @@
+"""
+Client-side overhead of the API classes.
+
+Every endpoint method is called against a stub transport which answers from memory, so only the work done
+by the client is measured: building the query URL, dispatching the request, parsing the result
+(str_to_datetime, ApiResponse.message_info, ...). For every case the CPU time and the peak memory allocated
+per call are reported. The hashing engine is measured separately as throughput across file sizes.
+
+Store a baseline once and compare later runs against it. The comparison exits with status 1 if any case got
+slower, or allocates more, by more than the threshold. Baselines are machine specific, so create them on the
+machine (or CI runner) that runs the comparison.
+
+Usage:
+    python benchmarks/overhead.py --save benchmarks/baseline.json
+    python benchmarks/overhead.py --compare benchmarks/baseline.json [--threshold 0.25]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from streamtape.Account import Account  # noqa: E402
+from streamtape.ApiResponse import ApiResponse  # noqa: E402
+from streamtape.BaseConfig import BaseConfig  # noqa: E402
+from streamtape.Convertation import Convertation  # noqa: E402
+from streamtape.FileManager import FileManager  # noqa: E402
+from streamtape.Hasher import Hasher  # noqa: E402
+from streamtape.Metrics import endpoint_of  # noqa: E402
+from streamtape.Remote import Remote  # noqa: E402
+from streamtape.Stream import Stream  # noqa: E402
+from streamtape.Transport import Transport  # noqa: E402
+from streamtape.Upload import Upload  # noqa: E402
+
+MIB = 1024 * 1024
+
+RESULTS = {
+	"file/listfolder"        : {
+		"folders": [{"id": f"folder{i}", "name": f"Folder {i}"} for i in range(20)],
+		"files"  : [{"name": f"video{i}.mp4", "size": 7040842, "link": f"https://streamtape.com/v/file{i}",
+					 "created_at": 1573823606, "downloads": 0, "linkid": f"file{i}", "convert": "converted"}
+					for i in range(100)],
+	},
+	"file/createfolder"      : {"folderid": "folder0"},
+	"file/renamefolder"      : True,
+	"file/deletefolder"      : True,
+	"file/rename"            : True,
+	"file/move"              : True,
+	"file/delete"            : True,
+	"file/dlticket"          : {"ticket": "abcdefghijklmnopqrstuvwxyz", "wait_time": 0, "valid_until": "2030-01-01 12:00:00"},
+	"file/dl"                : {"name": "video.mp4", "size": 7040842, "url": "https://tapecontent.net/get/video.mp4"},
+	"file/info"              : {f"file{i}": {"id": f"file{i}", "name": "video.mp4", "size": 7040842, "type": "video/mp4",
+											 "converted": True, "status": 200} for i in range(100)},
+	"file/ul"                : {"url": "https://tapecontent.net/upload/TOKEN0", "valid_until": "2030-01-01 12:00:00"},
+	"file/runningconverts"   : [{"name": "video.mp4", "id": "file0", "status": "converting", "progress": 42}],
+	"file/failedconverts"    : [],
+	"file/getsplash"         : "https://thumb.tapecontent.net/thumb/file0/thumb.jpg",
+	"remotedl/add"           : {"id": "job0", "folderid": "folder0"},
+	"remotedl/remove"        : True,
+	"remotedl/status"        : {f"job{i}": {"id": f"job{i}", "remoteurl": "https://example.com/video.mp4", "status": "downloading",
+											"bytes_loaded": 1024, "bytes_total": 4096, "folderid": "folder0",
+											"added": "2030-01-01 12:00:00", "last_update": "2030-01-01 12:00:00",
+											"extid": False, "url": False} for i in range(50)},
+	"account/info"           : {"apiid": "user", "email": "user@example.com", "signup_at": "2020-01-01 12:00:00"},
+	"external"               : {"url": "https://streamtape.com/v/file0", "name": "video.mp4", "size": 65536},
+}
+
+
+class StubTransport(Transport):
+	def request(self, url: str, type_request: str = 'GET', data=None, parameters=None, files=None, headers=None,
+				timeout=None, idempotent=None, coalesce=False) -> dict:
+		return {"status": 200, "msg": "OK", "result": RESULTS[endpoint_of(url)]}
+
+
+def cases(upload_path: str) -> dict:
+	transport = StubTransport()
+	manager = FileManager("user", "password", transport)
+	stream = Stream("user", "password", transport)
+	remote = Remote("user", "password", transport)
+	converts = Convertation("user", "password", transport)
+	account = Account("user", "password", transport)
+	uploader = Upload("user", "password", transport)
+	file_ids = list(RESULTS["file/info"])
+	job_ids = list(RESULTS["remotedl/status"])
+
+	return {
+		"url_query"                        : lambda: manager.url_query("file/listfolder", {"folder": "folder0", "x": None}),
+		"send_request"                     : lambda: manager.send_request("https://api.streamtape.com/file/listfolder"),
+		"message_info"                     : lambda: [ApiResponse.message_info(status) for status in (200, 400, 403, 404, 509)],
+		"error_response"                   : lambda: ApiResponse.error_response(509, "Bandwidth exceeded"),
+		"str_to_datetime"                  : lambda: BaseConfig.str_to_datetime("2030-01-01 12:00:00"),
+		"FileManager.list_data"            : lambda: manager.list_data("folder0"),
+		"FileManager.create_folder"        : lambda: manager.create_folder("Folder", "folder0"),
+		"FileManager.rename_folder"        : lambda: manager.rename_folder("Folder", "folder0"),
+		"FileManager.delete_folder"        : lambda: manager.delete_folder("folder0"),
+		"FileManager.rename_file"          : lambda: manager.rename_file("file0", "video.mp4"),
+		"FileManager.move_file"            : lambda: manager.move_file("file0", "folder0"),
+		"FileManager.delete_file"          : lambda: manager.delete_file("file0"),
+		"Stream.dlticket"                  : lambda: stream.dlticket("file0"),
+		"Stream.resolve_link"              : lambda: stream.resolve_link("file0", "ticket"),
+		"Stream.download_link"             : lambda: stream.download_link("file0"),
+		"Stream.file_info[100]"            : lambda: stream.file_info(file_ids),
+		"Remote.check_remote_status[50]"   : lambda: remote.check_remote_status(job_ids),
+		"Remote.remove"                    : lambda: remote.remove("job0"),
+		"Remote.remote_upload"             : lambda: remote.remote_upload("https://example.com/video.mp4", "folder0"),
+		"Convertation.list_converts"       : lambda: converts.list_converts(),
+		"Convertation.list_failed_converts": lambda: converts.list_failed_converts(),
+		"Convertation.get_thumbnail"       : lambda: converts.get_thumbnail("file0"),
+		"Account.get_info"                 : lambda: account.get_info(),
+		"Upload.upload_url"                : lambda: uploader.upload_url("0" * 64, "folder0"),
+		"Upload.upload[64KiB]"             : lambda: uploader.upload(upload_path, "folder0"),
+	}
+
+
+def calibrate(func, min_time: float = 0.02) -> int:
+	func()
+
+	number = 1
+	while True:
+		started = time.process_time()
+		for _ in range(number):
+			func()
+		if time.process_time() - started >= min_time or number >= 1 << 20:
+			return number
+		number *= 2
+
+
+def measure_calls(funcs: dict, rounds: int = 15) -> dict:
+	# The cases are timed in interleaved rounds and the fastest round counts, which keeps the numbers stable
+	# when the machine is busy or the CPU frequency drifts during the run.
+	numbers = {name: calibrate(func) for name, func in funcs.items()}
+	timings = {name: float("inf") for name in funcs}
+
+	for _ in range(rounds):
+		for name, func in funcs.items():
+			started = time.process_time()
+			for _ in range(numbers[name]):
+				func()
+			timings[name] = min(timings[name], (time.process_time() - started) / numbers[name])
+
+	results = {}
+	for name, func in funcs.items():
+		peaks = []
+		for _ in range(3):
+			tracemalloc.start()
+			before = tracemalloc.get_traced_memory()[0]
+			func()
+			peaks.append(tracemalloc.get_traced_memory()[1] - before)
+			tracemalloc.stop()
+
+		results[name] = {"us": timings[name] * 1e6, "bytes": min(peaks)}
+
+	return results
+
+
+def measure_hashing(sizes_mb, directory: str) -> dict:
+	results = {}
+	with Hasher() as hasher:
+		for size_mb in sizes_mb:
+			path = os.path.join(directory, f"hash-{size_mb}.bin")
+			with open(path, "wb") as f:
+				f.write(os.urandom(size_mb * MIB))
+
+			hasher.hash_file(path)
+			timings = []
+			for _ in range(3):
+				started = time.perf_counter()
+				hasher.hash_file(path)
+				timings.append(time.perf_counter() - started)
+
+			results[f"hash[{size_mb}MiB]"] = {"mb_per_s": size_mb * MIB / min(timings) / 1e6}
+			os.remove(path)
+
+	return results
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list:
+	regressions = []
+	for name, values in current.items():
+		base = baseline.get(name)
+		if base is None:
+			continue
+
+		for metric, value in values.items():
+			reference = base.get(metric)
+			if reference is None:
+				continue
+
+			if metric == "mb_per_s":
+				regressed = value < reference / (1 + threshold)
+			elif metric == "bytes":
+				# Small absolute slack, allocator noise would dominate tiny peaks otherwise.
+				regressed = value > reference * (1 + threshold) + 256
+			else:
+				regressed = value > reference * (1 + threshold)
+
+			if regressed:
+				regressions.append(f"{name} {metric}: {reference:.2f} -> {value:.2f}")
+
+	return regressions
+
+
+def main():
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument("--save", help="Write the results as a baseline to this JSON file.")
+	parser.add_argument("--compare", help="Compare the results with this baseline JSON file.")
+	parser.add_argument("--threshold", type=float, default=0.25, help="The allowed relative regression.")
+	parser.add_argument("--rounds", type=int, default=15, help="Interleaved timing rounds per case.")
+	parser.add_argument("--hash-sizes", type=int, nargs="+", default=[1, 16, 128], help="File sizes in MiB.")
+	args = parser.parse_args()
+
+	results = {}
+	with tempfile.TemporaryDirectory() as directory:
+		upload_path = os.path.join(directory, "upload.bin")
+		with open(upload_path, "wb") as f:
+			f.write(os.urandom(64 * 1024))
+
+		results.update(measure_calls(cases(upload_path), args.rounds))
+		for name in list(results):
+			print(f"{name:<36} {results[name]['us']:10.2f} us/call {results[name]['bytes']:10d} B peak")
+
+		for name, values in measure_hashing(args.hash_sizes, directory).items():
+			results[name] = values
+			print(f"{name:<36} {values['mb_per_s']:10.1f} MB/s")
+
+	if args.save:
+		with open(args.save, "w") as f:
+			json.dump(results, f, indent=2, sort_keys=True)
+		print(f"baseline written to {args.save}")
+
+	if args.compare:
+		with open(args.compare) as f:
+			baseline = json.load(f)
+
+		regressions = compare(results, baseline, args.threshold)
+		for regression in regressions:
+			print(f"REGRESSION {regression}")
+		if regressions:
+			sys.exit(1)
+		print(f"no regressions above {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+	main()
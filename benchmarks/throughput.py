@@ -0,0 +1,140 @@
+"""
+End-to-end throughput of the library against the local API emulator.
+
+Starts streamtape.Emulator with the given latency, bandwidth cap and 509 fault injection, then drives the
+library's own clients with concurrent workers through folder listings, batched file information, uploads,
+segmented downloads and remote upload status polls. For every scenario the number of HTTP requests (retries
+included), requests/s, bytes/s and the p50/p99 request latencies are reported.
+
+Usage:
+    python benchmarks/throughput.py [--workers 16] [--latency 0.02] [--jitter 0.01] [--bandwidth 50e6]
+                                    [--error-rate 0.01] [--burst-length 3] [--wait-time 0]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from streamtape import Client  # noqa: E402
+from streamtape.Downloader import Downloader  # noqa: E402
+from streamtape.Emulator import Emulator  # noqa: E402
+from streamtape.Remote import Remote  # noqa: E402
+from streamtape.Retry import RetryPolicy  # noqa: E402
+from streamtape.Transport import Transport  # noqa: E402
+
+MIB = 1024 * 1024
+
+
+class Recorder:
+	def __init__(self):
+		self.latencies = []
+		self.statuses = []
+		self._lock = threading.Lock()
+
+	def after_request(self, request: dict, body, seconds: float):
+		with self._lock:
+			self.latencies.append(seconds)
+			self.statuses.append(body["status"] if body is not None else "error")
+
+	def reset(self):
+		with self._lock:
+			self.latencies, self.statuses = [], []
+
+
+def percentile(values: list, q: float) -> float:
+	if not values:
+		return 0.0
+
+	values = sorted(values)
+	return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def run(name: str, recorder: Recorder, func, payload_bytes: int = 0):
+	recorder.reset()
+	started = time.perf_counter()
+	func()
+	elapsed = time.perf_counter() - started
+
+	requests = len(recorder.latencies)
+	throttled = sum(1 for status in recorder.statuses if status == 509)
+	print(
+		f"{name:<22} {requests:7d} req {requests / elapsed:9.1f} req/s {payload_bytes / elapsed / 1e6:9.2f} MB/s "
+		f"p50 {percentile(recorder.latencies, 0.5) * 1000:8.2f} ms p99 {percentile(recorder.latencies, 0.99) * 1000:8.2f} ms "
+		f"509s {throttled:5d}"
+	)
+
+
+def main():
+	parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+	parser.add_argument("--workers", type=int, default=16)
+	parser.add_argument("--latency", type=float, default=0.02)
+	parser.add_argument("--jitter", type=float, default=0.01)
+	parser.add_argument("--bandwidth", type=float, default=None, help="Bytes per second per connection.")
+	parser.add_argument("--error-rate", type=float, default=0.0)
+	parser.add_argument("--burst-length", type=int, default=3)
+	parser.add_argument("--wait-time", type=int, default=0)
+	parser.add_argument("--folders", type=int, default=50)
+	parser.add_argument("--files", type=int, default=1000)
+	parser.add_argument("--uploads", type=int, default=32)
+	parser.add_argument("--file-size-mb", type=float, default=4)
+	args = parser.parse_args()
+
+	emulator = Emulator(latency=args.latency, jitter=args.jitter, bandwidth=args.bandwidth, error_rate=args.error_rate,
+						burst_length=args.burst_length, wait_time=args.wait_time, remote_speed=MIB, seed=1)
+	file_size = int(args.file_size_mb * MIB)
+
+	folders = [emulator.add_folder(f"Folder {i}") for i in range(args.folders)]
+	file_ids = [emulator.add_file(f"video{i}.mp4", file_size, folders[i % len(folders)]) for i in range(args.files)]
+
+	recorder = Recorder()
+	transport = Transport(pool_maxsize=args.workers, retry=RetryPolicy(max_retries=5, backoff_base=0.05))
+	transport.add_hook(after=recorder.after_request)
+	client = Client(emulator.user, emulator.password, transport=transport, url=emulator.url)
+
+	with emulator, tempfile.TemporaryDirectory() as directory, ThreadPoolExecutor(args.workers) as executor:
+		run("listfolder", recorder, lambda: list(executor.map(client.files.list_data, folders * 4)))
+		run("walk", recorder, lambda: sum(1 for _ in client.files.walk(max_workers=args.workers)))
+		run("file_info[100]", recorder, lambda: client.stream.file_info(file_ids, max_workers=args.workers))
+
+		paths = []
+		for i in range(args.uploads):
+			paths.append(os.path.join(directory, f"upload{i}.bin"))
+			with open(paths[-1], "wb") as f:
+				f.write(os.urandom(file_size))
+		run("upload", recorder, lambda: list(client.upload.upload_many(paths, folders[0], max_workers=args.workers)),
+			args.uploads * file_size)
+
+		downloader = Downloader(client.stream, transport, segment_size=max(file_size // 4, MIB), max_workers=4)
+		targets = file_ids[:args.uploads]
+		run("download", recorder, lambda: list(executor.map(
+			lambda file_id: downloader.download(file_id, os.path.join(directory, f"{file_id}.bin")), targets
+		)), len(targets) * file_size)
+
+		jobs = [row["id"] for row in client.remote.remote_upload_many(
+			[f"https://example.com/video{i}.mp4" for i in range(200)], folders[0], max_workers=args.workers,
+			rate=None, with_file_info=False
+		) if row["id"]]
+		run("remotedl/status[50]", recorder, lambda: list(executor.map(
+			client.remote.check_remote_status, [jobs[i:i + 50] for i in range(0, len(jobs), 50)] * 10
+		)))
+
+		# A standalone Remote must send its file information lookups to the configured URL as well
+		remote = Remote(emulator.user, emulator.password, transport=transport)
+		remote.set_api_url(emulator.url)
+		file_info_requests = emulator.requests.get("file/info", 0)
+		run("remotedl/add+info", recorder, lambda: remote.remote_upload_many(
+			[f"https://example.com/extra{i}.mp4" for i in range(50)], folders[0], max_workers=args.workers, rate=None
+		))
+		if emulator.requests.get("file/info", 0) == file_info_requests:
+			raise SystemExit("Remote.remote_upload_many did not send file/info to the emulator")
+
+	print(f"emulator requests: {sum(emulator.requests.values())}")
+
+
+if __name__ == "__main__":
+	main()
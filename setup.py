@@ -16,6 +16,9 @@ setup(
 	install_requires=[
 		"requests",
 	],
+	extras_require={
+		"async": ["aiohttp"],
+	},
 	requires_python=">=3.8",
 	classifiers=[
 		"Programming Language :: Python :: 3",
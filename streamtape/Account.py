@@ -2,13 +2,14 @@ from typing import Any, Dict, Optional
 
 from streamtape.ApiResponse import ApiResponse
 from streamtape.BaseConfig import BaseConfig
+from streamtape.Transport import Transport
 
 
 class Account(BaseConfig):
-	parameter: str = "parameter"
+	parameter: str = "account"
 
-	def __init__(self, user: str, password: str):
-		super().__init__(user, password)
+	def __init__(self, user: str, password: str, transport: Optional[Transport] = None):
+		super().__init__(user, password, transport)
 
 	def get_info(self) -> dict:
 		"""
@@ -27,12 +28,12 @@ class Account(BaseConfig):
 		        - 'msg': The error message returned by the API.
 		"""
 		url = self.url_query(f"{self.parameter}/info")
-		response = BaseConfig.send_request(url)
+		response = self.send_request(url, coalesce=True)
 		if response["status"] == 200:
 			return {
-				"apiid"    : response.result.get('apiid'),
-				"email"    : response.result.get('email'),
-				"signup_at": BaseConfig.str_to_datetime(response.result.get('signup_at'))
+				"apiid"    : response["result"].get('apiid'),
+				"email"    : response["result"].get('email'),
+				"signup_at": BaseConfig.str_to_datetime(response["result"].get('signup_at'))
 			}
 		else:
 			return ApiResponse.error_response(response["status"], response["msg"])
@@ -67,3 +67,23 @@ class ApiResponse:
 			'error_msg': ApiResponse.message_info(status),
 			'api_msg'  : error_msg
 		}
+
+
+class BatchResult(dict):
+	errors: list
+
+	def __init__(self, *args, errors: Optional[list] = None, **kwargs):
+		"""
+		A dictionary of merged results of a request which was split into several batches. Batches which failed
+		are listed in errors, so partial results can be used while the failures are retried or reported.
+
+		Parameters:
+		- errors (list, optional): The error responses of the failed batches. Defaults to an empty list.
+
+		Example:
+		>>> result = stream.file_info(many_ids)
+		>>> result.errors
+		[{'error': True, 'status_id': 509, 'error_msg': '...', 'api_msg': '...', 'file_ids': ['id1', 'id2']}]
+		"""
+		super().__init__(*args, **kwargs)
+		self.errors = errors or []
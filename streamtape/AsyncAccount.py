@@ -0,0 +1,31 @@
+from typing import Optional
+
+from streamtape.ApiResponse import ApiResponse
+from streamtape.AsyncBaseConfig import AsyncBaseConfig
+from streamtape.AsyncTransport import AsyncTransport
+from streamtape.BaseConfig import BaseConfig
+
+
+class AsyncAccount(AsyncBaseConfig):
+	parameter: str = "account"
+
+	def __init__(self, user: str, password: str, transport: Optional[AsyncTransport] = None):
+		super().__init__(user, password, transport)
+
+	async def get_info(self) -> dict:
+		"""
+		Async counterpart of Account.get_info. Retrieves information about the user from the API.
+
+		Returns:
+		    - dict: A dictionary with the keys 'apiid', 'email' and 'signup_at' or an error response dictionary.
+		"""
+		url = self.url_query(f"{self.parameter}/info")
+		response = await self.send_request(url, coalesce=True)
+		if response["status"] == 200:
+			return {
+				"apiid"    : response["result"].get('apiid'),
+				"email"    : response["result"].get('email'),
+				"signup_at": BaseConfig.str_to_datetime(response["result"].get('signup_at'))
+			}
+		else:
+			return ApiResponse.error_response(response["status"], response["msg"])
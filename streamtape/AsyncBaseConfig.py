@@ -0,0 +1,73 @@
+from typing import Optional
+
+from streamtape.ApiResponse import ApiResponse
+from streamtape.AsyncTransport import AsyncTransport
+from streamtape.BaseConfig import BaseConfig
+
+
+class AsyncBaseConfig(BaseConfig):
+	transport: Optional[AsyncTransport] = None
+
+	def __init__(self, user: str, password: str, transport: Optional[AsyncTransport] = None):
+		"""
+		Initializes an async API class with the provided user and password.
+
+		Args:
+		    - user (str): The username for the API authentication.
+		    - password (str): The password for the API authentication.
+		    - transport (AsyncTransport, optional): The transport to send requests with. Share one transport between
+		      several classes to reuse its connections and concurrency limit. Defaults to a new transport
+		      owned (and closed) by this instance.
+
+		Returns:
+		    - None
+		"""
+		self.api_user = user
+		self.api_password = password
+		self._owns_transport = transport is None
+		self.transport = transport or AsyncTransport()
+
+	async def send_request(self, url: str, type_request: str = 'GET', data=None, parameters: Optional[dict] = None,
+						   headers: Optional[dict] = None, timeout: Optional[float] = None, idempotent: Optional[bool] = None,
+						   coalesce: bool = False) -> ApiResponse:
+		"""
+		Sends a HTTP request to the specified URL without blocking the event loop.
+
+		Args:
+			- url (str): The URL to send the request to.
+			- type_request (str, optional): The type of request to send. Defaults to 'GET'.
+			- data (optional): The data to send with the request. Defaults to None.
+			- parameters (dict, optional): The parameters to include in the request. Defaults to None.
+			- headers (dict, optional): Additional request headers. Defaults to None.
+			- timeout (float, optional): Overrides the transport timeout for this call. Defaults to None.
+			- idempotent (bool, optional): Whether the transport may retry the request. Defaults to True for GET
+			  and False for POST requests.
+			- coalesce (bool, optional): Whether the read may share the response of an identical request in flight
+			  (see AsyncTransport single_flight). Defaults to False.
+
+		Returns:
+			- ApiResponse: The response from the server.
+		"""
+		response: Optional[ApiResponse] = None
+		if type_request.upper() in ('GET', 'POST'):
+			response = await self.transport.request(url, type_request, data=data, parameters=parameters,
+													headers=headers, timeout=timeout, idempotent=idempotent,
+													coalesce=coalesce)
+
+		return response
+
+	async def close(self):
+		"""
+		Closes the transport if it was created by this instance.
+
+		Returns:
+		    - None
+		"""
+		if self._owns_transport:
+			await self.transport.close()
+
+	async def __aenter__(self):
+		return self
+
+	async def __aexit__(self, exc_type, exc_val, exc_tb):
+		await self.close()
@@ -0,0 +1,62 @@
+from typing import Optional, Union
+
+from streamtape.ApiResponse import ApiResponse
+from streamtape.AsyncBaseConfig import AsyncBaseConfig
+from streamtape.AsyncTransport import AsyncTransport
+
+
+class AsyncConvertation(AsyncBaseConfig):
+	parameter: str = "file"
+
+	def __init__(self, user: str, password: str, transport: Optional[AsyncTransport] = None):
+		super().__init__(user, password, transport)
+
+	async def list_converts(self) -> Union[dict, list]:
+		"""
+		Async counterpart of Convertation.list_converts.
+
+		Returns:
+			- Union[Dict, List]: A dictionary or a list containing the running converts.
+		"""
+		url = self.url_query(f"{self.parameter}/runningconverts")
+		response = await self.send_request(url, coalesce=True)
+
+		if response["status"] == 200:
+			return response["result"]
+		else:
+			return ApiResponse.error_response(response["status"], response["msg"])
+
+	async def list_failed_converts(self) -> Union[dict, list]:
+		"""
+		Async counterpart of Convertation.list_failed_converts.
+
+		Returns:
+		    - Union[Dict, List]: A dictionary or a list containing the failed conversions.
+		"""
+		url = self.url_query(f"{self.parameter}/failedconverts")
+		response = await self.send_request(url, coalesce=True)
+
+		if response["status"] == 200:
+			return response["result"]
+		else:
+			return ApiResponse.error_response(response["status"], response["msg"])
+
+	async def get_thumbnail(self, file_id: str) -> Union[dict, list]:
+		"""
+		Async counterpart of Convertation.get_thumbnail.
+
+		Args:
+		    - file_id (str): The ID of the file for which the thumbnail is requested.
+
+		Returns:
+		    - Union[dict, list]: The thumbnail URL or an error response dictionary.
+		"""
+		url = self.url_query(f"{self.parameter}/getsplash", query={
+			"file": file_id
+		})
+		response = await self.send_request(url)
+
+		if response["status"] == 200:
+			return response["result"]
+		else:
+			return ApiResponse.error_response(response["status"], response["msg"])
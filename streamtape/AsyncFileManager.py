@@ -0,0 +1,165 @@
+from typing import Optional, Union
+
+from streamtape.ApiResponse import ApiResponse
+from streamtape.AsyncBaseConfig import AsyncBaseConfig
+from streamtape.AsyncTransport import AsyncTransport
+from streamtape.Models import FolderListing
+
+
+class AsyncFileManager(AsyncBaseConfig):
+	parameter: str = "file"
+
+	def __init__(self, user: str, password: str, transport: Optional[AsyncTransport] = None):
+		super().__init__(user, password, transport)
+
+	async def list_data(self, folder_id: Optional[str] = None) -> Union[dict, list]:
+		"""
+		Async counterpart of FileManager.list_data. Retrieves a list of data from a specified folder.
+
+		Args:
+		    - folder_id (Optional[str]): The ID of the folder to retrieve data from. Defaults to None.
+
+		Returns:
+		    - Union[dict, list]: A dictionary containing the "folders" and "files" of the folder.
+		"""
+		url = self.url_query(f"{self.parameter}/listfolder", query={
+			"folder": folder_id,
+		})
+		response = await self.send_request(url, coalesce=True)
+
+		if response["status"] == 200:
+			if self.typed and isinstance(response["result"], dict):
+				return FolderListing.from_dict(response["result"])
+			return response["result"]
+		else:
+			return ApiResponse.error_response(response["status"], response["msg"])
+
+	async def create_folder(self, folder_name: str, parent_folder: Optional[str] = None) -> dict:
+		"""
+		Async counterpart of FileManager.create_folder. Creates a new folder with the given folder name and parent folder.
+
+		Args:
+		    - folder_name (str): The name of the folder to be created.
+		    - parent_folder (str, optional): The ID of the parent folder. Defaults to None.
+
+		Returns:
+		    - dict: A dictionary containing the folder ID if the folder is created successfully.
+		"""
+		url = self.url_query(f"{self.parameter}/createfolder", query={
+			"name": folder_name,
+			"pid" : parent_folder,
+		})
+		response = await self.send_request(url, idempotent=False)
+
+		if response["status"] == 200:
+			return {
+				"folderid": response["result"].get("folderid")
+			}
+		else:
+			return ApiResponse.error_response(response["status"], response["msg"])
+
+	async def rename_folder(self, folder_name: str, parent_folder: str) -> Union[dict, bool]:
+		"""
+		Async counterpart of FileManager.rename_folder.
+
+		Args:
+		    - folder_name (str): The name of the folder to be renamed.
+		    - parent_folder (str): The name of the parent folder where the renamed folder will be moved.
+
+		Returns:
+		    - Union[dict, bool]: The success of the operation or an error response dictionary.
+		"""
+		url = self.url_query(f"{self.parameter}/renamefolder", query={
+			"name"  : folder_name,
+			"folder": parent_folder,
+		})
+		response = await self.send_request(url)
+
+		if response["status"] == 200:
+			return bool(response["result"])
+		else:
+			return ApiResponse.error_response(response["status"], response["msg"])
+
+	async def delete_folder(self, folder_id: str) -> Union[dict, bool]:
+		"""
+		Async counterpart of FileManager.delete_folder.
+
+		Args:
+		    - folder_id (str): The ID of the folder to be deleted.
+
+		Returns:
+		    - Union[dict, bool]: The success of the operation or an error response dictionary.
+		"""
+		url = self.url_query(f"{self.parameter}/deletefolder", query={
+			"folder": folder_id,
+		})
+		response = await self.send_request(url)
+
+		if response["status"] == 200:
+			return bool(response["result"])
+		else:
+			return ApiResponse.error_response(response["status"], response["msg"])
+
+	async def rename_file(self, file: str, name: str) -> Union[dict, bool]:
+		"""
+		Async counterpart of FileManager.rename_file.
+
+		Args:
+		    - file (str): The ID of the file to be renamed.
+		    - name (str): The new name for the file.
+
+		Returns:
+		    - Union[dict, bool]: The success of the operation or an error response dictionary.
+		"""
+		url = self.url_query(f"{self.parameter}/rename", query={
+			"file": file,
+			"name": name
+		})
+		response = await self.send_request(url)
+
+		if response["status"] == 200:
+			return bool(response["result"])
+		else:
+			return ApiResponse.error_response(response["status"], response["msg"])
+
+	async def move_file(self, file_id: str, folder_id: str) -> Union[dict, bool]:
+		"""
+		Async counterpart of FileManager.move_file.
+
+		Args:
+		    - file_id (str): The ID of the file to be moved.
+		    - folder_id (str): The ID of the folder to which the file will be moved.
+
+		Returns:
+		    - Union[dict, bool]: The success of the operation or an error response dictionary.
+		"""
+		url = self.url_query(f"{self.parameter}/move", query={
+			"file"  : file_id,
+			"folder": folder_id
+		})
+		response = await self.send_request(url)
+
+		if response["status"] == 200:
+			return bool(response["result"])
+		else:
+			return ApiResponse.error_response(response["status"], response["msg"])
+
+	async def delete_file(self, file_id: str) -> Union[dict, bool]:
+		"""
+		Async counterpart of FileManager.delete_file.
+
+		Args:
+		    - file_id (str): The ID of the file to be deleted.
+
+		Returns:
+		    - Union[dict, bool]: The success of the operation or an error response dictionary.
+		"""
+		url = self.url_query(f"{self.parameter}/delete", query={
+			"file": file_id
+		})
+		response = await self.send_request(url)
+
+		if response["status"] == 200:
+			return bool(response["result"])
+		else:
+			return ApiResponse.error_response(response["status"], response["msg"])
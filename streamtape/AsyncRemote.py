@@ -0,0 +1,136 @@
+from typing import Optional, Union
+
+from streamtape.ApiResponse import ApiResponse
+from streamtape.AsyncBaseConfig import AsyncBaseConfig
+from streamtape.AsyncStream import AsyncStream
+from streamtape.AsyncTransport import AsyncTransport
+from streamtape.Models import RemoteJob, records
+
+
+class AsyncRemote(AsyncBaseConfig):
+	parameter: str = "remotedl"
+
+	def __init__(self, user: str, password: str, transport: Optional[AsyncTransport] = None):
+		super().__init__(user, password, transport)
+		self._stream: Optional[AsyncStream] = None
+
+	@property
+	def stream(self) -> AsyncStream:
+		"""
+		Returns the async stream class used for file information lookups, sharing credentials, transport, API URL
+		and typed response mode with this class.
+
+		Returns:
+		    - AsyncStream: The stream class.
+		"""
+		if self._stream is None:
+			stream = AsyncStream(self.api_user, self.api_password, self.transport)
+			stream.set_api_url(self.url)
+			stream.set_typed_responses(self.typed)
+			self._stream = stream
+
+		return self._stream
+
+	def set_api_url(self, url: str):
+		"""
+		Sets the API URL for this class and its stream class.
+
+		Parameters:
+		- self: The object itself.
+		- url (str): The URL to be set as the API URL.
+
+		Returns:
+		- None
+		"""
+		super().set_api_url(url)
+		if self._stream is not None:
+			self._stream.set_api_url(url)
+
+	def set_typed_responses(self, typed: bool = True):
+		"""
+		Switches the typed response mode of this class and its stream class on or off.
+
+		Parameters:
+		- self: The object itself.
+		- typed (bool, optional): Whether to return typed records. Defaults to True.
+
+		Returns:
+		- None
+		"""
+		super().set_typed_responses(typed)
+		if self._stream is not None:
+			self._stream.set_typed_responses(typed)
+
+	async def remote_upload(self, file_url: str, folder: Optional[str] = None, headers: Optional[dict] = None,
+							name: Optional[str] = None) -> dict:
+		"""
+		Async counterpart of Remote.remote_upload.
+
+		Args:
+		    - file_url (str): The URL of the file to be uploaded.
+		    - folder (Optional[str], optional): The folder in which the file should be uploaded. Defaults to None.
+		    - headers (Optional[dict], optional): Additional headers to be included in the request. Defaults to None.
+		    - name (Optional[str], optional): The name of the file. Defaults to None.
+
+		Returns:
+		    - dict: A dictionary containing the ID of the uploaded file, the ID of the folder it belongs to, and the file information.
+		"""
+		url = self.url_query(f"{self.parameter}/add", {
+			"url"    : file_url,
+			"folder" : folder or None,
+			"headers": headers or {},
+			"name"   : name or None
+		})
+		response = await self.send_request(url, idempotent=False)
+
+		if response["status"] == 200:
+			file_info = await self.stream.file_info([response["result"].get('id')])
+			return {
+				"id"       : response["result"].get('id'),
+				"folderid" : response["result"].get('folderid'),
+				"file_info": file_info
+			}
+		else:
+			return ApiResponse.error_response(response["status"], response["msg"])
+
+	async def remove(self, file_id: str) -> Union[bool, dict]:
+		"""
+		Async counterpart of Remote.remove.
+
+		Args:
+		    - file_id (str): The ID of the remote upload to be removed.
+
+		Returns:
+		    - Union[bool, dict]: The success of the operation or an error response dictionary.
+		"""
+		url = self.url_query(f"{self.parameter}/remove", {
+			"id": file_id,
+		})
+		response = await self.send_request(url)
+
+		if response["status"] == 200:
+			return bool(response["result"])
+		else:
+			return ApiResponse.error_response(response["status"], response["msg"])
+
+	async def check_remote_status(self, file_id: str) -> Union[dict, list]:
+		"""
+		Async counterpart of Remote.check_remote_status.
+
+		Args:
+		    - file_id (str): The ID of the remote upload to check the status for.
+
+		Returns:
+		    - Union[dict, list]: The status of the remote upload keyed by its ID, or an error response dictionary.
+		"""
+		url = self.url_query(f"{self.parameter}/status", {
+			"id": file_id,
+		})
+		response = await self.send_request(url, coalesce=True)
+
+		if response["status"] == 200:
+			if self.typed and isinstance(response["result"], dict):
+				return records(response["result"], RemoteJob)
+			return response["result"]
+		else:
+			return ApiResponse.error_response(response["status"], response["msg"])
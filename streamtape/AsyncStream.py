@@ -0,0 +1,91 @@
+import asyncio
+from typing import Optional, Union
+
+from streamtape.ApiResponse import ApiResponse
+from streamtape.AsyncBaseConfig import AsyncBaseConfig
+from streamtape.AsyncTransport import AsyncTransport
+from streamtape.BaseConfig import BaseConfig
+from streamtape.Models import FileInfo, Ticket, records
+
+
+class AsyncStream(AsyncBaseConfig):
+	parameter: str = "file"
+
+	def __init__(self, user: str, password: str, transport: Optional[AsyncTransport] = None):
+		super().__init__(user, password, transport)
+
+	async def dlticket(self, file_id: str) -> dict:
+		"""
+		Async counterpart of Stream.dlticket. Retrieves a download ticket for a given file ID.
+
+		Args:
+		    - file_id (str): The ID of the file for which to retrieve the download ticket.
+
+		Returns:
+		    - dict: A dictionary containing the ticket, the wait time in seconds and the expiration date and time.
+		"""
+		url = self.url_query(f"{self.parameter}/dlticket", {
+			"file": file_id
+		})
+		response = await self.send_request(url)
+
+		if response["status"] == 200:
+			ticket = {
+				"ticket"     : response["result"].get('ticket'),
+				"wait_time"  : int(response["result"].get('wait_time')),
+				"valid_until": BaseConfig.str_to_datetime(response["result"].get('valid_until')),
+			}
+			return Ticket.from_dict(ticket) if self.typed else ticket
+		else:
+			return ApiResponse.error_response(response["status"], response["msg"])
+
+	async def download_link(self, file_id: str) -> dict:
+		"""
+		Async counterpart of Stream.download_link. Sleeps for the wait_time of the ticket without blocking the loop.
+
+		Args:
+		    - file_id (str): The ID of the file to be downloaded.
+
+		Returns:
+		    - dict: A dictionary containing the name, size, and URL of the downloaded file.
+		"""
+		dl_ticket = await self.dlticket(file_id)
+		if dl_ticket.get("error"):
+			return dl_ticket
+
+		await asyncio.sleep(dl_ticket["wait_time"])
+		url = self.url_query(f"{self.parameter}/dl", {
+			"file"  : file_id,
+			"ticket": dl_ticket["ticket"]
+		}, use_login=False)
+		response = await self.send_request(url)
+
+		if response["status"] == 200:
+			return {
+				"name": response["result"].get('name'),
+				"size": int(response["result"].get('size')),
+				"url" : response["result"].get('url'),
+			}
+		else:
+			return ApiResponse.error_response(response["status"], response["msg"])
+
+	async def file_info(self, file_id: Union[str, list]) -> dict:
+		"""
+		Async counterpart of Stream.file_info. Retrieves information about the specified files.
+
+		Args:
+		    - file_id (Union[str, list]): A file ID or a list of file IDs for which information needs to be retrieved.
+
+		Returns:
+		    - dict: A dictionary containing the information about the files.
+		"""
+		file_ids = [file_id] if isinstance(file_id, str) else list(file_id)
+		url = self.url_query(f"{self.parameter}/info", {
+			"file": ','.join(file_ids),
+		})
+		response = await self.send_request(url, coalesce=True)
+
+		if response["status"] == 200:
+			return records(response["result"], FileInfo) if self.typed else response["result"]
+		else:
+			return ApiResponse.error_response(response["status"], response["msg"])
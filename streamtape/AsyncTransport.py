@@ -0,0 +1,220 @@
+import asyncio
+import json
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from streamtape.Metrics import AfterHook, BeforeHook, Metrics, endpoint_of
+from streamtape.Retry import RetryPolicy
+from streamtape.SingleFlight import request_key
+
+try:
+	import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+	aiohttp = None
+
+
+class AsyncTransport:
+	limit: int = 100
+	limit_per_host: int = 0
+	max_concurrency: int = 100
+	timeout: float = 120.0
+	connect_timeout: float = 10.0
+	retry: Optional[RetryPolicy] = None
+	json_loads: Callable[[bytes], Any] = staticmethod(json.loads)
+
+	def __init__(self, limit: int = 100, limit_per_host: int = 0, max_concurrency: int = 100, timeout: float = 120.0,
+				 connect_timeout: float = 10.0, retry: Optional[RetryPolicy] = RetryPolicy(),
+				 json_loads: Optional[Callable[[bytes], Any]] = None, metrics: Optional[Metrics] = None,
+				 single_flight: bool = False):
+		"""
+		Initializes a non-blocking pooled HTTP transport for the async API classes. Requires aiohttp
+		(install with `pip install streamtape[async]`).
+
+		Args:
+		    - limit (int, optional): The total number of pooled connections. Defaults to 100.
+		    - limit_per_host (int, optional): The number of pooled connections per host, 0 means unlimited. Defaults to 0.
+		    - max_concurrency (int, optional): The maximum number of requests in flight at the same time. Defaults to 100.
+		    - timeout (float, optional): The total timeout of a request in seconds. Defaults to 120.0.
+		    - connect_timeout (float, optional): The connect timeout in seconds. Defaults to 10.0.
+		    - retry (RetryPolicy, optional): When idempotent requests are retried, None disables retries.
+		      Defaults to 3 retries with exponential back-off and jitter on network errors, 429, 5xx and 509.
+		    - json_loads (callable, optional): Decodes response bodies from bytes, e.g. orjson.loads. Defaults to json.loads.
+		    - metrics (Metrics, optional): Records counters and latency histograms of every request. Defaults to None.
+		    - single_flight (bool, optional): Merges identical read requests (sent with coalesce=True) which are in
+		      flight at the same time into one network call whose response is shared by every caller. Defaults to False.
+
+		Returns:
+		    - None
+
+		Raises:
+		    - ImportError: If aiohttp is not installed.
+		"""
+		if aiohttp is None:
+			raise ImportError("AsyncTransport requires aiohttp, install it with `pip install streamtape[async]`")
+
+		self.limit = limit
+		self.limit_per_host = limit_per_host
+		self.max_concurrency = max_concurrency
+		self.timeout = timeout
+		self.connect_timeout = connect_timeout
+		self.retry = retry
+		self.json_loads = json_loads or json.loads
+		self.session: Optional["aiohttp.ClientSession"] = None
+		self._semaphore: Optional[asyncio.Semaphore] = None
+		self.before_request: List[BeforeHook] = []
+		self.after_request: List[AfterHook] = []
+		self.metrics = metrics.instrument(self) if metrics is not None else None
+		self.single_flight = single_flight
+		self._in_flight: Dict[tuple, "asyncio.Future"] = {}
+
+	def _get_session(self) -> "aiohttp.ClientSession":
+		if self.session is None or self.session.closed:
+			connector = aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.limit_per_host)
+			timeout = aiohttp.ClientTimeout(total=self.timeout, connect=self.connect_timeout)
+			self.session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+			self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+		return self.session
+
+	def add_hook(self, before: Optional[BeforeHook] = None, after: Optional[AfterHook] = None):
+		"""
+		Registers instrumentation hooks which run around every request attempt, retries included. They are called
+		on the event loop and must not block.
+
+		Args:
+		    - before (callable, optional): Called with the request context, a dictionary with the keys 'method',
+		      'url', 'endpoint' (e.g. "file/listfolder") and 'attempt'. Defaults to None.
+		    - after (callable, optional): Called with the request context, the decoded response (None after a
+		      network error) and the duration of the attempt in seconds. Defaults to None.
+
+		Returns:
+		    - None
+		"""
+		if before is not None:
+			self.before_request.append(before)
+		if after is not None:
+			self.after_request.append(after)
+
+	def remove_hook(self, before: Optional[BeforeHook] = None, after: Optional[AfterHook] = None):
+		"""
+		Removes hooks registered with add_hook.
+
+		Args:
+		    - before (callable, optional): The pre-request hook. Defaults to None.
+		    - after (callable, optional): The post-request hook. Defaults to None.
+
+		Returns:
+		    - None
+		"""
+		if before in self.before_request:
+			self.before_request.remove(before)
+		if after in self.after_request:
+			self.after_request.remove(after)
+
+	async def _send(self, url: str, type_request: str, data, parameters: Optional[dict], headers: Optional[dict],
+					timeout: Optional[float]) -> tuple:
+		session = self._get_session()
+		options = {}
+		if timeout:
+			# Passing timeout=None would disable the session timeout instead of using it
+			options["timeout"] = aiohttp.ClientTimeout(total=timeout, connect=self.connect_timeout)
+
+		async with self._semaphore:
+			async with session.request(type_request.upper(), url, data=data, params=parameters, headers=headers,
+									   **options) as response:
+				content = await response.read()
+				retry_after = RetryPolicy.parse_retry_after(response.headers.get("Retry-After"))
+
+				try:
+					body = self.json_loads(content)
+					status = int(body["status"])
+				except (TypeError, KeyError, ValueError):
+					status = response.status if response.status != 200 else 502
+					text = content[:200].decode("utf-8", "replace")
+					return {"status": status, "msg": f"Unexpected response (HTTP {response.status}): {text}", "result": None}, retry_after
+
+				return {**body, "status": status}, retry_after
+
+	async def request(self, url: str, type_request: str = 'GET', data=None, parameters: Optional[dict] = None,
+					  headers: Optional[dict] = None, timeout: Optional[float] = None, idempotent: Optional[bool] = None,
+					  coalesce: bool = False) -> dict:
+		"""
+		Sends a HTTP request without blocking the event loop and returns the decoded JSON body. Idempotent
+		requests are retried and, with single_flight enabled, merged like in Transport.request.
+
+		Args:
+		    - url (str): The URL to send the request to.
+		    - type_request (str, optional): The type of request to send. Defaults to 'GET'.
+		    - data (optional): The body to send, e.g. an aiohttp.FormData. Defaults to None.
+		    - parameters (dict, optional): The parameters to include in the request. Defaults to None.
+		    - headers (dict, optional): Additional request headers. Defaults to None.
+		    - timeout (float, optional): Overrides the total timeout for this call. Defaults to None.
+		    - idempotent (bool, optional): Whether the request may be retried. Defaults to True for GET and
+		      False for every other request type.
+		    - coalesce (bool, optional): Whether the request is a read which may share the response of an identical
+		      request in flight when single_flight is enabled. Defaults to False.
+
+		Returns:
+		    - dict: The decoded JSON response. Bodies which are not API responses and network errors after the
+		      last attempt are returned as {"status": <code>, "msg": <description>, "result": None}.
+		"""
+		if idempotent is None:
+			idempotent = type_request.upper() == 'GET'
+
+		if not (coalesce and self.single_flight and type_request.upper() == 'GET' and data is None):
+			return await self._request(url, type_request, data, parameters, headers, timeout, idempotent)
+
+		key = request_key(url, parameters, headers)
+		task = self._in_flight.get(key)
+		if task is None:
+			task = self._in_flight[key] = asyncio.ensure_future(
+				self._request(url, type_request, data, parameters, headers, timeout, idempotent)
+			)
+			task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+		# A cancelled caller must not cancel the request the other callers are waiting for
+		return await asyncio.shield(task)
+
+	async def _request(self, url: str, type_request: str, data, parameters: Optional[dict], headers: Optional[dict],
+					   timeout: Optional[float], idempotent: bool) -> dict:
+		attempt = 0
+		while True:
+			retry_after: Optional[float] = None
+			context = {"method": type_request.upper(), "url": url, "endpoint": endpoint_of(url), "attempt": attempt}
+			for hook in self.before_request:
+				hook(context)
+
+			started = time.perf_counter()
+			try:
+				body, retry_after = await self._send(url, type_request, data, parameters, headers, timeout)
+				status = body["status"]
+			except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+				status = None
+				body = {"status": 503, "msg": f"{type(e).__name__}: {e}", "result": None}
+
+			elapsed = time.perf_counter() - started
+			for hook in self.after_request:
+				hook(context, body if status is not None else None, elapsed)
+
+			if status == 200 or not idempotent or self.retry is None or not self.retry.should_retry(status, attempt):
+				return body
+
+			await asyncio.sleep(self.retry.backoff(attempt, retry_after))
+			attempt += 1
+
+	async def close(self):
+		"""
+		Closes the underlying session and all pooled connections.
+
+		Returns:
+		    - None
+		"""
+		if self.session is not None:
+			await self.session.close()
+			self.session = None
+
+	async def __aenter__(self) -> "AsyncTransport":
+		return self
+
+	async def __aexit__(self, exc_type, exc_val, exc_tb):
+		await self.close()
@@ -0,0 +1,53 @@
+import asyncio
+import os
+from typing import Optional
+
+from streamtape.ApiResponse import ApiResponse
+from streamtape.AsyncBaseConfig import AsyncBaseConfig
+from streamtape.AsyncTransport import AsyncTransport, aiohttp
+from streamtape.Hasher import Hasher
+
+
+class AsyncUpload(AsyncBaseConfig):
+	parameter: str = "file"
+
+	hasher: Optional[Hasher] = None
+
+	def __init__(self, user: str, password: str, transport: Optional[AsyncTransport] = None, hasher: Optional[Hasher] = None):
+		super().__init__(user, password, transport)
+		self.hasher = hasher or Hasher()
+
+	async def upload(self, file_path: str, folder_id: Optional[str] = None) -> dict:
+		"""
+		Async counterpart of Upload.upload. The file is hashed in a worker thread so the event loop is never blocked.
+
+		Args:
+		    - file_path (str): The path of the file to be uploaded.
+		    - folder_id (Optional[str], optional): The ID of the folder where the file will be uploaded. Defaults to None.
+
+		Returns:
+		    - dict: The result of the upload or an error response dictionary.
+		"""
+		loop = asyncio.get_running_loop()
+		sha256 = await loop.run_in_executor(None, self.hasher.hash_file, file_path)
+
+		url = self.url_query(f"{self.parameter}/ul", query={
+			"sha256": sha256,
+			"folder": folder_id
+		})
+		response = await self.send_request(url)
+
+		if response is None:
+			return ApiResponse.error_response(404, "Couldn't send request")
+		if response["status"] != 200:
+			return ApiResponse.error_response(response["status"], response["msg"])
+
+		with open(file_path, "rb") as f:
+			form = aiohttp.FormData()
+			form.add_field("file1", f, filename=os.path.basename(file_path))
+			file_upload_response = await self.send_request(response["result"]["url"], type_request='POST', data=form)
+
+		if file_upload_response["status"] == 200:
+			return file_upload_response["result"]
+		else:
+			return ApiResponse.error_response(file_upload_response["status"], file_upload_response["msg"])
@@ -1,30 +1,58 @@
 from datetime import datetime
-from typing import Optional
+from functools import partial, update_wrapper
+from types import MethodType
+from typing import Callable, Optional
 from urllib.parse import urlencode
 
-import requests
-
 from streamtape.ApiResponse import ApiResponse
+from streamtape.Transport import TimeoutType, Transport
+
+
+class _instance_or_static:
+	def __init__(self, func: Callable):
+		"""
+		Binds a method to the instance, or to None when it is called on the class, so methods which used to be
+		static keep working as BaseConfig.method(...).
+
+		Args:
+		    - func (callable): The method, which handles self being None.
+
+		Returns:
+		    - None
+		"""
+		self.func = func
+		update_wrapper(self, func)
+
+	def __get__(self, instance, owner=None):
+		if instance is None:
+			return update_wrapper(partial(self.func, None), self.func)
+
+		return MethodType(self.func, instance)
 
 
 class BaseConfig:
 	url: str = 'https://api.streamtape.com'
 	api_user: Optional[str] = None
 	api_password: Optional[str] = None
+	transport: Optional[Transport] = None
+	typed: bool = False
 
-	def __init__(self, user: str, password: str):
+	def __init__(self, user: str, password: str, transport: Optional[Transport] = None):
 		"""
 		Initializes an instance of the class with the provided user and password.
 
 		Args:
 		    - user (str): The username for the API authentication.
 		    - password (str): The password for the API authentication.
+		    - transport (Transport, optional): The pooled transport to send requests with.
+		      Defaults to the process-wide shared transport.
 
 		Returns:
 		    - None
 		"""
 		self.api_user = user
 		self.api_password = password
+		self.transport = transport or Transport.default()
 
 	def set_api_url(self, url: str):
 		"""
@@ -43,6 +71,27 @@ class BaseConfig:
 		"""
 		self.url = url
 
+	def set_typed_responses(self, typed: bool = True):
+		"""
+		Switches the typed response mode on or off. In typed mode, folder listings, file information, download
+		tickets and remote upload states are returned as compact __slots__ records from streamtape.Models
+		instead of nested dictionaries. Error responses stay dictionaries.
+
+		Parameters:
+		- self: The object itself.
+		- typed (bool, optional): Whether to return typed records. Defaults to True.
+
+		Returns:
+		- None
+
+		Example:
+		>>> manager = FileManager(API_USER_KEY, API_PASSWORD)
+		>>> manager.set_typed_responses()
+		>>> manager.list_data().files[0].size
+		7040842
+		"""
+		self.typed = typed
+
 	def url_query(self, parameter: str, query: dict = {}, use_login: bool = True) -> str:
 		"""
 		Constructs a URL query string for making API requests.
@@ -50,7 +99,8 @@ class BaseConfig:
 		Args:
 		    - self (object): The instance of the class.
 		    - parameter (str): The parameter to be appended to the base URL.
-		    - query (dict, optional): Additional query parameters to be included in the URL. Defaults to an empty dictionary.
+		    - query (dict, optional): Additional query parameters to be included in the URL. Parameters set to None
+		      are left out. Defaults to an empty dictionary.
 		    - use_login (bool, optional): Flag indicating whether to include login credentials in the query parameters. Defaults to True.
 
 		Returns:
@@ -63,14 +113,18 @@ class BaseConfig:
 		"""
 		api_url = f"{self.url}/{parameter}"
 		api_query = {"login": self.api_user, "key": self.api_password} if use_login else {}
-		api_query = {**api_query, **query}
+		api_query = {key: value for key, value in {**api_query, **query}.items() if value is not None}
 
 		return f"{api_url}?{urlencode(api_query)}"
 
-	@staticmethod
-	def send_request(url: str, type_request: str = 'GET', data: Optional[dict] = None, parameters: Optional[dict] = None, files: Optional[dict] = None) -> ApiResponse:
+	@_instance_or_static
+	def send_request(self, url: str, type_request: str = 'GET', data: Optional[dict] = None, parameters: Optional[dict] = None, files: Optional[dict] = None,
+					 headers: Optional[dict] = None, timeout: Optional[TimeoutType] = None, idempotent: Optional[bool] = None,
+					 coalesce: bool = False) -> ApiResponse:
 		"""
-		Sends a HTTP request to the specified URL using the specified request type.
+		Sends a HTTP request to the specified URL using the specified request type over the pooled transport.
+		Called on the class (BaseConfig.send_request(url), the former static method), the request is sent over
+		the shared default transport.
 
 		Args:
 			- url (str): The URL to send the request to.
@@ -78,6 +132,12 @@ class BaseConfig:
 			- data (dict, optional): The data to send with the request. Defaults to None.
 			- parameters (dict, optional): The parameters to include in the request. Defaults to None.
 			- files (dict, optional): The files to include in the request. Defaults to None.
+			- headers (dict, optional): Additional request headers. Defaults to None.
+			- timeout (float | tuple, optional): Overrides the transport timeout for this call. Defaults to None.
+			- idempotent (bool, optional): Whether the transport may retry the request. Defaults to True for GET
+			  and False for POST requests.
+			- coalesce (bool, optional): Whether the read may share the response of an identical request in flight
+			  (see Transport single_flight). Defaults to False.
 
 		Returns:
 			- ApiResponse: The response from the server.
@@ -93,24 +153,23 @@ class BaseConfig:
 				"result": <result of the request. varies depending on the request>
 			}
 		"""
-		s = requests.Session()
 		response: Optional[ApiResponse] = None
-		if type_request.upper() == 'GET':
-			response = s.get(url, data=data, params=parameters, files=files).json()
-		elif type_request.upper() == 'POST':
-			response = s.post(url, data=data, params=parameters, files=files).json()
+		if type_request.upper() in ('GET', 'POST'):
+			transport = self.transport if self is not None else Transport.default()
+			response = transport.request(url, type_request, data=data, parameters=parameters, files=files,
+										 headers=headers, timeout=timeout, idempotent=idempotent, coalesce=coalesce)
 
 		return response
 
 	@staticmethod
-	def str_to_datetime(date_string: str, format_string: str = '%y-%m-%d %H:%M:%S'):
+	def str_to_datetime(date_string: str, format_string: str = '%Y-%m-%d %H:%M:%S'):
 		"""
 		Converts a string representation of a date and time to a datetime object.
 
 		Args:
 			- date_string (str): The string representation of the date and time.
 			- format_string (str, optional): The format string specifying the expected format of the date and time string.
-				Defaults to '%y-%m-%d %H:%M:%S'.
+				Defaults to '%Y-%m-%d %H:%M:%S'.
 
 		Returns:
 			- datetime: A datetime object representing the parsed date and time.
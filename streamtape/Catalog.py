@@ -0,0 +1,316 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from streamtape.FileManager import FileManager
+
+ROOT_ID = ""
+
+
+class Catalog:
+	max_workers: int = 8
+
+	def __init__(self, file_manager: FileManager, db_path: str = ":memory:", max_workers: int = 8):
+		"""
+		A local mirror of the remote folder and file catalog in an indexed SQLite database. After an initial
+		full sync, questions like "how many files are in folder X" or "total size under Y" are answered locally.
+
+		Args:
+		    - file_manager (FileManager): The file manager used to list folders.
+		    - db_path (str, optional): The path of the SQLite database. Defaults to an in-memory database.
+		    - max_workers (int, optional): The number of parallel listfolder requests while syncing. Defaults to 8.
+
+		Returns:
+		    - None
+
+		Example:
+		    >>> catalog = Catalog(FileManager(API_USER_KEY, API_PASSWORD), "catalog.sqlite")
+		    >>> catalog.sync_full()
+		    >>> catalog.total_size("B-qlJkdHFeo")
+		    7040842
+		"""
+		self.file_manager = file_manager
+		self.max_workers = max_workers
+		self._lock = threading.RLock()
+		self._connection = sqlite3.connect(os.path.expanduser(db_path), check_same_thread=False)
+		self._connection.row_factory = sqlite3.Row
+		self._connection.executescript(
+			"CREATE TABLE IF NOT EXISTS folders ("
+			"id TEXT PRIMARY KEY, parent_id TEXT, name TEXT NOT NULL, path TEXT NOT NULL, "
+			"signature TEXT, synced_at REAL NOT NULL);"
+			"CREATE INDEX IF NOT EXISTS folders_parent_id ON folders (parent_id);"
+			"CREATE INDEX IF NOT EXISTS folders_path ON folders (path);"
+			"CREATE INDEX IF NOT EXISTS folders_synced_at ON folders (synced_at);"
+			"CREATE TABLE IF NOT EXISTS files ("
+			"linkid TEXT PRIMARY KEY, folder_id TEXT NOT NULL, name TEXT NOT NULL, size INTEGER, link TEXT, "
+			"created_at INTEGER, downloads INTEGER, convert TEXT);"
+			"CREATE INDEX IF NOT EXISTS files_folder_id ON files (folder_id);"
+			"CREATE INDEX IF NOT EXISTS files_name ON files (name);"
+		)
+		self._connection.commit()
+
+	@staticmethod
+	def _signature(result: dict) -> str:
+		return hashlib.sha1(json.dumps(result, sort_keys=True, default=lambda record: record.to_dict()).encode("utf-8")).hexdigest()
+
+	def _children(self, folder_id: str) -> Dict[str, str]:
+		rows = self._connection.execute("SELECT id, name FROM folders WHERE parent_id = ?", (folder_id,))
+		return {row["id"]: row["name"] for row in rows}
+
+	def _delete_tree(self, folder_id: str) -> int:
+		ids = [row[0] for row in self._connection.execute(
+			"WITH RECURSIVE tree(id) AS (SELECT ? UNION ALL SELECT f.id FROM folders f JOIN tree t ON f.parent_id = t.id) "
+			"SELECT id FROM tree", (folder_id,)
+		)]
+		self._connection.executemany("DELETE FROM files WHERE folder_id = ?", [(i,) for i in ids])
+		self._connection.executemany("DELETE FROM folders WHERE id = ?", [(i,) for i in ids])
+
+		return len(ids)
+
+	def _store(self, folder_id: str, parent_id: Optional[str], name: str, path: str, result: dict, synced_at: float) -> bool:
+		signature = self._signature(result)
+		row = self._connection.execute("SELECT signature FROM folders WHERE id = ?", (folder_id,)).fetchone()
+
+		if row is None:
+			self._connection.execute(
+				"INSERT INTO folders (id, parent_id, name, path, signature, synced_at) VALUES (?, ?, ?, ?, ?, ?)",
+				(folder_id, parent_id, name, path, signature, synced_at)
+			)
+		else:
+			# An in-place update, INSERT OR REPLACE would delete and re-insert the row and touch every index
+			self._connection.execute(
+				"UPDATE folders SET parent_id = ?, name = ?, path = ?, signature = ?, synced_at = ? WHERE id = ?",
+				(parent_id, name, path, signature, synced_at, folder_id)
+			)
+			if row["signature"] == signature:
+				return False
+
+		self._connection.execute("DELETE FROM files WHERE folder_id = ?", (folder_id,))
+		self._connection.executemany(
+			"INSERT OR REPLACE INTO files (linkid, folder_id, name, size, link, created_at, downloads, convert) "
+			"VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+			[(
+				file.get("linkid"), folder_id, file.get("name"), file.get("size"), file.get("link"),
+				file.get("created_at"), file.get("downloads"), file.get("convert")
+			) for file in result.get("files") or []]
+		)
+
+		return True
+
+	def _crawl(self, starts: Iterable[Tuple[str, Optional[str], str, str]], recursive: bool, stats: dict) -> float:
+		"""
+		Lists the start folders in parallel and stores them. New subfolders are always crawled, already known
+		subfolders only if recursive is set. Subfolders which disappeared are removed with their subtree.
+		"""
+		synced_at = time.time()
+		executor = ThreadPoolExecutor(max_workers=self.max_workers)
+		pending: Dict[Future, Tuple[str, Optional[str], str, str]] = {}
+
+		def submit(node: Tuple[str, Optional[str], str, str]):
+			pending[executor.submit(self.file_manager.list_data, node[0] or None)] = node
+
+		try:
+			for node in starts:
+				submit(node)
+
+			while pending:
+				done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+				for future in done:
+					folder_id, parent_id, name, path = pending.pop(future)
+					result = future.result()
+					stats["listed"] += 1
+
+					if result.get("error"):
+						stats["errors"].append({"folder_id": folder_id or None, **result})
+						continue
+
+					with self._lock:
+						known = self._children(folder_id)
+						if not self._store(folder_id, parent_id, name, path, result, synced_at):
+							self._connection.commit()
+							if not recursive:
+								continue
+						else:
+							stats["changed"] += 1
+
+						listed = {subfolder.get("id"): subfolder.get("name") for subfolder in result.get("folders") or []}
+						for removed in set(known) - set(listed):
+							stats["removed_folders"] += self._delete_tree(removed)
+						self._connection.commit()
+
+					for subfolder_id, subfolder_name in listed.items():
+						if recursive or subfolder_id not in known:
+							stats["added_folders"] += subfolder_id not in known
+							submit((subfolder_id, folder_id, subfolder_name, f"{path.rstrip('/')}/{subfolder_name}"))
+		finally:
+			for future in pending:
+				future.cancel()
+			executor.shutdown(wait=False)
+
+		return synced_at
+
+	def sync_full(self, folder_id: Optional[str] = None) -> dict:
+		"""
+		Lists the whole folder tree below folder_id and mirrors it. Folders and files which no longer exist
+		remotely are removed from the catalog.
+
+		Args:
+		    - folder_id (Optional[str], optional): The ID of the folder to sync. Defaults to None (the root folder).
+
+		Returns:
+		    - dict: Sync statistics with the keys 'listed', 'changed', 'added_folders', 'removed_folders' and
+		      'errors' (error responses of folders which could not be listed).
+		"""
+		stats = {"listed": 0, "changed": 0, "added_folders": 0, "removed_folders": 0, "errors": []}
+		folder_id = folder_id or ROOT_ID
+
+		with self._lock:
+			row = self._connection.execute("SELECT parent_id, name, path FROM folders WHERE id = ?", (folder_id,)).fetchone()
+		start = (folder_id, row["parent_id"], row["name"], row["path"]) if row is not None else (folder_id, None, "", "/")
+
+		self._crawl([start], True, stats)
+
+		return stats
+
+	def sync(self, folder_ids: Optional[Iterable[str]] = None, max_age: Optional[float] = None) -> dict:
+		"""
+		Incrementally resyncs the catalog. Only the given folders (e.g. the folders you uploaded to or moved files
+		into) or the folders synced longer than max_age seconds ago are listed again. A folder whose listing did
+		not change costs one request and no file writes, only its sync time is updated. New subfolders are crawled completely and removed subfolders
+		are dropped with their subtree.
+
+		Args:
+		    - folder_ids (Optional[Iterable[str]], optional): The IDs of the folders to resync, None is the root folder.
+		      Defaults to None.
+		    - max_age (Optional[float], optional): Resync every folder synced more than max_age seconds ago.
+		      Defaults to None.
+
+		Returns:
+		    - dict: Sync statistics, see sync_full. If the catalog is empty, a full sync is done.
+		"""
+		stats = {"listed": 0, "changed": 0, "added_folders": 0, "removed_folders": 0, "errors": []}
+
+		with self._lock:
+			if self._connection.execute("SELECT 1 FROM folders LIMIT 1").fetchone() is None:
+				return self.sync_full()
+
+			if folder_ids is not None:
+				ids = [folder_id or ROOT_ID for folder_id in folder_ids]
+				rows = self._connection.execute(
+					f"SELECT id, parent_id, name, path FROM folders WHERE id IN ({','.join('?' * len(ids))})", ids
+				).fetchall()
+			elif max_age is not None:
+				rows = self._connection.execute(
+					"SELECT id, parent_id, name, path FROM folders WHERE synced_at < ?", (time.time() - max_age,)
+				).fetchall()
+			else:
+				rows = self._connection.execute("SELECT id, parent_id, name, path FROM folders").fetchall()
+
+		self._crawl([(row["id"], row["parent_id"], row["name"], row["path"]) for row in rows], False, stats)
+
+		return stats
+
+	def _tree_clause(self, folder_id: Optional[str], recursive: bool) -> Tuple[str, tuple]:
+		if recursive:
+			return (
+				"folder_id IN (WITH RECURSIVE tree(id) AS (SELECT ? UNION ALL "
+				"SELECT f.id FROM folders f JOIN tree t ON f.parent_id = t.id) SELECT id FROM tree)",
+				(folder_id or ROOT_ID,)
+			)
+
+		return "folder_id = ?", (folder_id or ROOT_ID,)
+
+	def count_files(self, folder_id: Optional[str] = None, recursive: bool = True) -> int:
+		"""
+		Returns the number of files in a folder.
+
+		Args:
+		    - folder_id (Optional[str], optional): The ID of the folder. Defaults to None (the root folder).
+		    - recursive (bool, optional): Include the files of all subfolders. Defaults to True.
+
+		Returns:
+		    - int: The number of files.
+		"""
+		clause, parameters = self._tree_clause(folder_id, recursive)
+		with self._lock:
+			return self._connection.execute(f"SELECT COUNT(*) FROM files WHERE {clause}", parameters).fetchone()[0]
+
+	def total_size(self, folder_id: Optional[str] = None, recursive: bool = True) -> int:
+		"""
+		Returns the total size in bytes of the files in a folder.
+
+		Args:
+		    - folder_id (Optional[str], optional): The ID of the folder. Defaults to None (the root folder).
+		    - recursive (bool, optional): Include the files of all subfolders. Defaults to True.
+
+		Returns:
+		    - int: The total size in bytes.
+		"""
+		clause, parameters = self._tree_clause(folder_id, recursive)
+		with self._lock:
+			return self._connection.execute(f"SELECT COALESCE(SUM(size), 0) FROM files WHERE {clause}", parameters).fetchone()[0]
+
+	def search(self, pattern: str, folder_id: Optional[str] = None, convert: Optional[str] = None, limit: int = 100) -> List[dict]:
+		"""
+		Searches files by name.
+
+		Args:
+		    - pattern (str): A SQL LIKE pattern matched against the file names, e.g. "%minecraft%".
+		    - folder_id (Optional[str], optional): Only search below this folder. Defaults to None (everywhere).
+		    - convert (Optional[str], optional): Only return files in this convert state, e.g. "converted". Defaults to None.
+		    - limit (int, optional): The maximum number of results. Defaults to 100.
+
+		Returns:
+		    - List[dict]: The matching files with their folder path.
+		"""
+		query = "SELECT files.*, folders.path AS folder_path FROM files LEFT JOIN folders ON folders.id = files.folder_id WHERE files.name LIKE ?"
+		parameters: tuple = (pattern,)
+
+		if folder_id is not None:
+			clause, tree_parameters = self._tree_clause(folder_id, True)
+			query += f" AND files.{clause}"
+			parameters += tree_parameters
+		if convert is not None:
+			query += " AND files.convert = ?"
+			parameters += (convert,)
+
+		with self._lock:
+			rows = self._connection.execute(f"{query} ORDER BY files.name LIMIT ?", parameters + (limit,)).fetchall()
+
+		return [dict(row) for row in rows]
+
+	def folder(self, path: str) -> Optional[dict]:
+		"""
+		Looks a folder up by its path, e.g. "/Movies/2024".
+
+		Args:
+		    - path (str): The "/" separated path of folder names.
+
+		Returns:
+		    - Optional[dict]: The folder row, or None if it is unknown.
+		"""
+		with self._lock:
+			row = self._connection.execute("SELECT * FROM folders WHERE path = ?", ("/" + path.strip("/"),)).fetchone()
+
+		return dict(row) if row is not None else None
+
+	def close(self):
+		"""
+		Closes the database.
+
+		Returns:
+		    - None
+		"""
+		self._connection.close()
+
+	def __enter__(self) -> "Catalog":
+		return self
+
+	def __exit__(self, exc_type, exc_val, exc_tb):
+		self.close()
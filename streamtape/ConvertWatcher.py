@@ -0,0 +1,135 @@
+import time
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Union
+
+if TYPE_CHECKING:
+	from streamtape.Convertation import Convertation
+
+EventCallback = Callable[[dict], None]
+
+
+class ConvertWatcher:
+	min_interval: float = 5.0
+	max_interval: float = 120.0
+	backoff_factor: float = 1.5
+
+	def __init__(self, convertation: "Convertation", min_interval: float = 5.0, max_interval: float = 120.0,
+				 on_event: Optional[EventCallback] = None, emit_existing: bool = False):
+		"""
+		Watches running and failed conversions and emits only what changed since the previous poll. The poll
+		interval drops to min_interval whenever something changed and grows by backoff_factor on every quiet poll,
+		up to max_interval.
+
+		Events are dictionaries with the keys 'type' ('started', 'progressed', 'finished' or 'failed'), 'id' and
+		'convert' (the entry returned by the API, for finished conversions its last known running state).
+
+		Args:
+		    - convertation (Convertation): The convertation class used for the requests.
+		    - min_interval (float, optional): The shortest time between two polls in seconds. Defaults to 5.0.
+		    - max_interval (float, optional): The longest time between two polls in seconds. Defaults to 120.0.
+		    - on_event (Optional[callable], optional): Called with every event. Defaults to None.
+		    - emit_existing (bool, optional): Emit 'started' and 'failed' events for the conversions found by the
+		      first poll. Otherwise the first poll only records the baseline. Defaults to False.
+
+		Returns:
+		    - None
+
+		Example:
+		    >>> watcher = converts.watch(min_interval=5, max_interval=60)
+		    >>> for event in watcher.events():
+		    ...     print(event["type"], event["id"], event["convert"].get("progress"))
+		"""
+		self.convertation = convertation
+		self.min_interval = min_interval
+		self.max_interval = max_interval
+		self.on_event = on_event
+		self.emit_existing = emit_existing
+		self.interval = min_interval
+		self.errors: List[dict] = []
+		self._running: Optional[Dict[str, dict]] = None
+		self._failed: Optional[Dict[str, dict]] = None
+
+	@staticmethod
+	def _index(result: Union[dict, list]) -> Dict[str, dict]:
+		if isinstance(result, dict):
+			return {key: value if isinstance(value, dict) else {"value": value} for key, value in result.items()}
+
+		index = {}
+		for entry in result or []:
+			if isinstance(entry, dict):
+				index[str(entry.get("linkid") or entry.get("id") or entry.get("name"))] = entry
+
+		return index
+
+	def _emit(self, events: List[dict], event_type: str, convert_id: str, convert: dict):
+		event = {"type": event_type, "id": convert_id, "convert": convert}
+		events.append(event)
+		if self.on_event is not None:
+			self.on_event(event)
+
+	def poll(self) -> List[dict]:
+		"""
+		Polls both endpoints once and returns the events since the previous poll.
+
+		Returns:
+		    - List[dict]: The events. If a request fails, its error response is added to the errors attribute,
+		      the snapshot is kept and the interval backs off.
+		"""
+		running = self.convertation.list_converts()
+		failed = self.convertation.list_failed_converts()
+
+		for result in (running, failed):
+			if isinstance(result, dict) and result.get("error") is True:
+				self.errors.append(result)
+				self.interval = min(self.max_interval, self.interval * self.backoff_factor)
+				return []
+
+		running_index = self._index(running)
+		failed_index = self._index(failed)
+		events: List[dict] = []
+		first = self._running is None
+
+		if first and not self.emit_existing:
+			self._running, self._failed = running_index, failed_index
+			return events
+
+		previous_running = self._running or {}
+		previous_failed = self._failed or {}
+
+		for convert_id, convert in running_index.items():
+			previous = previous_running.get(convert_id)
+			if previous is None:
+				self._emit(events, "started", convert_id, convert)
+			elif previous.get("progress") != convert.get("progress") or previous.get("status") != convert.get("status"):
+				self._emit(events, "progressed", convert_id, convert)
+
+		for convert_id, convert in failed_index.items():
+			if convert_id not in previous_failed:
+				self._emit(events, "failed", convert_id, convert)
+
+		for convert_id, convert in previous_running.items():
+			if convert_id not in running_index and convert_id not in failed_index:
+				self._emit(events, "finished", convert_id, convert)
+
+		self._running, self._failed = running_index, failed_index
+		self.interval = self.min_interval if events else min(self.max_interval, self.interval * self.backoff_factor)
+
+		return events
+
+	def events(self, timeout: Optional[float] = None) -> Iterator[dict]:
+		"""
+		Polls on the adaptive interval and yields the events as they happen.
+
+		Args:
+		    - timeout (Optional[float], optional): Stop after this many seconds. Defaults to None (watch forever).
+
+		Returns:
+		    - Iterator[dict]: The events.
+		"""
+		deadline = time.monotonic() + timeout if timeout is not None else None
+
+		while True:
+			yield from self.poll()
+
+			if deadline is not None and time.monotonic() + self.interval > deadline:
+				return
+			time.sleep(self.interval)
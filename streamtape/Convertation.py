@@ -1,14 +1,18 @@
-from typing import Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional, Union
 
 from streamtape.ApiResponse import ApiResponse
 from streamtape.BaseConfig import BaseConfig
+from streamtape.ConvertWatcher import ConvertWatcher, EventCallback
+from streamtape.ThumbnailCache import ThumbnailCache
+from streamtape.Transport import Transport
 
 
 class Convertation(BaseConfig):
 	parameter: str = "file"
 
-	def __init__(self, user: str, password: str):
-		super().__init__(user, password)
+	def __init__(self, user: str, password: str, transport: Optional[Transport] = None):
+		super().__init__(user, password, transport)
 
 	def list_converts(self) -> Union[dict, list]:
 		"""
@@ -22,7 +26,7 @@ class Convertation(BaseConfig):
 		"""
 
 		url = self.url_query(f"{self.parameter}/runningconverts")
-		response = BaseConfig.send_request(url)
+		response = self.send_request(url, coalesce=True)
 
 		if response["status"] == 200:
 			return response["result"]
@@ -45,13 +49,34 @@ class Convertation(BaseConfig):
 		    {'status': 200, 'result': ['conversion1', 'conversion2']}
 		"""
 		url = self.url_query(f"{self.parameter}/failedconverts")
-		response = BaseConfig.send_request(url)
+		response = self.send_request(url, coalesce=True)
 
 		if response["status"] == 200:
 			return response["result"]
 		else:
 			return ApiResponse.error_response(response["status"], response["msg"])
 
+	def watch(self, min_interval: float = 5.0, max_interval: float = 120.0, on_event: Optional[EventCallback] = None,
+			  emit_existing: bool = False) -> ConvertWatcher:
+		"""
+		Returns a watcher which polls the running and failed conversions on an adaptive interval and emits only
+		the changes (started, progressed, finished, failed).
+
+		Args:
+		    - min_interval (float, optional): The shortest time between two polls in seconds. Defaults to 5.0.
+		    - max_interval (float, optional): The longest time between two polls in seconds. Defaults to 120.0.
+		    - on_event (Optional[callable], optional): Called with every event. Defaults to None.
+		    - emit_existing (bool, optional): Emit events for the conversions found by the first poll. Defaults to False.
+
+		Returns:
+		    - ConvertWatcher: The watcher, iterate over its events() or call poll() from your own loop.
+
+		Example:
+		    >>> for event in converts.watch().events():
+		    ...     print(event["type"], event["id"])
+		"""
+		return ConvertWatcher(self, min_interval, max_interval, on_event, emit_existing)
+
 	def get_thumbnail(self, file_id: str) -> Union[dict, list]:
 		"""
 		Retrieves the thumbnail for a given file ID.
@@ -77,9 +102,58 @@ class Convertation(BaseConfig):
 		url = self.url_query(f"{self.parameter}/getsplash", query={
 			"file": file_id
 		})
-		response = BaseConfig.send_request(url)
+		response = self.send_request(url)
 
 		if response["status"] == 200:
 			return response["result"]
 		else:
 			return ApiResponse.error_response(response["status"], response["msg"])
+
+	def _fetch_thumbnail(self, file_id: str, cache: ThumbnailCache) -> Union[str, dict]:
+		url = self.get_thumbnail(file_id)
+		if isinstance(url, dict):
+			return url
+
+		try:
+			with self.transport.raw_request(url, stream=False) as response:
+				if response.status_code != 200:
+					return ApiResponse.error_response(response.status_code, f"Thumbnail download failed: {url}")
+				data = response.content
+		except IOError as e:
+			return ApiResponse.error_response(503, str(e))
+
+		return cache.put(file_id, data, url)
+
+	def get_thumbnails(self, file_ids: Iterable[str], cache: ThumbnailCache, max_workers: int = 8) -> Dict[str, Union[str, dict]]:
+		"""
+		Fetches the thumbnails of many files. Cached thumbnails are served from the cache without any request,
+		the others are resolved with getsplash and downloaded concurrently over the pooled transport.
+
+		Args:
+		    - file_ids (Iterable[str]): The IDs of the files.
+		    - cache (ThumbnailCache): The cache the images are stored in.
+		    - max_workers (int, optional): The number of thumbnails fetched at the same time. Defaults to 8.
+
+		Returns:
+		    - Dict[str, Union[str, dict]]: The path of the cached image per file ID, or an error response dictionary.
+
+		Example:
+		    >>> converts.get_thumbnails(["file123"], ThumbnailCache("thumbs"))
+		    {'file123': 'thumbs/objects/9b/9b74c9897bac770ffc029102a200c5de...'}
+		"""
+		thumbnails: Dict[str, Union[str, dict]] = {}
+		missing = []
+
+		for file_id in dict.fromkeys(file_ids):
+			path = cache.get(file_id)
+			if path is not None:
+				thumbnails[file_id] = path
+			else:
+				missing.append(file_id)
+
+		if missing:
+			with ThreadPoolExecutor(max_workers=max_workers) as executor:
+				for file_id, result in zip(missing, executor.map(lambda file_id: self._fetch_thumbnail(file_id, cache), missing)):
+					thumbnails[file_id] = result
+
+		return thumbnails
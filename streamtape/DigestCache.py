@@ -0,0 +1,196 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Optional
+
+
+class DigestCache:
+	max_entries: Optional[int] = 100000
+	max_age: Optional[float] = 30 * 24 * 3600
+	evict_every: Optional[int] = 1000
+
+	def __init__(self, db_path: str = ":memory:", max_entries: Optional[int] = 100000,
+				 max_age: Optional[float] = 30 * 24 * 3600, evict_every: Optional[int] = 1000):
+		"""
+		A persistent SHA-256 digest cache stored in a SQLite file. Entries are keyed by
+		(device, inode, size, mtime_ns), so any change to a file invalidates its entry.
+
+		Args:
+		    - db_path (str, optional): The path of the SQLite database. Defaults to an in-memory database.
+		    - max_entries (int, optional): The number of entries kept, least recently used entries are
+		      evicted first. None disables the limit. Defaults to 100000.
+		    - max_age (float, optional): The number of seconds an unused entry is kept. None disables
+		      the limit. Defaults to 30 days.
+		    - evict_every (int, optional): Runs evict after this many stored digests, so long-running processes
+		      keep the database bounded. None only evicts on close. Defaults to 1000.
+
+		Returns:
+		    - None
+
+		Example:
+		    >>> cache = DigestCache("~/.cache/streamtape-digests.sqlite")
+		    >>> uploader = Upload(API_USER_KEY, API_PASSWORD, digest_cache=cache)
+		    >>> uploader.upload("video.mp4")
+		    >>> cache.stats()
+		    {'hits': 0, 'misses': 1, 'entries': 1}
+		"""
+		self.max_entries = max_entries
+		self.max_age = max_age
+		self.evict_every = evict_every
+		self.hits = 0
+		self.misses = 0
+		self._puts = 0
+		self._lock = threading.Lock()
+		self._connection = sqlite3.connect(os.path.expanduser(db_path), check_same_thread=False)
+		self._connection.execute(
+			"CREATE TABLE IF NOT EXISTS digests ("
+			"dev INTEGER NOT NULL, ino INTEGER NOT NULL, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, "
+			"sha256 TEXT NOT NULL, path TEXT, accessed_at REAL NOT NULL, "
+			"PRIMARY KEY (dev, ino, size, mtime_ns))"
+		)
+		self._connection.execute("CREATE INDEX IF NOT EXISTS digests_accessed_at ON digests (accessed_at)")
+		self._connection.commit()
+
+	@staticmethod
+	def _key(file_path: str) -> tuple:
+		stat = os.stat(file_path)
+		return stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+	def get(self, file_path: str) -> Optional[str]:
+		"""
+		Returns the cached digest of a file if the file did not change since it was stored and the entry was
+		used within max_age.
+
+		Args:
+		    - file_path (str): The path of the file.
+
+		Returns:
+		    - Optional[str]: The hex digest, or None on a cache miss.
+		"""
+		key = self._key(file_path)
+
+		with self._lock:
+			row = self._connection.execute(
+				"SELECT sha256, accessed_at FROM digests WHERE dev = ? AND ino = ? AND size = ? AND mtime_ns = ?", key
+			).fetchone()
+			now = time.time()
+
+			if row is None or (self.max_age is not None and row[1] < now - self.max_age):
+				self.misses += 1
+				return None
+
+			self.hits += 1
+			self._connection.execute(
+				"UPDATE digests SET accessed_at = ? WHERE dev = ? AND ino = ? AND size = ? AND mtime_ns = ?",
+				(now, *key)
+			)
+			self._connection.commit()
+
+		return row[0]
+
+	def put(self, file_path: str, sha256: str, key: Optional[tuple] = None):
+		"""
+		Stores the digest of a file.
+
+		Args:
+		    - file_path (str): The path of the file.
+		    - sha256 (str): The hex digest of the file.
+		    - key (tuple, optional): The (device, inode, size, mtime_ns) key taken before hashing. If the file
+		      changed since then, the digest is not stored. Defaults to the current state of the file.
+
+		Returns:
+		    - None
+		"""
+		current = self._key(file_path)
+		if key is not None and key != current:
+			return
+
+		with self._lock:
+			self._connection.execute(
+				"INSERT OR REPLACE INTO digests (dev, ino, size, mtime_ns, sha256, path, accessed_at) "
+				"VALUES (?, ?, ?, ?, ?, ?, ?)",
+				(*current, sha256, os.path.abspath(file_path), time.time())
+			)
+			self._connection.commit()
+			self._puts += 1
+			due = self.evict_every is not None and self._puts % self.evict_every == 0
+
+		if due:
+			self.evict()
+
+	def digest(self, file_path: str, compute: Callable[[str], str]) -> str:
+		"""
+		Returns the cached digest of a file, computing and storing it on a miss.
+
+		Args:
+		    - file_path (str): The path of the file.
+		    - compute (callable): Computes the hex digest of a path on a cache miss.
+
+		Returns:
+		    - str: The hex digest of the file.
+		"""
+		sha256 = self.get(file_path)
+		if sha256 is None:
+			key = self._key(file_path)
+			sha256 = compute(file_path)
+			self.put(file_path, sha256, key)
+
+		return sha256
+
+	def evict(self) -> int:
+		"""
+		Removes entries older than max_age and the least recently used entries above max_entries.
+
+		Returns:
+		    - int: The number of removed entries.
+		"""
+		removed = 0
+
+		with self._lock:
+			if self.max_age is not None:
+				removed += self._connection.execute(
+					"DELETE FROM digests WHERE accessed_at < ?", (time.time() - self.max_age,)
+				).rowcount
+
+			if self.max_entries is not None:
+				removed += self._connection.execute(
+					"DELETE FROM digests WHERE rowid IN ("
+					"SELECT rowid FROM digests ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)", (self.max_entries,)
+				).rowcount
+
+			self._connection.commit()
+
+		return removed
+
+	def stats(self) -> dict:
+		"""
+		Returns the hit and miss counters of this instance and the number of stored entries.
+
+		Returns:
+		    - dict: A dictionary with the keys 'hits', 'misses' and 'entries'.
+		"""
+		with self._lock:
+			entries = self._connection.execute("SELECT COUNT(*) FROM digests").fetchone()[0]
+
+		return {
+			"hits"   : self.hits,
+			"misses" : self.misses,
+			"entries": entries,
+		}
+
+	def close(self):
+		"""
+		Evicts outdated entries and closes the database.
+
+		Returns:
+		    - None
+		"""
+		self.evict()
+		self._connection.close()
+
+	def __enter__(self) -> "DigestCache":
+		return self
+
+	def __exit__(self, exc_type, exc_val, exc_tb):
+		self.close()
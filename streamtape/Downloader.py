@@ -0,0 +1,225 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Optional, Set, Union
+
+from streamtape.ApiResponse import ApiResponse
+from streamtape.Multipart import ProgressCallback
+from streamtape.Stream import Stream
+from streamtape.Transport import Transport
+
+
+class Downloader:
+	segment_size: int = 16 * 1024 * 1024
+	max_workers: int = 8
+	chunk_size: int = 1024 * 1024
+
+	def __init__(self, stream: Optional[Stream] = None, transport: Optional[Transport] = None,
+				 segment_size: int = 16 * 1024 * 1024, max_workers: int = 8, chunk_size: int = 1024 * 1024):
+		"""
+		A segmented parallel downloader. The file is split into byte ranges which are fetched in parallel over
+		pooled connections and written into a preallocated file with positional writes. Finished segments are
+		recorded in a small sidecar state file, so an interrupted download resumes where it stopped.
+
+		Args:
+		    - stream (Stream, optional): Used to resolve file IDs into download links. Required to download by file ID.
+		      Defaults to None.
+		    - transport (Transport, optional): The pooled transport used for the range requests. Defaults to the
+		      transport of the stream, or the shared transport.
+		    - segment_size (int, optional): The size of one byte range. Defaults to 16 MiB.
+		    - max_workers (int, optional): The number of ranges fetched at the same time. Defaults to 8.
+		    - chunk_size (int, optional): The number of bytes read from the socket and written at once. Defaults to 1 MiB.
+
+		Returns:
+		    - None
+
+		Example:
+		    >>> downloader = Downloader(Stream(API_USER_KEY, API_PASSWORD), max_workers=8)
+		    >>> downloader.download("file_id", "video.mp4")
+		    {'path': 'video.mp4', 'size': 7040842, 'segments': 1, 'resumed_segments': 0}
+		"""
+		self.stream = stream
+		self.transport = transport or (stream.transport if stream is not None else Transport.default())
+		self.segment_size = segment_size
+		self.max_workers = max_workers
+		self.chunk_size = chunk_size
+		self._state_lock = threading.Lock()
+
+	@staticmethod
+	def state_path(destination: str) -> str:
+		"""
+		Returns the path of the sidecar state file of a download.
+
+		Args:
+		    - destination (str): The path the file is downloaded to.
+
+		Returns:
+		    - str: The path of the state file.
+		"""
+		return f"{destination}.part.json"
+
+	def _load_state(self, destination: str, size: int) -> Set[int]:
+		try:
+			with open(Downloader.state_path(destination), "r") as f:
+				state = json.load(f)
+		except (OSError, ValueError):
+			return set()
+
+		if state.get("size") != size or state.get("segment_size") != self.segment_size \
+				or not os.path.exists(f"{destination}.part"):
+			return set()
+
+		return set(state.get("done", []))
+
+	def _save_state(self, destination: str, size: int, done: Set[int]):
+		state_path = Downloader.state_path(destination)
+		with open(f"{state_path}.tmp", "w") as f:
+			json.dump({"size": size, "segment_size": self.segment_size, "done": sorted(done)}, f)
+		os.replace(f"{state_path}.tmp", state_path)
+
+	def _probe(self, url: str) -> Optional[int]:
+		with self.transport.raw_request(url, headers={"Range": "bytes=0-0"}) as response:
+			if response.status_code != 206:
+				return None
+
+			content_range = response.headers.get("Content-Range", "")
+			total = content_range.rsplit("/", 1)[-1]
+
+			return int(total) if total.isdigit() else None
+
+	@staticmethod
+	def _write(fd: int, data: bytes, offset: int, lock: threading.Lock):
+		if hasattr(os, "pwrite"):
+			while data:
+				written = os.pwrite(fd, data, offset)
+				data = data[written:]
+				offset += written
+		else:
+			with lock:
+				os.lseek(fd, offset, os.SEEK_SET)
+				os.write(fd, data)
+
+	def _fetch_segment(self, url: str, fd: int, start: int, end: int, lock: threading.Lock, report) -> None:
+		with self.transport.raw_request(url, headers={"Range": f"bytes={start}-{end}"}) as response:
+			if response.status_code != 206:
+				raise IOError(f"Range request for bytes {start}-{end} answered with HTTP {response.status_code}")
+
+			offset = start
+			for chunk in response.iter_content(chunk_size=self.chunk_size):
+				Downloader._write(fd, chunk, offset, lock)
+				offset += len(chunk)
+				report(len(chunk))
+
+			if offset != end + 1:
+				raise IOError(f"Segment {start}-{end} ended after {offset - start} bytes")
+
+	def _fetch_whole(self, url: str, destination: str, report) -> int:
+		size = 0
+		with self.transport.raw_request(url) as response, open(f"{destination}.part", "wb") as f:
+			response.raise_for_status()
+			for chunk in response.iter_content(chunk_size=self.chunk_size):
+				f.write(chunk)
+				size += len(chunk)
+				report(len(chunk))
+
+		return size
+
+	def download(self, source: Union[str, dict], destination: str, progress: Optional[ProgressCallback] = None) -> dict:
+		"""
+		Downloads a file. Servers which do not support range requests are downloaded in a single stream.
+
+		Args:
+		    - source (Union[str, dict]): A file ID, a download URL or a link dictionary returned by Stream.download_link.
+		    - destination (str): The path to save the file to. While downloading, data is written to
+		      "<destination>.part" and the state to "<destination>.part.json".
+		    - progress (Optional[callable], optional): Called with (bytes_done, total_bytes, bytes_per_second).
+		      Defaults to None.
+
+		Returns:
+		    - dict: A dictionary with the keys 'path', 'size', 'segments' and 'resumed_segments', or an error
+		      response dictionary. After an error, calling download again resumes the download.
+		"""
+		size: Optional[int] = None
+		if isinstance(source, dict):
+			url, size = source.get("url"), source.get("size")
+		elif source.startswith(("http://", "https://")):
+			url = source
+		else:
+			if self.stream is None:
+				return ApiResponse.error_response(400, "A Stream is required to download by file ID")
+			link = self.stream.download_link(source)
+			if link.get("error"):
+				return link
+			url, size = link["url"], link.get("size")
+
+		try:
+			probed = self._probe(url)
+		except IOError as e:
+			return ApiResponse.error_response(404, str(e))
+
+		done_bytes = 0
+		started = time.monotonic()
+		report_lock = threading.Lock()
+
+		def report(count: int):
+			nonlocal done_bytes
+			with report_lock:
+				done_bytes += count
+				if progress is not None:
+					elapsed = time.monotonic() - started
+					progress(done_bytes, size or 0, done_bytes / elapsed if elapsed > 0 else 0.0)
+
+		if probed is None:
+			try:
+				size = self._fetch_whole(url, destination, report)
+			except IOError as e:
+				return ApiResponse.error_response(500, str(e))
+			os.replace(f"{destination}.part", destination)
+
+			return {"path": destination, "size": size, "segments": 1, "resumed_segments": 0}
+
+		size = probed
+		segments: List[tuple] = [
+			(index, start, min(start + self.segment_size, size) - 1)
+			for index, start in enumerate(range(0, size, self.segment_size))
+		]
+		done = self._load_state(destination, size)
+		resumed = len(done)
+		report(sum(end - start + 1 for index, start, end in segments if index in done))
+
+		fd = os.open(f"{destination}.part", os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+		errors: List[str] = []
+		try:
+			if not done:
+				os.ftruncate(fd, size)
+				self._save_state(destination, size, done)
+
+			write_lock = threading.Lock()
+			with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+				futures = {
+					executor.submit(self._fetch_segment, url, fd, start, end, write_lock, report): index
+					for index, start, end in segments if index not in done
+				}
+
+				for future in as_completed(futures):
+					try:
+						future.result()
+					except IOError as e:
+						errors.append(str(e))
+						continue
+
+					with self._state_lock:
+						done.add(futures[future])
+						self._save_state(destination, size, done)
+		finally:
+			os.close(fd)
+
+		if errors:
+			return ApiResponse.error_response(500, f"{len(errors)} segment(s) failed, call download again to resume: {errors[0]}")
+
+		os.replace(f"{destination}.part", destination)
+		os.remove(Downloader.state_path(destination))
+
+		return {"path": destination, "size": size, "segments": len(segments), "resumed_segments": resumed}
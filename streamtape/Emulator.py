@@ -0,0 +1,536 @@
+import hashlib
+import json
+import random
+import string
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, Optional, Tuple
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+ROOT_ID = ""
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+class _Handler(BaseHTTPRequestHandler):
+	protocol_version = "HTTP/1.1"
+	server: "_Server"
+
+	def do_GET(self):
+		self.server.emulator._handle(self)
+
+	def do_POST(self):
+		self.server.emulator._handle(self)
+
+	def log_message(self, format, *args):
+		pass
+
+
+class _Server(ThreadingHTTPServer):
+	daemon_threads = True
+	emulator: "Emulator"
+
+
+class Emulator:
+	latency: float = 0.0
+	jitter: float = 0.0
+	bandwidth: Optional[float] = None
+	error_rate: float = 0.0
+	burst_length: int = 5
+	wait_time: int = 0
+
+	def __init__(self, user: str = "user", password: str = "password", host: str = "127.0.0.1", port: int = 0,
+				 latency: float = 0.0, jitter: float = 0.0, bandwidth: Optional[float] = None, error_rate: float = 0.0,
+				 burst_length: int = 5, wait_time: int = 0, remote_size: int = 16 * 1024 * 1024,
+				 remote_speed: float = 8 * 1024 * 1024, convert_time: float = 0.0, seed: Optional[int] = None):
+		"""
+		A local stand-in for api.streamtape.com to test and load test concurrent pipelines without touching the
+		production quotas. It keeps folders, files, download tickets, remote uploads and conversions in memory and
+		implements the endpoints the library calls, plus the upload, download and thumbnail targets they return.
+
+		Args:
+		    - user (str, optional): The accepted API login. Defaults to "user".
+		    - password (str, optional): The accepted API key. Defaults to "password".
+		    - host (str, optional): The interface to listen on. Defaults to "127.0.0.1".
+		    - port (int, optional): The port, 0 picks a free one. Defaults to 0.
+		    - latency (float, optional): Seconds added to every response. Defaults to 0.0.
+		    - jitter (float, optional): Up to this many random seconds added on top of latency. Defaults to 0.0.
+		    - bandwidth (Optional[float], optional): Bytes per second per connection for uploads and downloads,
+		      None is unlimited. Defaults to None.
+		    - error_rate (float, optional): The probability that an API request starts a burst of 509 (bandwidth
+		      exceeded) responses. Defaults to 0.0.
+		    - burst_length (int, optional): The number of consecutive API requests answered with 509 per burst.
+		      Defaults to 5.
+		    - wait_time (int, optional): The wait_time of the download tickets in seconds. Defaults to 0.
+		    - remote_size (int, optional): The size of the files fetched by remote uploads. Defaults to 16 MiB.
+		    - remote_speed (float, optional): Bytes per second a remote upload progresses. Defaults to 8 MiB/s.
+		    - convert_time (float, optional): Seconds an uploaded file stays in the running conversions. Defaults to 0.0.
+		    - seed (Optional[int], optional): Seed of the IDs and the fault injection. Defaults to None.
+
+		Returns:
+		    - None
+
+		Example:
+		    >>> with Emulator(latency=0.02, error_rate=0.01, wait_time=1) as emulator:
+		    ...     client = Client("user", "password", url=emulator.url)
+		    ...     folder = emulator.add_folder("Videos")
+		    ...     emulator.add_file("video.mp4", 7040842, folder)
+		    ...     client.files.list_data(folder)
+		"""
+		self.user = user
+		self.password = password
+		self.latency = latency
+		self.jitter = jitter
+		self.bandwidth = bandwidth
+		self.error_rate = error_rate
+		self.burst_length = burst_length
+		self.wait_time = wait_time
+		self.remote_size = remote_size
+		self.remote_speed = remote_speed
+		self.convert_time = convert_time
+		self.requests: Dict[str, int] = {}
+
+		self._random = random.Random(seed)
+		self._lock = threading.RLock()
+		self._burst = 0
+		self._folders: Dict[str, dict] = {ROOT_ID: {"id": ROOT_ID, "name": "", "parent": None}}
+		self._files: Dict[str, dict] = {}
+		self._tickets: Dict[str, Tuple[str, float, float]] = {}
+		self._uploads: Dict[str, Tuple[str, float]] = {}
+		self._jobs: Dict[str, dict] = {}
+
+		self._server = _Server((host, port), _Handler)
+		self._server.emulator = self
+		self._thread: Optional[threading.Thread] = None
+
+	@property
+	def url(self) -> str:
+		"""
+		Returns:
+		    - str: The base URL to pass to set_api_url or Client(url=...).
+		"""
+		host, port = self._server.server_address[:2]
+		return f"http://{host}:{port}"
+
+	def start(self) -> "Emulator":
+		"""
+		Starts serving in a background thread.
+
+		Returns:
+		    - Emulator: The emulator itself.
+		"""
+		if self._thread is None:
+			self._thread = threading.Thread(target=self._server.serve_forever, name="streamtape-emulator", daemon=True)
+			self._thread.start()
+
+		return self
+
+	def stop(self):
+		"""
+		Stops serving and closes the socket.
+
+		Returns:
+		    - None
+		"""
+		if self._thread is not None:
+			self._server.shutdown()
+			self._thread.join()
+			self._thread = None
+		self._server.server_close()
+
+	def __enter__(self) -> "Emulator":
+		return self.start()
+
+	def __exit__(self, exc_type, exc_val, exc_tb):
+		self.stop()
+
+	def _id(self, length: int = 15) -> str:
+		with self._lock:
+			return "".join(self._random.choice(string.ascii_letters + string.digits) for _ in range(length))
+
+	def add_folder(self, name: str, parent: str = ROOT_ID) -> str:
+		"""
+		Creates a folder.
+
+		Args:
+		    - name (str): The name of the folder.
+		    - parent (str, optional): The ID of the parent folder. Defaults to the root folder.
+
+		Returns:
+		    - str: The ID of the folder.
+		"""
+		folder_id = self._id()
+		with self._lock:
+			self._folders[folder_id] = {"id": folder_id, "name": name, "parent": parent}
+
+		return folder_id
+
+	def add_file(self, name: str, size: int, folder: str = ROOT_ID, data: Optional[bytes] = None) -> str:
+		"""
+		Creates a file. Without data, the content is generated from the file ID when it is downloaded.
+
+		Args:
+		    - name (str): The name of the file.
+		    - size (int): The size in bytes, ignored if data is given.
+		    - folder (str, optional): The ID of the folder. Defaults to the root folder.
+		    - data (Optional[bytes], optional): The content of the file. Defaults to None.
+
+		Returns:
+		    - str: The link ID of the file.
+		"""
+		file_id = self._id()
+		with self._lock:
+			self._files[file_id] = {
+				"name"      : name,
+				"size"      : len(data) if data is not None else size,
+				"folder"    : folder,
+				"data"      : data,
+				"created_at": time.time(),
+				"downloads" : 0,
+			}
+
+		return file_id
+
+	@staticmethod
+	def content(file_id: str, size: int) -> bytes:
+		"""
+		Returns the generated content of a file created without data.
+
+		Args:
+		    - file_id (str): The link ID of the file.
+		    - size (int): The size of the file.
+
+		Returns:
+		    - bytes: The content.
+		"""
+		block = hashlib.sha256(file_id.encode("utf-8")).digest() * 2048
+		return (block * (size // len(block) + 1))[:size]
+
+	def _convert(self, file: dict) -> Tuple[str, int]:
+		elapsed = time.time() - file["created_at"]
+		if self.convert_time and elapsed < self.convert_time:
+			return "converting", int(100 * elapsed / self.convert_time)
+
+		return "converted", 100
+
+	def _file_entry(self, file_id: str, file: dict) -> dict:
+		return {
+			"name"      : file["name"],
+			"size"      : file["size"],
+			"link"      : f"https://streamtape.com/v/{file_id}/{file['name']}",
+			"created_at": int(file["created_at"]),
+			"downloads" : file["downloads"],
+			"linkid"    : file_id,
+			"convert"   : self._convert(file)[0],
+		}
+
+	def _job_entry(self, job_id: str, job: dict) -> dict:
+		loaded = min(job["bytes_total"], int((time.time() - job["added"]) * self.remote_speed))
+		finished = loaded >= job["bytes_total"]
+
+		with self._lock:
+			if finished and job["file_id"] is None:
+				job["file_id"] = self.add_file(job["name"], job["bytes_total"], job["folder"])
+
+		return {
+			"id"          : job_id,
+			"remoteurl"   : job["url"],
+			"status"      : "finished" if finished else "downloading",
+			"bytes_loaded": str(loaded),
+			"bytes_total" : str(job["bytes_total"]),
+			"folderid"    : job["folder"],
+			"added"       : datetime.fromtimestamp(job["added"]).strftime(DATE_FORMAT),
+			"last_update" : datetime.now().strftime(DATE_FORMAT),
+			"extid"       : job["file_id"] or False,
+			"url"         : f"https://streamtape.com/v/{job['file_id']}" if job["file_id"] else False,
+		}
+
+	def _api(self, route: str, query: dict) -> Tuple[int, str, object]:
+		if route == "file/listfolder":
+			folder_id = query.get("folder", ROOT_ID)
+			if folder_id not in self._folders:
+				return 404, "Folder not found", None
+			return 200, "OK", {
+				"folders": [{"id": folder["id"], "name": folder["name"]}
+							for folder in list(self._folders.values()) if folder["parent"] == folder_id],
+				"files"  : [self._file_entry(file_id, file)
+							for file_id, file in list(self._files.items()) if file["folder"] == folder_id],
+			}
+
+		if route == "file/createfolder":
+			parent = query.get("pid", ROOT_ID)
+			if parent not in self._folders:
+				return 404, "Parent folder not found", None
+			return 200, "OK", {"folderid": self.add_folder(query.get("name", ""), parent)}
+
+		if route == "file/renamefolder":
+			folder = self._folders.get(query.get("folder"))
+			if folder is None or folder["id"] == ROOT_ID:
+				return 404, "Folder not found", None
+			folder["name"] = query.get("name", folder["name"])
+			return 200, "OK", True
+
+		if route == "file/deletefolder":
+			folder_id = query.get("folder")
+			if folder_id not in self._folders or folder_id == ROOT_ID:
+				return 404, "Folder not found", None
+			with self._lock:
+				doomed, pending = set(), [folder_id]
+				while pending:
+					current = pending.pop()
+					doomed.add(current)
+					pending.extend(key for key, folder in self._folders.items() if folder["parent"] == current)
+				for key in doomed:
+					del self._folders[key]
+				for key in [key for key, file in self._files.items() if file["folder"] in doomed]:
+					del self._files[key]
+			return 200, "OK", True
+
+		if route in ("file/rename", "file/move", "file/delete", "file/dlticket", "file/getsplash"):
+			file_id = query.get("file")
+			file = self._files.get(file_id)
+			if file is None:
+				return 404, "File not found", None
+
+			if route == "file/rename":
+				file["name"] = query.get("name", file["name"])
+				return 200, "OK", True
+
+			if route == "file/move":
+				if query.get("folder") not in self._folders:
+					return 404, "Folder not found", None
+				file["folder"] = query["folder"]
+				return 200, "OK", True
+
+			if route == "file/delete":
+				with self._lock:
+					self._files.pop(file_id, None)
+				return 200, "OK", True
+
+			if route == "file/getsplash":
+				return 200, "OK", f"{self.url}/splash/{file_id}.jpg"
+
+			ticket = self._id(24)
+			now = time.time()
+			with self._lock:
+				self._tickets[ticket] = (file_id, now + self.wait_time, now + 1800)
+			return 200, "OK", {
+				"ticket"     : ticket,
+				"wait_time"  : self.wait_time,
+				"valid_until": datetime.fromtimestamp(now + 1800).strftime(DATE_FORMAT),
+			}
+
+		if route == "file/dl":
+			file_id, ready_at, valid_until = self._tickets.get(query.get("ticket"), (None, 0.0, 0.0))
+			file = self._files.get(query.get("file"))
+			if file is None or file_id != query.get("file") or time.time() > valid_until:
+				return 403, "Invalid ticket", None
+			if time.time() < ready_at:
+				return 403, "Please wait", None
+			file["downloads"] += 1
+			return 200, "OK", {"name": file["name"], "size": file["size"], "url": f"{self.url}/get/{file_id}/{file['name']}"}
+
+		if route == "file/info":
+			result = {}
+			for file_id in filter(None, query.get("file", "").split(",")):
+				file = self._files.get(file_id)
+				if file is None:
+					result[file_id] = {"id": file_id, "status": 404}
+				else:
+					result[file_id] = {"id": file_id, "name": file["name"], "size": file["size"], "type": "video/mp4",
+									   "converted": self._convert(file)[0] == "converted", "status": 200}
+			return 200, "OK", result
+
+		if route == "file/ul":
+			if query.get("folder", ROOT_ID) not in self._folders:
+				return 404, "Folder not found", None
+			token = self._id(24)
+			with self._lock:
+				self._uploads[token] = (query.get("folder", ROOT_ID), time.time() + 3600)
+			return 200, "OK", {
+				"url"        : f"{self.url}/upload/{token}",
+				"valid_until": datetime.fromtimestamp(time.time() + 3600).strftime(DATE_FORMAT),
+			}
+
+		if route in ("file/runningconverts", "file/failedconverts"):
+			if route == "file/failedconverts":
+				return 200, "OK", []
+			running = []
+			for file_id, file in list(self._files.items()):
+				state, progress = self._convert(file)
+				if state == "converting":
+					running.append({"name": file["name"], "id": file_id, "status": state, "progress": progress})
+			return 200, "OK", running
+
+		if route == "remotedl/add":
+			if not query.get("url"):
+				return 400, "Missing url", None
+			folder = query.get("folder", ROOT_ID)
+			if folder not in self._folders:
+				return 404, "Folder not found", None
+			job_id = self._id()
+			name = query.get("name") or unquote(urlsplit(query["url"]).path.rsplit("/", 1)[-1]) or job_id
+			with self._lock:
+				self._jobs[job_id] = {"url": query["url"], "name": name, "folder": folder, "added": time.time(),
+									  "bytes_total": self.remote_size, "file_id": None}
+			return 200, "OK", {"id": job_id, "folderid": folder}
+
+		if route == "remotedl/remove":
+			job_id = query.get("id")
+			with self._lock:
+				if job_id == "all":
+					self._jobs.clear()
+				elif self._jobs.pop(job_id, None) is None:
+					return 404, "Remote upload not found", None
+			return 200, "OK", True
+
+		if route == "remotedl/status":
+			ids = [job_id for job_id in query.get("id", "").split(",") if job_id] or list(self._jobs)
+			return 200, "OK", {job_id: self._job_entry(job_id, self._jobs[job_id]) for job_id in ids if job_id in self._jobs}
+
+		if route == "account/info":
+			return 200, "OK", {"apiid": self.user, "email": f"{self.user}@example.com", "signup_at": "2020-01-01 00:00:00"}
+
+		return 404, "Unknown endpoint", None
+
+	def _throttle(self, chunks: Iterable[bytes]) -> Iterable[bytes]:
+		started, sent = time.monotonic(), 0
+		for chunk in chunks:
+			yield chunk
+			sent += len(chunk)
+			if self.bandwidth:
+				delay = sent / self.bandwidth - (time.monotonic() - started)
+				if delay > 0:
+					time.sleep(delay)
+
+	def _read_body(self, handler: _Handler) -> bytes:
+		remaining = int(handler.headers.get("Content-Length") or 0)
+
+		def chunks():
+			nonlocal remaining
+			while remaining > 0:
+				chunk = handler.rfile.read(min(remaining, 64 * 1024))
+				if not chunk:
+					return
+				remaining -= len(chunk)
+				yield chunk
+
+		return b"".join(self._throttle(chunks()))
+
+	def _send(self, handler: _Handler, code: int, body: bytes, content_type: str = "application/json",
+			  headers: Optional[dict] = None):
+		handler.send_response(code)
+		handler.send_header("Content-Type", content_type)
+		handler.send_header("Content-Length", str(len(body)))
+		for key, value in (headers or {}).items():
+			handler.send_header(key, value)
+		handler.end_headers()
+
+		for chunk in self._throttle(body[offset:offset + 64 * 1024] for offset in range(0, len(body), 64 * 1024)):
+			handler.wfile.write(chunk)
+
+	def _send_json(self, handler: _Handler, status: int, msg: str, result):
+		body = json.dumps({"status": status, "msg": msg, "result": result}).encode("utf-8")
+		self._send(handler, 200, body)
+
+	def _upload(self, handler: _Handler, token: str):
+		body = self._read_body(handler)
+		with self._lock:
+			folder, valid_until = self._uploads.pop(token, (None, 0.0))
+		if folder is None or time.time() > valid_until:
+			return self._send_json(handler, 403, "Invalid upload URL", None)
+
+		boundary = handler.headers.get("Content-Type", "").partition("boundary=")[2].strip('"')
+		for part in body.split(f"--{boundary}".encode("utf-8")):
+			head, _, data = part.partition(b"\r\n\r\n")
+			if b"filename=" in head:
+				name = head.split(b'filename="', 1)[1].split(b'"', 1)[0].decode("utf-8", "replace")
+				data = data[:-2] if data.endswith(b"\r\n") else data
+				file_id = self.add_file(name, len(data), folder, data)
+				return self._send_json(handler, 200, "OK", {
+					"id"    : file_id,
+					"name"  : name,
+					"size"  : len(data),
+					"sha256": hashlib.sha256(data).hexdigest(),
+					"url"   : f"https://streamtape.com/v/{file_id}/{name}",
+				})
+
+		self._send_json(handler, 400, "No file in the request", None)
+
+	def _download(self, handler: _Handler, file_id: str):
+		file = self._files.get(file_id)
+		if file is None:
+			return self._send(handler, 404, b"Not found", "text/plain")
+
+		data = file["data"] if file["data"] is not None else self.content(file_id, file["size"])
+		range_header = handler.headers.get("Range", "")
+		if range_header.startswith("bytes=") and data:
+			start, _, end = range_header[6:].partition("-")
+			start = int(start or 0)
+			end = min(int(end) if end else len(data) - 1, len(data) - 1)
+			return self._send(handler, 206, data[start:end + 1], "application/octet-stream",
+							  {"Content-Range": f"bytes {start}-{end}/{len(data)}", "Accept-Ranges": "bytes"})
+
+		self._send(handler, 200, data, "application/octet-stream", {"Accept-Ranges": "bytes"})
+
+	def _handle(self, handler: _Handler):
+		parts = urlsplit(handler.path)
+		route = parts.path.strip("/")
+		query = dict(parse_qsl(parts.query, keep_blank_values=True))
+
+		key = route.split("/")[0] if route.startswith(("upload/", "get/", "splash/")) else route
+		with self._lock:
+			self.requests[key] = self.requests.get(key, 0) + 1
+
+		delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+		if delay:
+			time.sleep(delay)
+
+		if route.startswith("upload/") and handler.command == "POST":
+			return self._upload(handler, route[7:])
+		if route.startswith("get/"):
+			return self._download(handler, route.split("/")[1])
+		if route.startswith("splash/"):
+			return self._send(handler, 200, hashlib.sha256(route.encode("utf-8")).digest() * 64, "image/jpeg")
+
+		handler.rfile.read(int(handler.headers.get("Content-Length") or 0))
+
+		with self._lock:
+			if self._burst == 0 and self.error_rate and self._random.random() < self.error_rate:
+				self._burst = self.burst_length
+			bursting = self._burst > 0
+			if bursting:
+				self._burst -= 1
+		if bursting:
+			return self._send_json(handler, 509, "Bandwidth usage exceeded", None)
+
+		if route != "file/dl" and (query.get("login") != self.user or query.get("key") != self.password):
+			return self._send_json(handler, 403, "Wrong login or key", None)
+
+		status, msg, result = self._api(route, query)
+		self._send_json(handler, status, msg, result)
+
+
+if __name__ == "__main__":
+	import argparse
+
+	parser = argparse.ArgumentParser(description="Runs a local StreamTape API emulator.")
+	parser.add_argument("--port", type=int, default=8099)
+	parser.add_argument("--latency", type=float, default=0.0)
+	parser.add_argument("--jitter", type=float, default=0.0)
+	parser.add_argument("--bandwidth", type=float, default=None, help="Bytes per second per connection.")
+	parser.add_argument("--error-rate", type=float, default=0.0)
+	parser.add_argument("--burst-length", type=int, default=5)
+	parser.add_argument("--wait-time", type=int, default=0)
+	args = parser.parse_args()
+
+	emulator = Emulator(port=args.port, latency=args.latency, jitter=args.jitter, bandwidth=args.bandwidth,
+						error_rate=args.error_rate, burst_length=args.burst_length, wait_time=args.wait_time)
+	print(f"StreamTape emulator listening on {emulator.url} (login 'user', key 'password')")
+	with emulator:
+		try:
+			while True:
+				time.sleep(3600)
+		except KeyboardInterrupt:
+			pass
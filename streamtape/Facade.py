@@ -0,0 +1,169 @@
+import threading
+from typing import TYPE_CHECKING, Optional
+
+from streamtape.Transport import Transport
+
+if TYPE_CHECKING:
+	from streamtape.Account import Account
+	from streamtape.BaseConfig import BaseConfig
+	from streamtape.Convertation import Convertation
+	from streamtape.DigestCache import DigestCache
+	from streamtape.FileManager import FileManager
+	from streamtape.Hasher import Hasher
+	from streamtape.Remote import Remote
+	from streamtape.Stream import Stream
+	from streamtape.TicketCache import TicketCache
+	from streamtape.Upload import Upload
+
+
+class Client:
+	url: str = 'https://api.streamtape.com'
+	typed: bool = False
+
+	def __init__(self, user: str, password: str, transport: Optional[Transport] = None,
+				 ticket_cache: Optional["TicketCache"] = None, digest_cache: Optional["DigestCache"] = None,
+				 hasher: Optional["Hasher"] = None, url: Optional[str] = None, typed: bool = False):
+		"""
+		A single entry point holding the credentials, the transport and the caches once. The endpoint classes
+		are created (and their modules imported) on first attribute access and all share this state, so a short
+		lived script only pays for the parts it uses. The transport imports requests when the first request is sent.
+
+		Args:
+		    - user (str): The username for the API authentication.
+		    - password (str): The password for the API authentication.
+		    - transport (Transport, optional): The pooled transport. Defaults to the process-wide shared transport.
+		    - ticket_cache (TicketCache, optional): The download ticket cache of client.stream. Defaults to None.
+		    - digest_cache (DigestCache, optional): The SHA-256 cache of client.upload. Defaults to None.
+		    - hasher (Hasher, optional): The hashing engine of client.upload. Defaults to None.
+		    - url (str, optional): Overrides the API URL of every endpoint class. Defaults to None.
+		    - typed (bool, optional): Return typed records, see BaseConfig.set_typed_responses. Defaults to False.
+
+		Returns:
+		    - None
+
+		Example:
+		    >>> from streamtape import Client
+		    >>> client = Client(API_USER_KEY, API_PASSWORD)
+		    >>> client.files.list_data()
+		    >>> client.upload.upload("video.mp4")
+		"""
+		self.api_user = user
+		self.api_password = password
+		# The client never creates a transport: passed transports belong to the caller and the default one to
+		# the process, so close leaves both open
+		self._owns_transport = False
+		self.transport = transport or Transport.default()
+		self.ticket_cache = ticket_cache
+		self.digest_cache = digest_cache
+		self.hasher = hasher
+		self.url = url or self.url
+		self.typed = typed
+		self._endpoints = {}
+		self._lock = threading.RLock()
+
+	def _configure(self, endpoint: "BaseConfig") -> "BaseConfig":
+		endpoint.set_api_url(self.url)
+		endpoint.set_typed_responses(self.typed)
+		return endpoint
+
+	def _endpoint(self, name: str, create) -> "BaseConfig":
+		endpoint = self._endpoints.get(name)
+		if endpoint is None:
+			with self._lock:
+				endpoint = self._endpoints.get(name)
+				if endpoint is None:
+					endpoint = self._endpoints[name] = self._configure(create())
+
+		return endpoint
+
+	@property
+	def files(self) -> "FileManager":
+		"""
+		Returns:
+		    - FileManager: The folder and file management endpoints.
+		"""
+		def create():
+			from streamtape.FileManager import FileManager
+			return FileManager(self.api_user, self.api_password, self.transport)
+
+		return self._endpoint("files", create)
+
+	@property
+	def upload(self) -> "Upload":
+		"""
+		Returns:
+		    - Upload: The upload endpoints, using the digest cache and hasher of the client.
+		"""
+		def create():
+			from streamtape.Upload import Upload
+			return Upload(self.api_user, self.api_password, self.transport, digest_cache=self.digest_cache,
+						  hasher=self.hasher)
+
+		return self._endpoint("upload", create)
+
+	@property
+	def stream(self) -> "Stream":
+		"""
+		Returns:
+		    - Stream: The download and file information endpoints, using the ticket cache of the client.
+		"""
+		def create():
+			from streamtape.Stream import Stream
+			return Stream(self.api_user, self.api_password, self.transport, ticket_cache=self.ticket_cache)
+
+		return self._endpoint("stream", create)
+
+	@property
+	def remote(self) -> "Remote":
+		"""
+		Returns:
+		    - Remote: The remote upload endpoints. File information lookups go through client.stream.
+		"""
+		def create():
+			from streamtape.Remote import Remote
+			remote = Remote(self.api_user, self.api_password, self.transport)
+			remote._stream = self.stream
+			return remote
+
+		return self._endpoint("remote", create)
+
+	@property
+	def converts(self) -> "Convertation":
+		"""
+		Returns:
+		    - Convertation: The conversion and thumbnail endpoints.
+		"""
+		def create():
+			from streamtape.Convertation import Convertation
+			return Convertation(self.api_user, self.api_password, self.transport)
+
+		return self._endpoint("converts", create)
+
+	@property
+	def account(self) -> "Account":
+		"""
+		Returns:
+		    - Account: The account endpoints.
+		"""
+		def create():
+			from streamtape.Account import Account
+			return Account(self.api_user, self.api_password, self.transport)
+
+		return self._endpoint("account", create)
+
+	def close(self):
+		"""
+		Closes the transport if the client created it. Transports passed in (which may be shared with other
+		clients), the shared default transport, the caches and the hasher stay open, they belong to the caller.
+
+		Returns:
+		    - None
+		"""
+		if self._owns_transport:
+			self.transport.close()
+
+	def __enter__(self) -> "Client":
+		return self
+
+	def __exit__(self, exc_type, exc_val, exc_tb):
+		self.close()
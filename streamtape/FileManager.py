@@ -1,14 +1,19 @@
-from typing import Optional, Union
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from fnmatch import fnmatch
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from streamtape.ApiResponse import ApiResponse
 from streamtape.BaseConfig import BaseConfig
+from streamtape.Models import FolderListing
+from streamtape.RateLimiter import RateLimiter
+from streamtape.Transport import Transport
 
 
 class FileManager(BaseConfig):
 	parameter: str = "file"
 
-	def __init__(self, user: str, password: str):
-		super().__init__(user, password)
+	def __init__(self, user: str, password: str, transport: Optional[Transport] = None):
+		super().__init__(user, password, transport)
 
 	def list_data(self, folder_id: Optional[str] = None) -> Union[dict, list]:
 		"""
@@ -52,13 +57,80 @@ class FileManager(BaseConfig):
 		url = self.url_query(f"{self.parameter}/listfolder", query={
 			"folder": folder_id,
 		})
-		response = BaseConfig.send_request(url)
+		response = self.send_request(url, coalesce=True)
 
 		if response["status"] == 200:
+			if self.typed and isinstance(response["result"], dict):
+				return FolderListing.from_dict(response["result"])
 			return response["result"]
 		else:
 			return ApiResponse.error_response(response["status"], response["msg"])
 
+	def walk(self, folder_id: Optional[str] = None, max_workers: int = 8, max_depth: Optional[int] = None,
+			 include: Optional[Iterable[str]] = None, exclude: Optional[Iterable[str]] = None,
+			 on_error: Optional[Callable[[str, dict, dict], None]] = None) -> Iterator[Tuple[str, dict, list]]:
+		"""
+		Crawls a folder tree breadth-first, listing up to max_workers folders at the same time. Folders are yielded
+		as soon as their listing arrives, while the rest of the tree is still being crawled.
+
+		Args:
+		    - folder_id (Optional[str]): The ID of the folder to start at. Defaults to None (the root folder).
+		    - max_workers (int, optional): The number of parallel listfolder requests. Defaults to 8.
+		    - max_depth (Optional[int], optional): The number of levels below the start folder to crawl,
+		      0 lists the start folder only. Defaults to None (unlimited).
+		    - include (Optional[Iterable[str]], optional): fnmatch patterns of folder names to yield. Non-matching
+		      folders are still crawled into. Defaults to None (all folders).
+		    - exclude (Optional[Iterable[str]], optional): fnmatch patterns of folder names to skip together with
+		      their subfolders. Defaults to None.
+		    - on_error (Optional[callable], optional): Called with (path, folder, error_response) for folders which
+		      could not be listed. Those folders are skipped. Defaults to None.
+
+		Returns:
+		    - Iterator[Tuple[str, dict, list]]: (path, folder, files) tuples, where path is the "/" separated
+		      path of folder names below the start folder and folder is a {"id", "name"} dictionary.
+
+		Example:
+		    >>> for path, folder, files in manager.walk(max_depth=2, exclude=["Trash*"]):
+		    ...     print(path, folder["id"], len(files))
+		    / None 3
+		    /Subfolder B-qlJkdHFeo 12
+		"""
+		include = list(include or [])
+		exclude = list(exclude or [])
+		executor = ThreadPoolExecutor(max_workers=max_workers)
+		pending: Dict[Future, Tuple[str, dict, int]] = {}
+
+		def submit(path: str, folder: dict, depth: int):
+			pending[executor.submit(self.list_data, folder["id"])] = (path, folder, depth)
+
+		try:
+			submit("/", {"id": folder_id, "name": ""}, 0)
+
+			while pending:
+				done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+				for future in done:
+					path, folder, depth = pending.pop(future)
+					result = future.result()
+
+					if result.get("error"):
+						if on_error is not None:
+							on_error(path, folder, result)
+						continue
+
+					if max_depth is None or depth < max_depth:
+						for subfolder in result.get("folders") or []:
+							if any(fnmatch(subfolder.get("name", ""), pattern) for pattern in exclude):
+								continue
+							submit(f"{path.rstrip('/')}/{subfolder.get('name')}", subfolder, depth + 1)
+
+					if depth == 0 or not include or any(fnmatch(folder.get("name", ""), pattern) for pattern in include):
+						yield path, folder, result.get("files") or []
+		finally:
+			for future in pending:
+				future.cancel()
+			executor.shutdown(wait=False)
+
 	def create_folder(self, folder_name: str, parent_folder: Optional[str] = None) -> dict:
 		"""
 		Creates a new folder with the given folder name and parent folder.
@@ -88,7 +160,7 @@ class FileManager(BaseConfig):
 			"name": folder_name,
 			"pid" : parent_folder,
 		})
-		response = BaseConfig.send_request(url)
+		response = self.send_request(url, idempotent=False)
 
 		if response["status"] == 200:
 			return {
@@ -116,7 +188,7 @@ class FileManager(BaseConfig):
 			"name"  : folder_name,
 			"folder": parent_folder,
 		})
-		response = BaseConfig.send_request(url)
+		response = self.send_request(url)
 
 		if response["status"] == 200:
 			return bool(response["result"])
@@ -148,7 +220,7 @@ class FileManager(BaseConfig):
 		url = self.url_query(f"{self.parameter}/deletefolder", query={
 			"folder": folder_id,
 		})
-		response = BaseConfig.send_request(url)
+		response = self.send_request(url)
 
 		if response["status"] == 200:
 			return bool(response["result"])
@@ -160,7 +232,7 @@ class FileManager(BaseConfig):
 		Renames a file with the given name.
 
 		Args:
-		    - file (str): The name of the file to be renamed.
+		    - file (str): The ID of the file to be renamed.
 		    - name (str): The new name for the file.
 
 		Returns:
@@ -179,11 +251,11 @@ class FileManager(BaseConfig):
 				"result": true
 			}
 		"""
-		url = self.url_query(f"{self.parameter}/deletefolder", query={
+		url = self.url_query(f"{self.parameter}/rename", query={
 			"file": file,
 			"name": name
 		})
-		response = BaseConfig.send_request(url)
+		response = self.send_request(url)
 
 		if response["status"] == 200:
 			return bool(response["result"])
@@ -209,7 +281,7 @@ class FileManager(BaseConfig):
 			"file"  : file_id,
 			"folder": folder_id
 		})
-		response = BaseConfig.send_request(url)
+		response = self.send_request(url)
 
 		if response["status"] == 200:
 			return bool(response["result"])
@@ -241,9 +313,106 @@ class FileManager(BaseConfig):
 		url = self.url_query(f"{self.parameter}/delete", query={
 			"file": file_id
 		})
-		response = BaseConfig.send_request(url)
+		response = self.send_request(url)
 
 		if response["status"] == 200:
 			return bool(response["result"])
 		else:
 			return ApiResponse.error_response(response["status"], response["msg"])
+
+	def _bulk(self, operation: Callable[..., Union[dict, bool]], items: List[tuple], max_workers: int,
+			  rate: Optional[float], done_statuses: Tuple[int, ...] = ()) -> List[dict]:
+		limiter = RateLimiter(rate) if rate else None
+
+		def submit(item: tuple) -> Union[dict, bool]:
+			# An exception must become the row of its item instead of losing the rows of every other item
+			try:
+				if limiter is not None:
+					limiter.acquire()
+				return operation(*item)
+			except Exception as e:
+				return ApiResponse.error_response(500, f"{type(e).__name__}: {e}")
+
+		with ThreadPoolExecutor(max_workers=max_workers) as executor:
+			results = list(executor.map(submit, items))
+
+		rows = []
+		for item, result in zip(items, results):
+			failed = isinstance(result, dict) and result.get("error") is True
+			skipped = failed and result["status_id"] in done_statuses
+			rows.append({
+				"id"     : item[0],
+				"ok"     : not failed or skipped,
+				"skipped": skipped,
+				"error"  : result if failed and not skipped else None,
+			})
+
+		return rows
+
+	def move_files(self, mapping: Dict[str, str], max_workers: int = 8, rate: Optional[float] = 5.0) -> List[dict]:
+		"""
+		Moves many files concurrently under a rate limit. Every file is attempted, failures do not stop the
+		others. Moving a file into the folder it already is in succeeds, so the call can simply be repeated
+		after a crash or for the failed rows.
+
+		Args:
+		    - mapping (Dict[str, str]): The target folder IDs keyed by file ID.
+		    - max_workers (int, optional): The number of requests in flight at the same time. Defaults to 8.
+		    - rate (Optional[float], optional): The number of requests started per second, None disables the
+		      limit. Defaults to 5.0.
+
+		Returns:
+		    - List[dict]: One row per file in input order with the keys "id", "folder", "ok", "skipped" and
+		      "error" (None, or the error response of the failed request).
+
+		Example:
+		    >>> rows = f_manager.move_files({"file1": "folder1", "file2": "folder1"}, max_workers=16, rate=10)
+		    >>> retry = {row["id"]: row["folder"] for row in rows if not row["ok"]}
+		"""
+		items = list(mapping.items())
+		rows = self._bulk(self.move_file, items, max_workers, rate)
+
+		return [{**row, "folder": folder_id} for row, (_, folder_id) in zip(rows, items)]
+
+	def rename_files(self, mapping: Dict[str, str], max_workers: int = 8, rate: Optional[float] = 5.0) -> List[dict]:
+		"""
+		Renames many files concurrently under a rate limit. Every file is attempted, failures do not stop the
+		others. Renaming a file to its current name succeeds, so the call can be repeated safely.
+
+		Args:
+		    - mapping (Dict[str, str]): The new names keyed by file ID.
+		    - max_workers (int, optional): The number of requests in flight at the same time. Defaults to 8.
+		    - rate (Optional[float], optional): The number of requests started per second, None disables the
+		      limit. Defaults to 5.0.
+
+		Returns:
+		    - List[dict]: One row per file in input order with the keys "id", "name", "ok", "skipped" and
+		      "error" (None, or the error response of the failed request).
+		"""
+		items = list(mapping.items())
+		rows = self._bulk(self.rename_file, items, max_workers, rate)
+
+		return [{**row, "name": name} for row, (_, name) in zip(rows, items)]
+
+	def delete_files(self, file_ids: Iterable[str], max_workers: int = 8, rate: Optional[float] = 5.0) -> List[dict]:
+		"""
+		Deletes many files concurrently under a rate limit. Every file is attempted, failures do not stop the
+		others. Files which no longer exist (404) count as deleted and are marked as skipped, so a run which
+		crashed halfway can be repeated with the same IDs.
+
+		Args:
+		    - file_ids (Iterable[str]): The IDs of the files to delete.
+		    - max_workers (int, optional): The number of requests in flight at the same time. Defaults to 8.
+		    - rate (Optional[float], optional): The number of requests started per second, None disables the
+		      limit. Defaults to 5.0.
+
+		Returns:
+		    - List[dict]: One row per file in input order with the keys "id", "ok", "skipped" and "error"
+		      (None, or the error response of the failed request).
+
+		Example:
+		    >>> rows = f_manager.delete_files(["file1", "file2", "file3"])
+		    >>> [row["id"] for row in rows if not row["ok"]]
+		    ['file3']
+		"""
+		return self._bulk(self.delete_file, [(file_id,) for file_id in file_ids], max_workers, rate, done_statuses=(404,))
@@ -0,0 +1,148 @@
+import hashlib
+import mmap
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Iterable, Iterator, Optional, Tuple, Union
+
+
+def hash_file(file_path: str, read_size: int = 8 * 1024 * 1024, use_mmap: bool = True, algorithm: str = "sha256") -> str:
+	"""
+	Computes the digest of a file. Defined on module level, so it can be sent to worker processes.
+
+	Args:
+	    - file_path (str): The path of the file to hash.
+	    - read_size (int, optional): The number of bytes hashed at once. Defaults to 8 MiB.
+	    - use_mmap (bool, optional): Hash a memory-mapped view of the file instead of reading it into buffers.
+	      Defaults to True.
+	    - algorithm (str, optional): The hashlib algorithm. Defaults to "sha256".
+
+	Returns:
+	    - str: The hex digest of the file.
+	"""
+	file_hash = hashlib.new(algorithm)
+
+	with open(file_path, "rb") as f:
+		if use_mmap:
+			try:
+				with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+					for offset in range(0, len(view), read_size):
+						file_hash.update(view[offset:offset + read_size])
+
+				return file_hash.hexdigest()
+			except ValueError:
+				# Empty files (and some special files) cannot be memory-mapped
+				pass
+
+		buffer = bytearray(read_size)
+		view = memoryview(buffer)
+		for size in iter(lambda: f.readinto(buffer), 0):
+			file_hash.update(view[:size])
+
+	return file_hash.hexdigest()
+
+
+class Hasher:
+	read_size: int = 8 * 1024 * 1024
+	use_mmap: bool = True
+	processes: Optional[int] = None
+	algorithm: str = "sha256"
+
+	def __init__(self, read_size: int = 8 * 1024 * 1024, use_mmap: bool = True, processes: Optional[int] = None,
+				 algorithm: str = "sha256"):
+		"""
+		A file hashing engine with a tunable read size, memory-mapped reads and an optional process pool.
+
+		hashlib releases the GIL while hashing large buffers, so hashing from several threads already uses several
+		cores. With processes set, every hash runs in a shared process pool instead, which also moves the Python
+		overhead out of the calling process.
+
+		Args:
+		    - read_size (int, optional): The number of bytes hashed at once. Defaults to 8 MiB.
+		    - use_mmap (bool, optional): Hash memory-mapped views instead of reading into buffers. Defaults to True.
+		    - processes (int, optional): The size of the process pool. None hashes in the calling thread. Defaults to None.
+		    - algorithm (str, optional): The hashlib algorithm. Defaults to "sha256".
+
+		Returns:
+		    - None
+
+		Example:
+		    >>> with Hasher(processes=4) as hasher:
+		    ...     for file_path, digest in hasher.hash_many(paths):
+		    ...         print(file_path, digest)
+		"""
+		self.read_size = read_size
+		self.use_mmap = use_mmap
+		self.processes = processes
+		self.algorithm = algorithm
+		self._pool: Optional[ProcessPoolExecutor] = None
+		self._pool_lock = threading.Lock()
+
+	def _get_pool(self) -> ProcessPoolExecutor:
+		if self._pool is None:
+			with self._pool_lock:
+				if self._pool is None:
+					self._pool = ProcessPoolExecutor(max_workers=self.processes)
+
+		return self._pool
+
+	def hash_file(self, file_path: str) -> str:
+		"""
+		Computes the digest of a file, in the process pool if one is configured. Safe to call from many threads.
+
+		Args:
+		    - file_path (str): The path of the file to hash.
+
+		Returns:
+		    - str: The hex digest of the file.
+		"""
+		if self.processes:
+			return self._get_pool().submit(hash_file, file_path, self.read_size, self.use_mmap, self.algorithm).result()
+
+		return hash_file(file_path, self.read_size, self.use_mmap, self.algorithm)
+
+	def hash_many(self, file_paths: Iterable[str], max_workers: Optional[int] = None) -> Iterator[Tuple[str, Union[str, Exception]]]:
+		"""
+		Hashes many files at once and yields the digests in the order they finish.
+
+		Args:
+		    - file_paths (Iterable[str]): The paths of the files to hash.
+		    - max_workers (int, optional): The number of threads used when no process pool is configured.
+		      Defaults to the ThreadPoolExecutor default.
+
+		Returns:
+		    - Iterator[Tuple[str, Union[str, Exception]]]: (file_path, digest) tuples. If a file cannot be hashed,
+		      the exception is yielded in place of the digest.
+		"""
+		executor: Executor = self._get_pool() if self.processes else ThreadPoolExecutor(max_workers=max_workers)
+
+		try:
+			futures = {
+				executor.submit(hash_file, file_path, self.read_size, self.use_mmap, self.algorithm): file_path
+				for file_path in file_paths
+			}
+
+			for future in as_completed(futures):
+				try:
+					yield futures[future], future.result()
+				except Exception as e:
+					yield futures[future], e
+		finally:
+			if executor is not self._pool:
+				executor.shutdown()
+
+	def close(self):
+		"""
+		Shuts the process pool down.
+
+		Returns:
+		    - None
+		"""
+		if self._pool is not None:
+			self._pool.shutdown()
+			self._pool = None
+
+	def __enter__(self) -> "Hasher":
+		return self
+
+	def __exit__(self, exc_type, exc_val, exc_tb):
+		self.close()
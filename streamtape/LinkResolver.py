@@ -0,0 +1,90 @@
+import heapq
+import itertools
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from streamtape.Stream import Stream
+
+
+class LinkResolver:
+	max_workers: int = 8
+
+	def __init__(self, stream: Stream, max_workers: int = 8):
+		"""
+		Resolves many download links at once. Tickets are requested concurrently and each one is held in a
+		timer-based ready queue until its wait_time has passed, then file/dl is called right away. Resolving N links
+		takes roughly one wait period instead of N of them.
+
+		Args:
+		    - stream (Stream): The stream class used for the requests. Its ticket cache is used if one is set.
+		    - max_workers (int, optional): The number of requests in flight at the same time. Defaults to 8.
+
+		Returns:
+		    - None
+
+		Example:
+		    >>> resolver = LinkResolver(Stream(API_USER_KEY, API_PASSWORD), max_workers=16)
+		    >>> for file_id, link in resolver.resolve_many(["id1", "id2", "id3"]):
+		    ...     print(file_id, link["url"])
+		"""
+		self.stream = stream
+		self.max_workers = max_workers
+
+	def resolve_many(self, file_ids: Iterable[str]) -> Iterator[Tuple[str, dict]]:
+		"""
+		Resolves the download links and yields them in the order they become available.
+
+		Args:
+		    - file_ids (Iterable[str]): The IDs of the files.
+
+		Returns:
+		    - Iterator[Tuple[str, dict]]: (file_id, link) tuples. The link is a dictionary as returned by
+		      Stream.download_link or an error response dictionary of the failed dlticket or dl request.
+		"""
+		cache = self.stream.ticket_cache
+		executor = ThreadPoolExecutor(max_workers=self.max_workers)
+		tickets: Dict[Future, str] = {}
+		links: Dict[Future, Tuple[str, dict]] = {}
+		ready: List[Tuple[float, int, str, dict]] = []
+		counter = itertools.count()
+
+		try:
+			for file_id in file_ids:
+				link = cache.get_link(file_id) if cache is not None else None
+				if link is not None:
+					yield file_id, link
+				else:
+					tickets[executor.submit(self.stream.dlticket, file_id)] = file_id
+
+			while tickets or links or ready:
+				now = time.monotonic()
+				while ready and ready[0][0] <= now:
+					_, _, file_id, ticket = heapq.heappop(ready)
+					links[executor.submit(self.stream.resolve_link, file_id, ticket["ticket"])] = (file_id, ticket)
+
+				timeout: Optional[float] = max(0.0, ready[0][0] - now) if ready else None
+				if not tickets and not links:
+					time.sleep(timeout)
+					continue
+
+				done, _ = wait(list(tickets) + list(links), timeout=timeout, return_when=FIRST_COMPLETED)
+
+				for future in done:
+					if future in tickets:
+						file_id = tickets.pop(future)
+						ticket = future.result()
+						if ticket.get("error"):
+							yield file_id, ticket
+						else:
+							heapq.heappush(ready, (time.monotonic() + ticket["wait_time"], next(counter), file_id, ticket))
+					else:
+						file_id, ticket = links.pop(future)
+						link = future.result()
+						if cache is not None and not link.get("error"):
+							cache.put_link(file_id, link, ticket.get("valid_until"))
+						yield file_id, link
+		finally:
+			for future in itertools.chain(tickets, links):
+				future.cancel()
+			executor.shutdown(wait=False)
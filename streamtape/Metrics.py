@@ -0,0 +1,197 @@
+import bisect
+import re
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+BeforeHook = Callable[[dict], None]
+AfterHook = Callable[[dict, Optional[dict], float], None]
+
+_API_PATH = re.compile(r"^[a-z]+/[a-z]+$")
+
+
+def endpoint_of(url: str) -> str:
+	"""
+	Returns the endpoint label of a request URL, e.g. "file/listfolder", taken from the last two path segments.
+	URLs outside the API paths, like the upload targets returned by file/ul, are labelled "external" to keep
+	the number of labels small.
+
+	Args:
+	    - url (str): The request URL.
+
+	Returns:
+	    - str: The endpoint label.
+	"""
+	path = "/".join(urlsplit(url).path.strip("/").split("/")[-2:])
+	return path if _API_PATH.match(path) else "external"
+
+
+class Metrics:
+	buckets: Tuple[float, ...] = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+	def __init__(self, buckets: Optional[Tuple[float, ...]] = None):
+		"""
+		Request counters and latency histograms per endpoint and API status code. Attach it to a transport to
+		record every request attempt (retries included), then export it in the Prometheus text format.
+
+		Network errors without an API response are recorded with the status "error".
+
+		Args:
+		    - buckets (tuple, optional): The upper bounds of the latency buckets in seconds.
+		      Defaults to 0.01 up to 60 seconds.
+
+		Returns:
+		    - None
+
+		Example:
+		    >>> metrics = Metrics()
+		    >>> metrics.instrument(Transport.default())
+		    >>> manager.list_data()
+		    >>> print(metrics.render())
+		    streamtape_requests_total{endpoint="file/listfolder",status="200"} 1
+		    ...
+		"""
+		self.buckets = tuple(sorted(buckets or self.buckets))
+		self._series: Dict[Tuple[str, str], List[Any]] = {}
+		self._lock = threading.Lock()
+
+	def instrument(self, transport) -> "Metrics":
+		"""
+		Records the requests of a Transport or AsyncTransport.
+
+		Args:
+		    - transport (Transport | AsyncTransport): The transport.
+
+		Returns:
+		    - Metrics: The metrics itself.
+		"""
+		transport.add_hook(after=self.after_request)
+		return self
+
+	def after_request(self, request: dict, body: Optional[dict], seconds: float):
+		"""
+		The post-request hook. Records one request attempt.
+
+		Args:
+		    - request (dict): The request context with the keys 'method', 'url', 'endpoint' and 'attempt'.
+		    - body (Optional[dict]): The decoded response, None after a network error.
+		    - seconds (float): The duration of the attempt.
+
+		Returns:
+		    - None
+		"""
+		self.observe(request["endpoint"], body["status"] if body is not None else "error", seconds)
+
+	def observe(self, endpoint: str, status, seconds: float):
+		"""
+		Records one request.
+
+		Args:
+		    - endpoint (str): The endpoint label.
+		    - status (int | str): The API status code.
+		    - seconds (float): The duration of the request.
+
+		Returns:
+		    - None
+		"""
+		key = (endpoint, str(status))
+		index = bisect.bisect_left(self.buckets, seconds)
+
+		with self._lock:
+			series = self._series.get(key)
+			if series is None:
+				series = self._series[key] = [0, 0.0, [0] * (len(self.buckets) + 1)]
+
+			series[0] += 1
+			series[1] += seconds
+			series[2][index] += 1
+
+	def snapshot(self) -> Dict[Tuple[str, str], dict]:
+		"""
+		Returns the recorded values.
+
+		Returns:
+		    - dict: Keyed by (endpoint, status), dictionaries with the keys 'count', 'sum' (seconds) and 'buckets'
+		      (the cumulative counts per upper bound, the last one being +Inf).
+		"""
+		with self._lock:
+			series = {key: (count, total, list(counts)) for key, (count, total, counts) in self._series.items()}
+
+		snapshot = {}
+		for key, (count, total, counts) in sorted(series.items()):
+			cumulative, running = [], 0
+			for bound, value in zip(self.buckets + (float("inf"),), counts):
+				running += value
+				cumulative.append((bound, running))
+			snapshot[key] = {"count": count, "sum": total, "buckets": cumulative}
+
+		return snapshot
+
+	def quantile(self, endpoint: str, status, q: float) -> Optional[float]:
+		"""
+		Estimates a latency quantile from the histogram, like histogram_quantile in PromQL.
+
+		Args:
+		    - endpoint (str): The endpoint label.
+		    - status (int | str): The API status code.
+		    - q (float): The quantile between 0 and 1, e.g. 0.99.
+
+		Returns:
+		    - Optional[float]: The estimated latency in seconds, or None if nothing was recorded.
+		"""
+		series = self.snapshot().get((endpoint, str(status)))
+		if series is None or series["count"] == 0:
+			return None
+
+		rank = q * series["count"]
+		lower_bound, lower_count = 0.0, 0
+		for bound, count in series["buckets"]:
+			if count >= rank:
+				if bound == float("inf"):
+					return lower_bound
+				return lower_bound + (bound - lower_bound) * (rank - lower_count) / max(count - lower_count, 1)
+			lower_bound, lower_count = bound, count
+
+		return lower_bound
+
+	def reset(self):
+		"""
+		Removes all recorded values.
+
+		Returns:
+		    - None
+		"""
+		with self._lock:
+			self._series.clear()
+
+	def render(self, prefix: str = "streamtape") -> str:
+		"""
+		Renders the metrics in the Prometheus text exposition format.
+
+		Args:
+		    - prefix (str, optional): The metric name prefix. Defaults to "streamtape".
+
+		Returns:
+		    - str: The metrics text, e.g. to serve on a /metrics endpoint.
+		"""
+		snapshot = self.snapshot()
+		lines = [
+			f"# HELP {prefix}_requests_total Requests sent to the StreamTape API by endpoint and API status.",
+			f"# TYPE {prefix}_requests_total counter",
+		]
+		for (endpoint, status), series in snapshot.items():
+			lines.append(f'{prefix}_requests_total{{endpoint="{endpoint}",status="{status}"}} {series["count"]}')
+
+		lines += [
+			f"# HELP {prefix}_request_duration_seconds Latency of the StreamTape API requests.",
+			f"# TYPE {prefix}_request_duration_seconds histogram",
+		]
+		for (endpoint, status), series in snapshot.items():
+			labels = f'endpoint="{endpoint}",status="{status}"'
+			for bound, count in series["buckets"]:
+				le = "+Inf" if bound == float("inf") else repr(bound)
+				lines.append(f'{prefix}_request_duration_seconds_bucket{{{labels},le="{le}"}} {count}')
+			lines.append(f'{prefix}_request_duration_seconds_sum{{{labels}}} {series["sum"]}')
+			lines.append(f'{prefix}_request_duration_seconds_count{{{labels}}} {series["count"]}')
+
+		return "\n".join(lines) + "\n"
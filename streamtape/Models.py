@@ -0,0 +1,120 @@
+from typing import Any, Dict, List, Optional
+
+
+class Record:
+	__slots__ = ()
+
+	def __init__(self, **kwargs):
+		"""
+		Base of the compact typed response records. Records use __slots__ instead of a per-instance dictionary,
+		which keeps large listings small in memory. For compatibility with code written against the plain dict
+		responses, fields can also be read with record["name"] and record.get("name").
+
+		Args:
+		    - **kwargs: The field values, missing fields are None.
+
+		Returns:
+		    - None
+		"""
+		for name in self.__slots__:
+			setattr(self, name, kwargs.get(name))
+
+	@classmethod
+	def from_dict(cls, data: dict) -> "Record":
+		"""
+		Builds a record from a decoded API dictionary. Unknown keys are ignored.
+
+		Args:
+		    - data (dict): The dictionary.
+
+		Returns:
+		    - Record: The record.
+		"""
+		record = cls.__new__(cls)
+		for name in cls.__slots__:
+			setattr(record, name, data.get(name))
+
+		return record
+
+	def to_dict(self) -> dict:
+		"""
+		Returns the fields of the record as a dictionary.
+
+		Returns:
+		    - dict: The fields.
+		"""
+		return {name: getattr(self, name) for name in self.__slots__}
+
+	def get(self, key: str, default: Any = None) -> Any:
+		return getattr(self, key) if key in self.__slots__ else default
+
+	def keys(self) -> tuple:
+		return self.__slots__
+
+	def __getitem__(self, key: str) -> Any:
+		if key not in self.__slots__:
+			raise KeyError(key)
+
+		return getattr(self, key)
+
+	def __eq__(self, other) -> bool:
+		return type(self) is type(other) and self.to_dict() == other.to_dict()
+
+	def __repr__(self) -> str:
+		fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+		return f"{type(self).__name__}({fields})"
+
+
+class Folder(Record):
+	__slots__ = ("id", "name")
+
+
+class File(Record):
+	__slots__ = ("name", "size", "link", "created_at", "downloads", "linkid", "convert")
+
+
+class FolderListing(Record):
+	__slots__ = ("folders", "files")
+
+	folders: List[Folder]
+	files: List[File]
+
+	@classmethod
+	def from_dict(cls, data: dict) -> "FolderListing":
+		return cls(
+			folders=[Folder.from_dict(folder) for folder in data.get("folders") or []],
+			files=[File.from_dict(file) for file in data.get("files") or []],
+		)
+
+	def to_dict(self) -> dict:
+		return {
+			"folders": [folder.to_dict() for folder in self.folders],
+			"files"  : [file.to_dict() for file in self.files],
+		}
+
+
+class FileInfo(Record):
+	__slots__ = ("id", "name", "size", "type", "converted", "status")
+
+
+class Ticket(Record):
+	__slots__ = ("ticket", "wait_time", "valid_until")
+
+
+class RemoteJob(Record):
+	__slots__ = ("id", "remoteurl", "status", "bytes_loaded", "bytes_total", "folderid", "added", "last_update",
+				 "extid", "url")
+
+
+def records(result: Optional[Dict[str, dict]], record: type) -> Dict[str, Record]:
+	"""
+	Converts a dictionary of API entries keyed by ID (file/info, remotedl/status) into records.
+
+	Args:
+	    - result (Optional[Dict[str, dict]]): The decoded result.
+	    - record (type): The record class.
+
+	Returns:
+	    - Dict[str, Record]: The records keyed by ID.
+	"""
+	return {key: record.from_dict(value) if isinstance(value, dict) else value for key, value in (result or {}).items()}
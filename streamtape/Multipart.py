@@ -0,0 +1,86 @@
+import os
+import time
+import uuid
+from typing import Callable, Iterator, Optional
+
+ProgressCallback = Callable[[int, int, float], None]
+
+
+class MultipartFile:
+	chunk_size: int = 8 * 1024 * 1024
+
+	def __init__(self, file_path: str, field_name: str = "file1", file_name: Optional[str] = None,
+				 content_type: str = "application/octet-stream", chunk_size: int = 8 * 1024 * 1024,
+				 progress: Optional[ProgressCallback] = None):
+		"""
+		A multipart/form-data body which streams a single file from disk in large chunks instead of building the
+		whole body in memory. The body length is known up front, so it is sent with a Content-Length header.
+
+		Args:
+		    - file_path (str): The path of the file to send.
+		    - field_name (str, optional): The name of the form field. Defaults to "file1".
+		    - file_name (str, optional): The file name sent to the server. Defaults to the base name of file_path.
+		    - content_type (str, optional): The content type of the file part. Defaults to "application/octet-stream".
+		    - chunk_size (int, optional): The number of bytes read and sent at once. Defaults to 8 MiB.
+		    - progress (callable, optional): Called after every chunk with (bytes_sent, total_bytes, bytes_per_second).
+		      Defaults to None.
+
+		Returns:
+		    - None
+
+		Example:
+		    >>> body = MultipartFile("video.mp4", progress=lambda sent, total, bps: print(sent, total, bps))
+		    >>> requests.post(url, data=body, headers=body.headers)
+		"""
+		self.file_path = file_path
+		self.chunk_size = chunk_size
+		self.progress = progress
+		self.boundary = uuid.uuid4().hex
+
+		file_name = (file_name or os.path.basename(file_path)).replace('"', '\\"')
+		self.preamble = (
+			f"--{self.boundary}\r\n"
+			f"Content-Disposition: form-data; name=\"{field_name}\"; filename=\"{file_name}\"\r\n"
+			f"Content-Type: {content_type}\r\n\r\n"
+		).encode("utf-8")
+		self.epilogue = f"\r\n--{self.boundary}--\r\n".encode("utf-8")
+		self.file_size = os.path.getsize(file_path)
+
+	@property
+	def headers(self) -> dict:
+		"""
+		Returns the request headers which have to be sent together with the body.
+
+		Returns:
+		    - dict: The Content-Type and Content-Length headers.
+		"""
+		return {
+			"Content-Type"  : f"multipart/form-data; boundary={self.boundary}",
+			"Content-Length": str(len(self)),
+		}
+
+	def __len__(self) -> int:
+		return len(self.preamble) + self.file_size + len(self.epilogue)
+
+	def __iter__(self) -> Iterator[bytes]:
+		total = len(self)
+		sent = 0
+		started = time.monotonic()
+
+		def report(size: int):
+			nonlocal sent
+			sent += size
+			if self.progress is not None:
+				elapsed = time.monotonic() - started
+				self.progress(sent, total, sent / elapsed if elapsed > 0 else 0.0)
+
+		yield self.preamble
+		report(len(self.preamble))
+
+		with open(self.file_path, "rb") as f:
+			for chunk in iter(lambda: f.read(self.chunk_size), b""):
+				yield chunk
+				report(len(chunk))
+
+		yield self.epilogue
+		report(len(self.epilogue))
@@ -0,0 +1,60 @@
+import threading
+import time
+from typing import Optional
+
+
+class RateLimiter:
+	rate: float = 5.0
+	burst: int = 1
+
+	def __init__(self, rate: float = 5.0, burst: Optional[int] = None):
+		"""
+		A thread-safe token bucket which limits how many calls per second are started.
+
+		Args:
+		    - rate (float, optional): The number of calls allowed per second. Defaults to 5.0.
+		    - burst (Optional[int], optional): The number of calls which may start at once after an idle period.
+		      Defaults to max(1, int(rate)).
+
+		Returns:
+		    - None
+
+		Example:
+		    >>> limiter = RateLimiter(rate=10)
+		    >>> for url in urls:
+		    ...     limiter.acquire()
+		    ...     send(url)
+		"""
+		self.rate = rate
+		self.burst = burst or max(1, int(rate))
+		self._tokens = float(self.burst)
+		self._updated = time.monotonic()
+		self._lock = threading.Lock()
+
+	def acquire(self):
+		"""
+		Blocks until a call may start.
+
+		Returns:
+		    - None
+		"""
+		while True:
+			with self._lock:
+				now = time.monotonic()
+				self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+				self._updated = now
+
+				if self._tokens >= 1:
+					self._tokens -= 1
+					return
+
+				wait = (1 - self._tokens) / self.rate
+
+			time.sleep(wait)
+
+	def __enter__(self) -> "RateLimiter":
+		self.acquire()
+		return self
+
+	def __exit__(self, exc_type, exc_val, exc_tb):
+		pass
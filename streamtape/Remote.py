@@ -1,52 +1,161 @@
-from typing import Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Optional, Union
 
 from streamtape.ApiResponse import ApiResponse
 from streamtape.BaseConfig import BaseConfig
+from streamtape.Models import RemoteJob, records
+from streamtape.RateLimiter import RateLimiter
 from streamtape.Stream import Stream
+from streamtape.Transport import Transport
 
 
 class Remote(BaseConfig):
 	parameter: str = "remotedl"
 
-	def __init__(self, user: str, password: str):
-		super().__init__(user, password)
+	def __init__(self, user: str, password: str, transport: Optional[Transport] = None):
+		super().__init__(user, password, transport)
+		self._stream: Optional[Stream] = None
 
-	def remote_upload(self, file_url: str, folder: Optional[str], headers: Optional[dict], name: Optional[str]) -> dict:
+	@property
+	def stream(self) -> Stream:
 		"""
-		Uploads a file to a remote server.
+		Returns the stream class used for file information lookups, sharing credentials, transport, API URL and
+		typed response mode with this class.
 
-		Args:
-		    - file_url (str): The URL of the file to be uploaded.
-		    - folder (Optional[str]): The folder in which the file should be uploaded. Defaults to None.
-		    - headers (Optional[dict]): Additional headers to be included in the request. Defaults to an empty dictionary.
-		    - name (Optional[str]): The name of the file. Defaults to None.
+		Returns:
+		    - Stream: The stream class.
+		"""
+		if self._stream is None:
+			stream = Stream(self.api_user, self.api_password, self.transport)
+			stream.set_api_url(self.url)
+			stream.set_typed_responses(self.typed)
+			self._stream = stream
+
+		return self._stream
+
+	def set_api_url(self, url: str):
+		"""
+		Sets the API URL for this class and its stream class.
+
+		Parameters:
+		- self: The object itself.
+		- url (str): The URL to be set as the API URL.
 
 		Returns:
-		    - dict: A dictionary containing the ID of the uploaded file, the ID of the folder it belongs to, and the file information.
+		- None
+		"""
+		super().set_api_url(url)
+		if self._stream is not None:
+			self._stream.set_api_url(url)
 
-		Raises:
-		    - ApiResponse: If the response status is not 200, an error response is returned.
+	def set_typed_responses(self, typed: bool = True):
+		"""
+		Switches the typed response mode of this class and its stream class on or off.
+
+		Parameters:
+		- self: The object itself.
+		- typed (bool, optional): Whether to return typed records. Defaults to True.
 
+		Returns:
+		- None
 		"""
+		super().set_typed_responses(typed)
+		if self._stream is not None:
+			self._stream.set_typed_responses(typed)
+
+	def _add(self, file_url: str, folder: Optional[str] = None, headers: Optional[dict] = None, name: Optional[str] = None) -> dict:
 		url = self.url_query(f"{self.parameter}/add", {
 			"url"    : file_url,
 			"folder" : folder or None,
 			"headers": headers or {},
 			"name"   : name or None
 		})
-		response = BaseConfig.send_request(url)
+		response = self.send_request(url, idempotent=False)
 
 		if response["status"] == 200:
-			stream = Stream(self.api_user, self.api_password)
-			file_info = stream.file_info(response["result"].get('id'))
 			return {
-				"id"       : response["result"].get('id'),
-				"folderid" : response["result"].get('folderid'),
-				"file_info": file_info
+				"id"      : response["result"].get('id'),
+				"folderid": response["result"].get('folderid'),
 			}
 		else:
 			return ApiResponse.error_response(response["status"], response["msg"])
 
+	def remote_upload(self, file_url: str, folder: Optional[str] = None, headers: Optional[dict] = None, name: Optional[str] = None) -> dict:
+		"""
+		Uploads a file to a remote server.
+
+		Args:
+		    - file_url (str): The URL of the file to be uploaded.
+		    - folder (Optional[str], optional): The folder in which the file should be uploaded. Defaults to None.
+		    - headers (Optional[dict], optional): Additional headers to be included in the request. Defaults to an empty dictionary.
+		    - name (Optional[str], optional): The name of the file. Defaults to None.
+
+		Returns:
+		    - dict: A dictionary containing the ID of the uploaded file, the ID of the folder it belongs to, and the file information.
+
+		Raises:
+		    - ApiResponse: If the response status is not 200, an error response is returned.
+
+		"""
+		added = self._add(file_url, folder, headers, name)
+
+		if added.get("error"):
+			return added
+
+		return {
+			**added,
+			"file_info": self.stream.file_info([added["id"]])
+		}
+
+	def remote_upload_many(self, files: Iterable[Union[str, dict]], folder: Optional[str] = None, max_workers: int = 8,
+						   rate: Optional[float] = 5.0, with_file_info: bool = True) -> List[dict]:
+		"""
+		Submits many remote uploads concurrently under a rate limit. The file information of all submitted
+		uploads is looked up afterwards with one batched file_info call instead of one call per URL.
+
+		Args:
+		    - files (Iterable[Union[str, dict]]): The URLs to upload, or dictionaries with the keys "url" and
+		      optionally "folder", "headers" and "name".
+		    - folder (Optional[str], optional): The default folder for entries without their own. Defaults to None.
+		    - max_workers (int, optional): The number of submissions in flight at the same time. Defaults to 8.
+		    - rate (Optional[float], optional): The number of submissions started per second, None disables
+		      the limit. Defaults to 5.0.
+		    - with_file_info (bool, optional): Look up the file information of the submitted uploads. Defaults to True.
+
+		Returns:
+		    - List[dict]: One row per entry in input order with the keys "url", "id", "folderid", "file_info"
+		      and "error" (None, or the error response of the failed submission).
+
+		Example:
+		    >>> remote.remote_upload_many(["https://example.com/a.mp4", {"url": "https://example.com/b.mp4", "name": "b"}])
+		    [
+				{"url": "https://example.com/a.mp4", "id": "LnvnE51P5gc", "folderid": "B-qlJkdHFeo", "file_info": {...}, "error": None},
+				...
+			]
+		"""
+		entries = [entry if isinstance(entry, dict) else {"url": entry} for entry in files]
+		limiter = RateLimiter(rate) if rate else None
+
+		def submit(entry: dict) -> dict:
+			if limiter is not None:
+				limiter.acquire()
+			return self._add(entry["url"], entry.get("folder", folder), entry.get("headers"), entry.get("name"))
+
+		with ThreadPoolExecutor(max_workers=max_workers) as executor:
+			results = list(executor.map(submit, entries))
+
+		ids = [result["id"] for result in results if not result.get("error")]
+		file_info = self.stream.file_info(ids) if with_file_info and ids else {}
+		info_failed = file_info.get("error") is True
+
+		return [{
+			"url"      : entry["url"],
+			"id"       : result.get("id"),
+			"folderid" : result.get("folderid"),
+			"file_info": None if result.get("error") or info_failed else file_info.get(result["id"]),
+			"error"    : result if result.get("error") else None,
+		} for entry, result in zip(entries, results)]
+
 	def remove(self, file_id: str) -> Union[bool, dict]:
 		"""
 		Removes a file with the given file_id from the server.
@@ -72,20 +181,21 @@ class Remote(BaseConfig):
 		url = self.url_query(f"{self.parameter}/remove", {
 			"id": file_id,
 		})
-		response = BaseConfig.send_request(url)
+		response = self.send_request(url)
 
 		if response["status"] == 200:
 			return bool(response["result"])
 		else:
 			return ApiResponse.error_response(response["status"], response["msg"])
 
-	def check_remote_status(self, file_id: str) -> Union[dict, list]:
+	def check_remote_status(self, file_id: Union[str, list]) -> Union[dict, list]:
 		"""
 		Retrieves the status of a remote file with the given file ID.
 
 		Args:
 		    - self (object): The instance of the class.
-		    - file_id (str): The ID of the file to check the status for.
+		    - file_id (Union[str, list]): The ID of the file to check the status for, or a list of IDs
+		      to check in one request.
 
 		Returns:
 		    - Union[dict, list]: The status of the remote file. It can be either a dictionary or a list.
@@ -115,11 +225,13 @@ class Remote(BaseConfig):
 			}
 		"""
 		url = self.url_query(f"{self.parameter}/status", {
-			"id": file_id,
+			"id": file_id if isinstance(file_id, str) else ','.join(file_id),
 		})
-		response = BaseConfig.send_request(url)
+		response = self.send_request(url, coalesce=True)
 
 		if response["status"] == 200:
+			if self.typed and isinstance(response["result"], dict):
+				return records(response["result"], RemoteJob)
 			return response["result"]
 		else:
 			return ApiResponse.error_response(response["status"], response["msg"])
@@ -0,0 +1,222 @@
+import threading
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from streamtape.ApiResponse import ApiResponse
+from streamtape.Remote import Remote
+
+EventCallback = Callable[[dict], None]
+
+
+class TrackedJob:
+	__slots__ = ("id", "next_poll", "interval", "bytes_loaded", "polled_at", "status", "misses")
+
+	def __init__(self, job_id: str, interval: float):
+		self.id = job_id
+		self.next_poll = 0.0
+		self.interval = interval
+		self.bytes_loaded: Optional[int] = None
+		self.polled_at: Optional[float] = None
+		self.status: Optional[str] = None
+		self.misses = 0
+
+
+class RemotePoller:
+	batch_size: int = 50
+	min_interval: float = 2.0
+	max_interval: float = 60.0
+	max_misses: int = 3
+	finished_states: tuple = ("finished",)
+	failed_states: tuple = ("error", "failed", "deleted")
+
+	def __init__(self, remote: Remote, job_ids: Optional[Iterable[str]] = None, batch_size: int = 50,
+				 min_interval: float = 2.0, max_interval: float = 60.0, on_event: Optional[EventCallback] = None,
+				 max_misses: int = 3):
+		"""
+		Tracks many remote upload jobs. Due jobs are queried in batches of batch_size IDs per remotedl/status
+		request. Every job is polled on its own adaptive interval: jobs which make progress are polled again after
+		about half of their estimated remaining time, jobs without progress back off exponentially up to
+		max_interval. Finished and failed jobs are no longer polled. Jobs which are missing from the status result
+		(removed jobs, unknown IDs) back off as well and are dropped after max_misses polls in a row.
+
+		Events are dictionaries with the keys 'type' ('progress', 'finished', 'failed' or 'missing'), 'id' and
+		'status' (the status dictionary returned by the API, empty for missing jobs).
+
+		Args:
+		    - remote (Remote): The remote class used for the status requests.
+		    - job_ids (Optional[Iterable[str]], optional): The IDs of the jobs to track. Defaults to None.
+		    - batch_size (int, optional): The number of IDs per status request, 1 disables batching. Defaults to 50.
+		    - min_interval (float, optional): The shortest time between two polls of a job in seconds. Defaults to 2.0.
+		    - max_interval (float, optional): The longest time between two polls of a job in seconds. Defaults to 60.0.
+		    - on_event (Optional[callable], optional): Called with every event. Defaults to None.
+		    - max_misses (int, optional): The number of polls in a row a job may be missing from the status result
+		      before it is dropped with a 'missing' event. Defaults to 3.
+
+		Returns:
+		    - None
+
+		Example:
+		    >>> poller = RemotePoller(remote, [job["id"] for job in submitted_jobs])
+		    >>> for event in poller.events():
+		    ...     print(event["type"], event["id"], event["status"].get("bytes_loaded"))
+		"""
+		self.remote = remote
+		self.batch_size = batch_size
+		self.min_interval = min_interval
+		self.max_interval = max_interval
+		self.on_event = on_event
+		self.max_misses = max_misses
+		self.errors: List[dict] = []
+		self._jobs: Dict[str, TrackedJob] = {}
+		self._lock = threading.Lock()
+
+		for job_id in job_ids or []:
+			self.add(job_id)
+
+	def add(self, job_id: str):
+		"""
+		Starts tracking a remote upload job. It is polled with the next batch.
+
+		Args:
+		    - job_id (str): The ID returned by Remote.remote_upload.
+
+		Returns:
+		    - None
+		"""
+		with self._lock:
+			self._jobs.setdefault(job_id, TrackedJob(job_id, self.min_interval))
+
+	def remove(self, job_id: str):
+		"""
+		Stops tracking a remote upload job.
+
+		Args:
+		    - job_id (str): The ID of the job.
+
+		Returns:
+		    - None
+		"""
+		with self._lock:
+			self._jobs.pop(job_id, None)
+
+	def __len__(self) -> int:
+		return len(self._jobs)
+
+	@staticmethod
+	def _bytes(value) -> Optional[int]:
+		try:
+			return int(value)
+		except (TypeError, ValueError):
+			return None
+
+	def _schedule(self, job: TrackedJob, status: dict, now: float):
+		bytes_loaded = RemotePoller._bytes(status.get("bytes_loaded"))
+		bytes_total = RemotePoller._bytes(status.get("bytes_total"))
+
+		if bytes_loaded is not None and job.bytes_loaded is not None and bytes_loaded > job.bytes_loaded:
+			rate = (bytes_loaded - job.bytes_loaded) / max(now - job.polled_at, 1e-3)
+			remaining = (bytes_total - bytes_loaded) / rate if bytes_total else job.interval
+			job.interval = remaining / 2
+		else:
+			job.interval *= 2
+
+		job.interval = min(self.max_interval, max(self.min_interval, job.interval))
+		job.bytes_loaded = bytes_loaded
+		job.polled_at = now
+		job.next_poll = now + job.interval
+
+	def _emit(self, events: List[dict], event: dict):
+		events.append(event)
+		if self.on_event is not None:
+			self.on_event(event)
+
+	def poll(self) -> List[dict]:
+		"""
+		Polls all jobs which are due and returns the resulting events. Jobs which become due within the next
+		min_interval seconds ride along in the same batches, so the status requests stay batched even when the
+		schedules of the jobs drift apart.
+
+		Returns:
+		    - List[dict]: The events of this round. Failed status requests and dropped missing jobs are added to
+		      the errors attribute, jobs of failed requests are retried after a back-off.
+		"""
+		now = time.monotonic()
+		with self._lock:
+			if not any(job.next_poll <= now for job in self._jobs.values()):
+				return []
+			due = [job for job in self._jobs.values() if job.next_poll <= now + self.min_interval]
+
+		events: List[dict] = []
+		for offset in range(0, len(due), self.batch_size):
+			batch = due[offset:offset + self.batch_size]
+			result = self.remote.check_remote_status([job.id for job in batch])
+			now = time.monotonic()
+
+			if result.get("error") is True:
+				self.errors.append({**result, "ids": [job.id for job in batch]})
+				for job in batch:
+					job.interval = min(self.max_interval, job.interval * 2)
+					job.next_poll = now + job.interval
+				continue
+
+			for job in batch:
+				status = result.get(job.id)
+				if status is None:
+					job.misses += 1
+					if job.misses >= self.max_misses:
+						self.remove(job.id)
+						self.errors.append({
+							**ApiResponse.error_response(404, "Job is missing from the remote upload status"),
+							"ids": [job.id],
+						})
+						self._emit(events, {"type": "missing", "id": job.id, "status": {}})
+					else:
+						job.interval = min(self.max_interval, job.interval * 2)
+						job.next_poll = now + job.interval
+					continue
+
+				job.misses = 0
+
+				state = status.get("status")
+				if state in self.finished_states or state in self.failed_states:
+					self.remove(job.id)
+					self._emit(events, {
+						"type"  : "finished" if state in self.finished_states else "failed",
+						"id"    : job.id,
+						"status": status,
+					})
+					continue
+
+				if RemotePoller._bytes(status.get("bytes_loaded")) != job.bytes_loaded or state != job.status:
+					self._emit(events, {"type": "progress", "id": job.id, "status": status})
+
+				job.status = state
+				self._schedule(job, status, now)
+
+		return events
+
+	def events(self, timeout: Optional[float] = None) -> Iterator[dict]:
+		"""
+		Polls until every job finished or failed and yields the events as they happen.
+
+		Args:
+		    - timeout (Optional[float], optional): Stop after this many seconds even if jobs are still running.
+		      Defaults to None.
+
+		Returns:
+		    - Iterator[dict]: The events.
+		"""
+		deadline = time.monotonic() + timeout if timeout is not None else None
+
+		while self._jobs:
+			yield from self.poll()
+
+			with self._lock:
+				if not self._jobs:
+					break
+				next_poll = min(job.next_poll for job in self._jobs.values())
+
+			now = time.monotonic()
+			if deadline is not None and next_poll > deadline:
+				break
+			time.sleep(max(0.0, next_poll - now))
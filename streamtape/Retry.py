@@ -0,0 +1,153 @@
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+
+class RetryPolicy:
+	max_retries: int = 3
+	backoff_base: float = 0.5
+	backoff_max: float = 30.0
+	retry_statuses: tuple = (429, 500, 502, 503, 504, 509)
+
+	def __init__(self, max_retries: int = 3, backoff_base: float = 0.5, backoff_max: float = 30.0,
+				 retry_statuses: tuple = (429, 500, 502, 503, 504, 509)):
+		"""
+		Describes when and how long to wait before an idempotent request is sent again.
+
+		Args:
+		    - max_retries (int, optional): The number of retries after the first attempt. Defaults to 3.
+		    - backoff_base (float, optional): The base of the exponential back-off in seconds. Defaults to 0.5.
+		    - backoff_max (float, optional): The longest back-off in seconds. Defaults to 30.0.
+		    - retry_statuses (tuple, optional): The HTTP or API status codes which are retried.
+		      Defaults to (429, 500, 502, 503, 504, 509).
+
+		Returns:
+		    - None
+		"""
+		self.max_retries = max_retries
+		self.backoff_base = backoff_base
+		self.backoff_max = backoff_max
+		self.retry_statuses = retry_statuses
+
+	def should_retry(self, status: Optional[int], attempt: int) -> bool:
+		"""
+		Returns whether a request which failed with the given status should be sent again.
+
+		Args:
+		    - status (Optional[int]): The status code, None for network errors and timeouts.
+		    - attempt (int): The number of the attempt which failed, starting at 0.
+
+		Returns:
+		    - bool: True if the request should be retried.
+		"""
+		return attempt < self.max_retries and (status is None or status in self.retry_statuses)
+
+	def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+		"""
+		Returns the number of seconds to wait before the next attempt: exponential back-off with full jitter,
+		but never less than the Retry-After of the server.
+
+		Args:
+		    - attempt (int): The number of the attempt which failed, starting at 0.
+		    - retry_after (Optional[float], optional): The Retry-After of the server in seconds. Defaults to None.
+
+		Returns:
+		    - float: The delay in seconds.
+		"""
+		delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+		if retry_after is not None:
+			delay = max(delay, min(retry_after, self.backoff_max))
+
+		return delay
+
+	@staticmethod
+	def parse_retry_after(value: Optional[str]) -> Optional[float]:
+		"""
+		Parses a Retry-After header given in seconds or as a HTTP date.
+
+		Args:
+		    - value (Optional[str]): The header value.
+
+		Returns:
+		    - Optional[float]: The number of seconds to wait, or None if the header is missing or invalid.
+		"""
+		if not value:
+			return None
+		if value.strip().isdigit():
+			return float(value)
+
+		try:
+			return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+		except (TypeError, ValueError):
+			return None
+
+
+class AimdLimiter:
+	min_limit: int = 1
+	max_limit: int = 64
+	decrease_factor: float = 0.5
+	cooldown: float = 1.0
+
+	def __init__(self, initial_limit: int = 16, min_limit: int = 1, max_limit: int = 64, decrease_factor: float = 0.5,
+				 cooldown: float = 1.0):
+		"""
+		An additive-increase/multiplicative-decrease limit of the requests in flight. Every success raises the
+		limit by about one per window of requests, a congestion signal (509 or 5xx) multiplies it by
+		decrease_factor, at most once per cooldown so a burst of failures of the same window is counted once.
+		Bulk jobs slow down gracefully during peak hours instead of failing.
+
+		Args:
+		    - initial_limit (int, optional): The limit to start with. Defaults to 16.
+		    - min_limit (int, optional): The lowest limit. Defaults to 1.
+		    - max_limit (int, optional): The highest limit. Defaults to 64.
+		    - decrease_factor (float, optional): The factor applied on congestion. Defaults to 0.5.
+		    - cooldown (float, optional): The shortest time between two decreases in seconds. Defaults to 1.0.
+
+		Returns:
+		    - None
+		"""
+		self.min_limit = min_limit
+		self.max_limit = max_limit
+		self.decrease_factor = decrease_factor
+		self.cooldown = cooldown
+		self.limit = float(initial_limit)
+		self.in_flight = 0
+		self._decreased_at = 0.0
+		self._condition = threading.Condition()
+
+	def acquire(self):
+		"""
+		Blocks until a request may be sent.
+
+		Returns:
+		    - None
+		"""
+		with self._condition:
+			while self.in_flight >= int(self.limit):
+				self._condition.wait()
+			self.in_flight += 1
+
+	def release(self, congested: Optional[bool] = False):
+		"""
+		Marks a request as finished and adapts the limit.
+
+		Args:
+		    - congested (Optional[bool], optional): True for congestion signals, False for successes and None
+		      for outcomes which should not change the limit. Defaults to False.
+
+		Returns:
+		    - None
+		"""
+		with self._condition:
+			self.in_flight -= 1
+			if congested:
+				now = time.monotonic()
+				if now - self._decreased_at >= self.cooldown:
+					self.limit = max(float(self.min_limit), self.limit * self.decrease_factor)
+					self._decreased_at = now
+			elif congested is False:
+				self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+			self._condition.notify_all()
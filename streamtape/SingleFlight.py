@@ -0,0 +1,152 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+
+def request_key(url: str, parameters: Optional[dict] = None, headers: Optional[dict] = None) -> Tuple:
+	"""
+	Returns the key under which identical GET requests are merged.
+
+	Args:
+	    - url (str): The URL of the request.
+	    - parameters (dict, optional): The query parameters. Defaults to None.
+	    - headers (dict, optional): The request headers. Defaults to None.
+
+	Returns:
+	    - tuple: The key, independent of the order of parameters and headers.
+	"""
+	return (
+		url,
+		tuple(sorted((key, str(value)) for key, value in (parameters or {}).items())),
+		tuple(sorted((key, str(value)) for key, value in (headers or {}).items())),
+	)
+
+
+class _Call:
+	__slots__ = ("done", "result", "error", "keys")
+
+	def __init__(self):
+		self.done = threading.Event()
+		self.result: Any = None
+		self.error: Optional[BaseException] = None
+		self.keys: Dict[str, None] = {}
+
+
+class SingleFlight:
+	def __init__(self):
+		"""
+		Merges identical concurrent calls: while a call for a key is running, further calls for the same key
+		wait for it and share its result instead of running again. Results are not cached beyond that.
+
+		Returns:
+		    - None
+
+		Example:
+		    >>> flight = SingleFlight()
+		    >>> flight.do(("GET", url), lambda: session.get(url).json())
+		"""
+		self.shared = 0
+		self._calls: Dict[Hashable, _Call] = {}
+		self._lock = threading.Lock()
+
+	def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+		"""
+		Runs func, or waits for the running call with the same key and returns its result.
+
+		Args:
+		    - key (Hashable): The key of identical calls.
+		    - func (callable): The call.
+
+		Returns:
+		    - Any: The result of func. If func raised, every waiter raises the same exception.
+		"""
+		with self._lock:
+			call = self._calls.get(key)
+			leader = call is None
+			if leader:
+				call = self._calls[key] = _Call()
+			else:
+				self.shared += 1
+
+		if leader:
+			try:
+				call.result = func()
+			except BaseException as e:
+				call.error = e
+			finally:
+				with self._lock:
+					del self._calls[key]
+				call.done.set()
+		else:
+			call.done.wait()
+
+		if call.error is not None:
+			raise call.error
+
+		return call.result
+
+	def __len__(self) -> int:
+		return len(self._calls)
+
+
+class KeyBatcher:
+	def __init__(self, fetch: Callable[[List[str]], Any], window: float = 0.005, max_batch_size: int = 1000):
+		"""
+		Merges the key sets of calls arriving within a short window into one fetch. The first caller waits for
+		window seconds, collects every key requested meanwhile (overlapping keys only once) and runs fetch for
+		all of them. Every caller gets the same result of that fetch.
+
+		Args:
+		    - fetch (callable): Called with the merged list of keys.
+		    - window (float, optional): The time in seconds calls are collected. Defaults to 0.005.
+		    - max_batch_size (int, optional): The number of keys after which a new batch is started. Defaults to 1000.
+
+		Returns:
+		    - None
+		"""
+		self.fetch = fetch
+		self.window = window
+		self.max_batch_size = max_batch_size
+		self.batches = 0
+		self._pending: Optional[_Call] = None
+		self._lock = threading.Lock()
+
+	def get(self, keys: Iterable[str]) -> Any:
+		"""
+		Adds the keys to the current batch and returns the result of its fetch.
+
+		Args:
+		    - keys (Iterable[str]): The keys.
+
+		Returns:
+		    - Any: The result of fetch for the merged keys. If fetch raised, every caller raises the same exception.
+		"""
+		keys = list(keys)
+
+		with self._lock:
+			call = self._pending
+			leader = call is None or len(call.keys) + len(keys) > self.max_batch_size
+			if leader:
+				call = self._pending = _Call()
+			call.keys.update(dict.fromkeys(keys))
+
+		if leader:
+			time.sleep(self.window)
+			with self._lock:
+				if self._pending is call:
+					self._pending = None
+				self.batches += 1
+
+			try:
+				call.result = self.fetch(list(call.keys))
+			except BaseException as e:
+				call.error = e
+			finally:
+				call.done.set()
+		else:
+			call.done.wait()
+
+		if call.error is not None:
+			raise call.error
+
+		return call.result
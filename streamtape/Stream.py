@@ -1,16 +1,49 @@
-from streamtape.ApiResponse import ApiResponse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Union
+
+from streamtape.ApiResponse import ApiResponse, BatchResult
 from streamtape.BaseConfig import BaseConfig
+from streamtape.Models import FileInfo, Ticket, records
+from streamtape.SingleFlight import KeyBatcher
+from streamtape.TicketCache import TicketCache
+from streamtape.Transport import Transport
 
 
 class Stream(BaseConfig):
 	parameter: str = "file"
+	max_batch_size: int = 100
+	max_workers: int = 4
+	ticket_cache: Optional[TicketCache] = None
+	file_info_window: Optional[float] = None
+
+	def __init__(self, user: str, password: str, transport: Optional[Transport] = None,
+				 ticket_cache: Optional[TicketCache] = None, file_info_window: Optional[float] = None):
+		"""
+		Initializes the stream class.
 
-	def __init__(self, user: str, password: str):
-		super().__init__(user, password)
+		Args:
+		    - user (str): The username for the API authentication.
+		    - password (str): The password for the API authentication.
+		    - transport (Transport, optional): The pooled transport to send requests with. Defaults to the shared transport.
+		    - ticket_cache (TicketCache, optional): Cache of download tickets and links, which are reused until their
+		      valid_until. Share one cache between threads and instances. Defaults to None.
+		    - file_info_window (float, optional): Time in seconds in which the ID lists of concurrent file_info calls
+		      are merged into one batched request, e.g. 0.005. Defaults to None (no merging).
+
+		Returns:
+		    - None
+		"""
+		super().__init__(user, password, transport)
+		self.ticket_cache = ticket_cache
+		self.file_info_window = file_info_window
+		self._batcher = KeyBatcher(self._file_info, file_info_window, self.max_batch_size * self.max_workers) \
+			if file_info_window else None
 
 	def dlticket(self, file_id: str) -> dict:
 		"""
-		Retrieves a download ticket for a given file ID.
+		Retrieves a download ticket for a given file ID. A still valid ticket is served from the ticket cache,
+		with its wait_time reduced by the time passed since it was issued.
 
 		Args:
 		    - file_id (str): The ID of the file for which to retrieve the download ticket.
@@ -23,40 +56,48 @@ class Stream(BaseConfig):
 		    - ApiResponseError: If the API response status is not 200, indicating an error occurred.
 
 		"""
+		if self.ticket_cache is not None:
+			ticket = self.ticket_cache.get_ticket(file_id)
+			if ticket is not None:
+				return Ticket.from_dict(ticket) if self.typed else ticket
+
 		url = self.url_query(f"{self.parameter}/dlticket", {
 			"file": file_id
 		})
-		response = BaseConfig.send_request(url)
+		response = self.send_request(url)
 
 		if response["status"] == 200:
-			return {
+			ticket = {
 				"ticket"     : response["result"].get('ticket'),
 				"wait_time"  : int(response["result"].get('wait_time')),
 				"valid_until": BaseConfig.str_to_datetime(response["result"].get('valid_until')),
 			}
+			if self.ticket_cache is not None:
+				self.ticket_cache.put_ticket(file_id, ticket)
+
+			return Ticket.from_dict(ticket) if self.typed else ticket
 		else:
 			return ApiResponse.error_response(response["status"], response["msg"])
 
-	def download_link(self, file_id: str) -> dict:
+	def resolve_link(self, file_id: str, ticket: str) -> dict:
 		"""
-		Downloads a file from the server using the provided file ID.
+		Resolves the download link of a file with a ticket whose wait_time has passed.
 
 		Args:
 		    - file_id (str): The ID of the file to be downloaded.
+		    - ticket (str): The ticket returned by dlticket.
 
 		Returns:
 		    - dict: A dictionary containing the name, size, and URL of the downloaded file.
 
 		Raises:
 		    - ApiResponseError: If the server returns an error response.
-
 		"""
-		dl_ticket = self.dlticket(file_id)
 		url = self.url_query(f"{self.parameter}/dl", {
 			"file"  : file_id,
-			"ticket": dl_ticket
+			"ticket": ticket
 		}, use_login=False)
-		response = BaseConfig.send_request(url)
+		response = self.send_request(url)
 
 		if response["status"] == 200:
 			return {
@@ -67,25 +108,104 @@ class Stream(BaseConfig):
 		else:
 			return ApiResponse.error_response(response["status"], response["msg"])
 
-	def file_info(self, file_id: list) -> dict:
+	def download_link(self, file_id: str) -> dict:
 		"""
-		Retrieves information about the specified files.
+		Downloads a file from the server using the provided file ID. Waits for the wait_time of the download
+		ticket before the link is resolved. A still valid link is served from the ticket cache without any request.
+		Use LinkResolver to resolve many links with overlapping wait times.
 
 		Args:
-		    - file_id (list): A list of file IDs for which information needs to be retrieved.
+		    - file_id (str): The ID of the file to be downloaded.
 
 		Returns:
-		    - dict: A dictionary containing the information about the files.
+		    - dict: A dictionary containing the name, size, and URL of the downloaded file.
 
 		Raises:
-		    - ApiResponseError: If the API response status is not 200.
+		    - ApiResponseError: If the server returns an error response.
+
 		"""
+		if self.ticket_cache is not None:
+			link = self.ticket_cache.get_link(file_id)
+			if link is not None:
+				return link
+
+		dl_ticket = self.dlticket(file_id)
+		if dl_ticket.get("error"):
+			return dl_ticket
+
+		time.sleep(dl_ticket["wait_time"])
+		link = self.resolve_link(file_id, dl_ticket["ticket"])
+
+		if self.ticket_cache is not None and not link.get("error"):
+			self.ticket_cache.put_link(file_id, link, dl_ticket.get("valid_until"))
+
+		return link
+
+	def _file_info_batch(self, file_ids: List[str]) -> dict:
 		url = self.url_query(f"{self.parameter}/info", {
-			"file": ','.join(file_id),
+			"file": ','.join(file_ids),
 		})
-		response = BaseConfig.send_request(url)
+		response = self.send_request(url, coalesce=True)
 
 		if response["status"] == 200:
 			return response["result"]
 		else:
-			return ApiResponse.error_response(response["status"], response["msg"])
+			return {**ApiResponse.error_response(response["status"], response["msg"]), "file_ids": file_ids}
+
+	def file_info(self, file_id: Union[str, list], max_batch_size: Optional[int] = None, max_workers: Optional[int] = None) -> dict:
+		"""
+		Retrieves information about the specified files.
+
+		Long ID lists are split into batches of max_batch_size IDs, which are requested concurrently and merged
+		into one dictionary. If only some batches fail, the merged partial result is returned and the failed
+		batches are listed in its errors attribute. With a file_info_window, calls from several threads within the
+		window are merged into one request and each caller gets the files it asked for.
+
+		Args:
+		    - file_id (Union[str, list]): A file ID or a list of file IDs for which information needs to be retrieved.
+		    - max_batch_size (Optional[int], optional): The number of IDs per request. Defaults to 100.
+		    - max_workers (Optional[int], optional): The number of batches requested at the same time. Defaults to 4.
+
+		Returns:
+		    - dict: A BatchResult dictionary containing the information about the files keyed by file ID.
+		      If every batch failed, the error response of the first batch.
+
+		Raises:
+		    - ApiResponseError: If the API response status is not 200.
+		"""
+		file_ids = [file_id] if isinstance(file_id, str) else list(file_id)
+
+		if self._batcher is None or max_batch_size is not None or max_workers is not None:
+			return self._file_info(file_ids, max_batch_size, max_workers)
+
+		merged = self._batcher.get(file_ids)
+		if not isinstance(merged, BatchResult):
+			return merged
+
+		wanted = set(file_ids)
+		return BatchResult(
+			{key: value for key, value in merged.items() if key in wanted},
+			errors=[error for error in merged.errors if wanted.intersection(error["file_ids"])],
+		)
+
+	def _file_info(self, file_ids: List[str], max_batch_size: Optional[int] = None, max_workers: Optional[int] = None) -> dict:
+		max_batch_size = max_batch_size or self.max_batch_size
+		batches = [file_ids[i:i + max_batch_size] for i in range(0, len(file_ids), max_batch_size)] or [[]]
+
+		if len(batches) == 1:
+			results = [self._file_info_batch(batches[0])]
+		else:
+			with ThreadPoolExecutor(max_workers=min(max_workers or self.max_workers, len(batches))) as executor:
+				results = list(executor.map(self._file_info_batch, batches))
+
+		merged = BatchResult()
+		for result in results:
+			if result.get("error") is True:
+				merged.errors.append(result)
+			else:
+				merged.update(records(result, FileInfo) if self.typed else result)
+
+		if merged.errors and len(merged.errors) == len(results):
+			return ApiResponse.error_response(merged.errors[0]["status_id"], merged.errors[0]["api_msg"])
+
+		return merged
@@ -0,0 +1,369 @@
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatch
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from streamtape.ApiResponse import ApiResponse
+from streamtape.FileManager import FileManager
+from streamtape.Upload import Upload
+from streamtape.UploadManager import UploadManager
+
+ROOT_ID = ""
+
+
+class SyncPlan:
+	def __init__(self):
+		"""
+		The changes a sync would make, computed without transferring any file content.
+
+		Attributes:
+		    - folders (List[str]): The relative paths of the remote folders to create, parents first.
+		    - uploads (List[dict]): The files to upload with the keys "path" (relative path), "local_path",
+		      "size", "reason" ("new" or "changed") and "replaces" (the link ID of the remote file it replaces).
+		    - deletes (List[dict]): The remote orphans with the keys "path" and "linkid". Only filled when the
+		      sync deletes orphans.
+		    - unchanged (int): The number of files which are already in sync.
+		    - errors (List[dict]): The error responses of remote folders which could not be listed. Nothing
+		      below those folders is uploaded or deleted.
+
+		Returns:
+		    - None
+		"""
+		self.folders: List[str] = []
+		self.uploads: List[dict] = []
+		self.deletes: List[dict] = []
+		self.unchanged = 0
+		self.errors: List[dict] = []
+		self.remote_folders: Dict[str, str] = {}
+		self.refresh: List[Tuple[str, str, str, int, int]] = []
+
+	def summary(self) -> dict:
+		"""
+		Returns:
+		    - dict: The number of folders to create, files to upload (new and changed), orphans to delete,
+		      unchanged files and listing errors.
+		"""
+		return {
+			"folders"  : len(self.folders),
+			"new"      : sum(1 for upload in self.uploads if upload["reason"] == "new"),
+			"changed"  : sum(1 for upload in self.uploads if upload["reason"] == "changed"),
+			"deletes"  : len(self.deletes),
+			"unchanged": self.unchanged,
+			"errors"   : len(self.errors),
+		}
+
+	def __repr__(self) -> str:
+		return f"SyncPlan({self.summary()})"
+
+
+class Sync:
+	max_workers: int = 8
+
+	def __init__(self, file_manager: FileManager, uploader: Upload, local_root: str, folder_id: Optional[str] = None,
+				 state_path: str = ":memory:", max_workers: int = 8, max_in_flight: int = 4, delete_orphans: bool = False,
+				 exclude: Optional[Iterable[str]] = None):
+		"""
+		Mirrors a local directory tree into a remote folder, uploading only new or changed files.
+
+		Files are matched by relative path, size and SHA-256. The API does not report digests, so the digest of
+		every uploaded file is stored in a local state database together with the link ID and the stat of the
+		local file. Files whose stat did not change since the last sync are not hashed again. A file whose stat
+		changed is hashed (use an Upload with a DigestCache to make that cheap) and only re-uploaded if its digest
+		changed. Remote files which the sync did not upload are matched by name and size only.
+
+		Args:
+		    - file_manager (FileManager): The file manager used to list, create and delete.
+		    - uploader (Upload): The upload class used for hashing and uploading.
+		    - local_root (str): The local directory to mirror.
+		    - folder_id (Optional[str], optional): The remote folder to mirror into. Defaults to None (the root folder).
+		    - state_path (str, optional): The path of the SQLite state database. Defaults to an in-memory database.
+		    - max_workers (int, optional): The number of requests and uploads prepared at the same time. Defaults to 8.
+		    - max_in_flight (int, optional): The number of file bodies sent at the same time. Defaults to 4.
+		    - delete_orphans (bool, optional): Delete remote files which do not exist locally. Defaults to False.
+		    - exclude (Optional[Iterable[str]], optional): fnmatch patterns of local file and directory names to
+		      skip. Defaults to None.
+
+		Returns:
+		    - None
+
+		Example:
+		    >>> sync = Sync(f_manager, Upload(API_USER_KEY, API_PASSWORD, digest_cache=DigestCache("digests.sqlite")),
+		    ...             "/media/videos", "B-qlJkdHFeo", state_path="sync.sqlite")
+		    >>> plan = sync.plan()
+		    >>> plan.summary()
+		    {'folders': 1, 'new': 12, 'changed': 1, 'deletes': 0, 'unchanged': 49987, 'errors': 0}
+		    >>> sync.apply(plan)
+		"""
+		self.file_manager = file_manager
+		self.uploader = uploader
+		self.local_root = os.path.abspath(os.path.expanduser(local_root))
+		self.folder_id = folder_id or ROOT_ID
+		self.max_workers = max_workers
+		self.max_in_flight = max_in_flight
+		self.delete_orphans = delete_orphans
+		self.exclude = list(exclude or [])
+		self._lock = threading.Lock()
+		self._connection = sqlite3.connect(os.path.expanduser(state_path), check_same_thread=False)
+		self._connection.executescript(
+			"CREATE TABLE IF NOT EXISTS synced ("
+			"folder_id TEXT NOT NULL, path TEXT NOT NULL, linkid TEXT, sha256 TEXT NOT NULL, size INTEGER NOT NULL, "
+			"mtime_ns INTEGER NOT NULL, PRIMARY KEY (folder_id, path));"
+		)
+		self._connection.commit()
+
+	def _excluded(self, name: str) -> bool:
+		return any(fnmatch(name, pattern) for pattern in self.exclude)
+
+	def _local_files(self) -> Dict[str, os.stat_result]:
+		files = {}
+		for directory, dirnames, filenames in os.walk(self.local_root):
+			dirnames[:] = sorted(name for name in dirnames if not self._excluded(name))
+			relative = os.path.relpath(directory, self.local_root).replace(os.sep, "/")
+			relative = "" if relative == "." else relative
+
+			for name in filenames:
+				if self._excluded(name):
+					continue
+				path = os.path.join(directory, name)
+				if os.path.isfile(path):
+					files[f"{relative}/{name}" if relative else name] = os.stat(path)
+
+		return files
+
+	def _state(self) -> Dict[str, Tuple[Optional[str], str, int, int]]:
+		with self._lock:
+			rows = self._connection.execute(
+				"SELECT path, linkid, sha256, size, mtime_ns FROM synced WHERE folder_id = ?", (self.folder_id,)
+			).fetchall()
+
+		return {row[0]: tuple(row[1:]) for row in rows}
+
+	def _record(self, rows: List[Tuple[str, Optional[str], str, int, int]]):
+		with self._lock:
+			self._connection.executemany(
+				"INSERT OR REPLACE INTO synced (folder_id, path, linkid, sha256, size, mtime_ns) VALUES (?, ?, ?, ?, ?, ?)",
+				[(self.folder_id, *row) for row in rows]
+			)
+			self._connection.commit()
+
+	def plan(self) -> SyncPlan:
+		"""
+		Compares the local tree with the remote folder tree and returns the changes, without transferring any
+		file content. The remote tree is listed with parallel listfolder requests.
+
+		Returns:
+		    - SyncPlan: The plan.
+		"""
+		plan = SyncPlan()
+		remote_files: Dict[str, dict] = {}
+		failed: List[str] = []
+
+		def on_error(path: str, folder: dict, error: dict):
+			failed.append(path.strip("/"))
+			plan.errors.append({**error, "path": path})
+
+		for path, folder, files in self.file_manager.walk(self.folder_id or None, max_workers=self.max_workers,
+														  on_error=on_error):
+			relative = path.strip("/")
+			plan.remote_folders[relative] = folder.get("id") or self.folder_id
+			for file in files:
+				remote_files.setdefault(f"{relative}/{file.get('name')}" if relative else file.get("name"), file)
+
+		def unknown(path: str) -> bool:
+			return any(path == prefix or path.startswith(f"{prefix}/") or prefix == "" for prefix in failed)
+
+		local_files = self._local_files()
+		state = self._state()
+
+		missing_folders = set()
+		for path, stat in sorted(local_files.items()):
+			if unknown(path):
+				continue
+
+			folder = path.rpartition("/")[0]
+			while folder and folder not in plan.remote_folders:
+				missing_folders.add(folder)
+				folder = folder.rpartition("/")[0]
+
+			remote = remote_files.get(path)
+			local_path = os.path.join(self.local_root, *path.split("/"))
+			upload = {"path": path, "local_path": local_path, "size": stat.st_size, "reason": "new", "replaces": None}
+
+			if remote is None:
+				plan.uploads.append(upload)
+				continue
+
+			size = remote.get("size")
+			if size is None or int(size) != stat.st_size:
+				plan.uploads.append({**upload, "reason": "changed", "replaces": remote.get("linkid")})
+				continue
+
+			record = state.get(path)
+			if record is None or record[0] != remote.get("linkid"):
+				plan.unchanged += 1
+				continue
+
+			linkid, sha256, size, mtime_ns = record
+			if size == stat.st_size and mtime_ns == stat.st_mtime_ns:
+				plan.unchanged += 1
+				continue
+
+			digest = self.uploader.digest(local_path)
+			if digest == sha256:
+				plan.unchanged += 1
+				plan.refresh.append((path, linkid, sha256, stat.st_size, stat.st_mtime_ns))
+			else:
+				plan.uploads.append({**upload, "reason": "changed", "replaces": linkid})
+
+		plan.folders = sorted(missing_folders, key=lambda folder: (folder.count("/"), folder))
+
+		if self.delete_orphans:
+			plan.deletes = [
+				{"path": path, "linkid": file.get("linkid")}
+				for path, file in sorted(remote_files.items()) if path not in local_files and not unknown(path)
+			]
+
+		return plan
+
+	def apply(self, plan: SyncPlan) -> dict:
+		"""
+		Carries out a plan: creates the missing folders level by level, uploads the new and changed files
+		concurrently, deletes the remote files replaced by changed ones and, if enabled, the orphans. Every
+		successful upload is recorded in the state database right away, so an interrupted sync resumes where
+		it stopped.
+
+		Args:
+		    - plan (SyncPlan): The plan returned by plan().
+
+		Returns:
+		    - dict: The counts of "folders", "uploaded" and "deleted" and the "errors", a list of error
+		      responses with the "path" they belong to.
+		"""
+		folders = dict(plan.remote_folders)
+		errors: List[dict] = []
+		created = uploaded = deleted = 0
+
+		self._record(plan.refresh)
+
+		levels: Dict[int, List[str]] = {}
+		for folder in plan.folders:
+			levels.setdefault(folder.count("/"), []).append(folder)
+
+		with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+			for level in sorted(levels):
+				pending = [folder for folder in levels[level] if folder.rpartition("/")[0] in folders]
+
+				def create(folder: str) -> dict:
+					parent, _, name = folder.rpartition("/")
+					return self.file_manager.create_folder(name, folders[parent] or None)
+
+				for folder, result in zip(pending, executor.map(create, pending)):
+					if result.get("error"):
+						errors.append({**result, "path": folder})
+					else:
+						folders[folder] = result["folderid"]
+						created += 1
+
+		uploads = {upload["local_path"]: upload for upload in plan.uploads if upload["path"].rpartition("/")[0] in folders}
+		for upload in plan.uploads:
+			if upload["local_path"] not in uploads:
+				errors.append({**ApiResponse.error_response(404, "The remote folder could not be created"),
+							   "path": upload["path"]})
+
+		replaced = []
+		manager = UploadManager(self.uploader, max_workers=self.max_workers, max_in_flight=self.max_in_flight)
+		items = ((local_path, folders[upload["path"].rpartition("/")[0]] or None) for local_path, upload in uploads.items())
+		for local_path, result in manager.upload_to(items):
+			upload = uploads[local_path]
+			if result.get("error"):
+				errors.append({**result, "path": upload["path"]})
+				continue
+
+			uploaded += 1
+			stat = os.stat(local_path)
+			sha256 = result.get("sha256") or self.uploader.digest(local_path)
+			self._record([(upload["path"], result.get("id"), sha256, stat.st_size, stat.st_mtime_ns)])
+			if upload["replaces"]:
+				replaced.append({"path": upload["path"], "linkid": upload["replaces"]})
+
+		deletes = replaced + plan.deletes
+		if deletes:
+			rows = self.file_manager.delete_files([delete["linkid"] for delete in deletes], max_workers=self.max_workers)
+			forgotten = []
+			for index, (delete, row) in enumerate(zip(deletes, rows)):
+				if row["ok"]:
+					deleted += 1
+					# Only orphans lose their state row; replaced files were recorded with their new upload
+					if index >= len(replaced):
+						forgotten.append((self.folder_id, delete["path"]))
+				else:
+					errors.append({**row["error"], "path": delete["path"]})
+
+			with self._lock:
+				self._connection.executemany("DELETE FROM synced WHERE folder_id = ? AND path = ?", forgotten)
+				self._connection.commit()
+
+		return {"folders": created, "uploaded": uploaded, "deleted": deleted, "errors": errors}
+
+	def run(self, dry_run: bool = False) -> Tuple[SyncPlan, Optional[dict]]:
+		"""
+		Plans and, unless dry_run is set, applies a sync.
+
+		Args:
+		    - dry_run (bool, optional): Only compute the plan. Defaults to False.
+
+		Returns:
+		    - Tuple[SyncPlan, Optional[dict]]: The plan and the result of apply (None for a dry run).
+		"""
+		plan = self.plan()
+		return plan, None if dry_run else self.apply(plan)
+
+	def close(self):
+		"""
+		Closes the state database.
+
+		Returns:
+		    - None
+		"""
+		self._connection.close()
+
+	def __enter__(self) -> "Sync":
+		return self
+
+	def __exit__(self, exc_type, exc_val, exc_tb):
+		self.close()
+
+
+if __name__ == "__main__":
+	import argparse
+
+	from streamtape.DigestCache import DigestCache
+
+	parser = argparse.ArgumentParser(description="Mirrors a local directory into a StreamTape folder.")
+	parser.add_argument("local_root")
+	parser.add_argument("folder_id", nargs="?", default=None)
+	parser.add_argument("--user", default=os.environ.get("STREAMTAPE_USER"))
+	parser.add_argument("--password", default=os.environ.get("STREAMTAPE_PASSWORD"))
+	parser.add_argument("--state", default="streamtape-sync.sqlite", help="The state and digest cache database.")
+	parser.add_argument("--workers", type=int, default=8)
+	parser.add_argument("--delete-orphans", action="store_true")
+	parser.add_argument("--exclude", action="append", default=[])
+	parser.add_argument("--dry-run", action="store_true")
+	args = parser.parse_args()
+
+	with DigestCache(args.state) as digest_cache:
+		uploader = Upload(args.user, args.password, digest_cache=digest_cache)
+		with Sync(FileManager(args.user, args.password), uploader, args.local_root, args.folder_id, args.state,
+				  max_workers=args.workers, delete_orphans=args.delete_orphans, exclude=args.exclude) as sync:
+			plan, result = sync.run(dry_run=args.dry_run)
+			print(plan.summary())
+			for upload in plan.uploads:
+				print(f"{upload['reason']:>8} {upload['path']}")
+			for delete in plan.deletes:
+				print(f"  delete {delete['path']}")
+			if result is not None:
+				print({**result, "errors": len(result["errors"])})
+				for error in result["errors"]:
+					print(f"   error {error['path']}: {error['api_msg']}")
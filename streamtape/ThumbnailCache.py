@@ -0,0 +1,192 @@
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Optional, Union
+
+from streamtape.ApiResponse import ApiResponse
+
+class ThumbnailCache:
+	max_bytes: int = 512 * 1024 * 1024
+
+	def __init__(self, directory: str, max_bytes: int = 512 * 1024 * 1024):
+		"""
+		A content-addressed on-disk cache of thumbnail images. Images are stored once per SHA-256 of their content
+		and an index maps file IDs to them, so a cached thumbnail is served without any network call. When the
+		stored images exceed max_bytes, the least recently used ones are evicted.
+
+		Args:
+		    - directory (str): The cache directory, created if missing.
+		    - max_bytes (int, optional): The total size of the stored images. Defaults to 512 MiB.
+
+		Returns:
+		    - None
+
+		Example:
+		    >>> cache = ThumbnailCache("~/.cache/streamtape-thumbs", max_bytes=256 * 1024 * 1024)
+		    >>> converts.get_thumbnails(["file1", "file2"], cache)
+		    {'file1': '/home/me/.cache/streamtape-thumbs/objects/3f/3f2a...', 'file2': '...'}
+		"""
+		self.directory = os.path.expanduser(directory)
+		self.max_bytes = max_bytes
+		self.hits = 0
+		self.misses = 0
+		self._lock = threading.Lock()
+
+		os.makedirs(os.path.join(self.directory, "objects"), exist_ok=True)
+		self._connection = sqlite3.connect(os.path.join(self.directory, "index.sqlite"), check_same_thread=False)
+		self._connection.executescript(
+			"CREATE TABLE IF NOT EXISTS thumbnails (file_id TEXT PRIMARY KEY, digest TEXT NOT NULL, url TEXT);"
+			"CREATE INDEX IF NOT EXISTS thumbnails_digest ON thumbnails (digest);"
+			"CREATE TABLE IF NOT EXISTS objects (digest TEXT PRIMARY KEY, size INTEGER NOT NULL, accessed_at REAL NOT NULL);"
+			"CREATE INDEX IF NOT EXISTS objects_accessed_at ON objects (accessed_at);"
+		)
+		self._connection.commit()
+
+	def object_path(self, digest: str) -> str:
+		"""
+		Returns the path of a stored image.
+
+		Args:
+		    - digest (str): The SHA-256 hex digest of the image.
+
+		Returns:
+		    - str: The path of the image file.
+		"""
+		return os.path.join(self.directory, "objects", digest[:2], digest)
+
+	def get(self, file_id: str) -> Optional[str]:
+		"""
+		Returns the path of the cached thumbnail of a file.
+
+		Args:
+		    - file_id (str): The ID of the file.
+
+		Returns:
+		    - Optional[str]: The path of the image, or None on a cache miss.
+		"""
+		with self._lock:
+			row = self._connection.execute("SELECT digest FROM thumbnails WHERE file_id = ?", (file_id,)).fetchone()
+
+			if row is None or not os.path.exists(self.object_path(row[0])):
+				self.misses += 1
+				return None
+
+			self.hits += 1
+			self._connection.execute("UPDATE objects SET accessed_at = ? WHERE digest = ?", (time.time(), row[0]))
+			self._connection.commit()
+
+		return self.object_path(row[0])
+
+	def put(self, file_id: str, data: bytes, url: Optional[str] = None) -> Union[str, dict]:
+		"""
+		Stores the thumbnail of a file and evicts old images if the cache grew too large. The stored image itself
+		is never evicted by its own put.
+
+		Args:
+		    - file_id (str): The ID of the file.
+		    - data (bytes): The image.
+		    - url (Optional[str], optional): The URL the image was downloaded from. Defaults to None.
+
+		Returns:
+		    - Union[str, dict]: The path of the stored image, or an error response dictionary if the image alone
+		      is larger than max_bytes.
+		"""
+		if len(data) > self.max_bytes:
+			return ApiResponse.error_response(413, f"The thumbnail of {file_id} ({len(data)} bytes) exceeds max_bytes")
+
+		digest = hashlib.sha256(data).hexdigest()
+		path = self.object_path(digest)
+
+		os.makedirs(os.path.dirname(path), exist_ok=True)
+		fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+		with os.fdopen(fd, "wb") as f:
+			f.write(data)
+
+		# The image and its index rows are published together, so a concurrent evict cannot remove the image
+		# between the two and leave a row without a file
+		with self._lock:
+			if os.path.exists(path):
+				os.remove(temp_path)
+			else:
+				os.replace(temp_path, path)
+
+			self._connection.execute(
+				"INSERT OR REPLACE INTO objects (digest, size, accessed_at) VALUES (?, ?, ?)", (digest, len(data), time.time())
+			)
+			self._connection.execute(
+				"INSERT OR REPLACE INTO thumbnails (file_id, digest, url) VALUES (?, ?, ?)", (file_id, digest, url)
+			)
+			self._connection.commit()
+			self._evict(keep=digest)
+
+		return path
+
+	def evict(self) -> int:
+		"""
+		Removes the least recently used images until the cache fits into max_bytes.
+
+		Returns:
+		    - int: The number of removed images.
+		"""
+		with self._lock:
+			return self._evict()
+
+	def _evict(self, keep: Optional[str] = None) -> int:
+		removed = 0
+		total = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM objects").fetchone()[0]
+		if total <= self.max_bytes:
+			return 0
+
+		for digest, size in self._connection.execute("SELECT digest, size FROM objects ORDER BY accessed_at").fetchall():
+			if total <= self.max_bytes:
+				break
+			if digest == keep:
+				continue
+
+			try:
+				os.remove(self.object_path(digest))
+			except FileNotFoundError:
+				pass
+			self._connection.execute("DELETE FROM objects WHERE digest = ?", (digest,))
+			self._connection.execute("DELETE FROM thumbnails WHERE digest = ?", (digest,))
+			total -= size
+			removed += 1
+
+		self._connection.commit()
+
+		return removed
+
+	def stats(self) -> dict:
+		"""
+		Returns the hit and miss counters, the number of stored images and their total size.
+
+		Returns:
+		    - dict: A dictionary with the keys 'hits', 'misses', 'objects' and 'bytes'.
+		"""
+		with self._lock:
+			objects, size = self._connection.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM objects").fetchone()
+
+		return {
+			"hits"   : self.hits,
+			"misses" : self.misses,
+			"objects": objects,
+			"bytes"  : size,
+		}
+
+	def close(self):
+		"""
+		Closes the index database.
+
+		Returns:
+		    - None
+		"""
+		self._connection.close()
+
+	def __enter__(self) -> "ThumbnailCache":
+		return self
+
+	def __exit__(self, exc_type, exc_val, exc_tb):
+		self.close()
@@ -0,0 +1,161 @@
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Callable, Optional, Tuple
+
+
+class TicketCache:
+	max_size: int = 1024
+	safety_margin: float = 5.0
+
+	def __init__(self, max_size: int = 1024, safety_margin: float = 5.0, now: Callable[[], datetime] = datetime.now):
+		"""
+		A thread-safe LRU cache for download tickets and resolved download links keyed by file ID. Entries are
+		served until their valid_until (minus a safety margin) has passed.
+
+		Args:
+		    - max_size (int, optional): The number of entries kept, least recently used entries are evicted first.
+		      Defaults to 1024.
+		    - safety_margin (float, optional): The number of seconds before valid_until an entry is dropped.
+		      Defaults to 5.0.
+		    - now (callable, optional): Returns the current time in the time zone of the API's valid_until values.
+		      Defaults to datetime.now.
+
+		Returns:
+		    - None
+
+		Example:
+		    >>> stream = Stream(API_USER_KEY, API_PASSWORD, ticket_cache=TicketCache(max_size=10000))
+		    >>> stream.download_link("file_id")  # asks for a ticket and a link
+		    >>> stream.download_link("file_id")  # served from the cache
+		"""
+		self.max_size = max_size
+		self.safety_margin = safety_margin
+		self.now = now
+		self.hits = 0
+		self.misses = 0
+		self._entries: "OrderedDict[Tuple[str, str], Tuple[dict, datetime, float]]" = OrderedDict()
+		self._lock = threading.Lock()
+
+	def _get(self, kind: str, file_id: str) -> Optional[Tuple[dict, float]]:
+		key = (kind, file_id)
+
+		with self._lock:
+			entry = self._entries.get(key)
+			if entry is None:
+				self.misses += 1
+				return None
+
+			value, valid_until, stored_at = entry
+			if self.now() + timedelta(seconds=self.safety_margin) >= valid_until:
+				del self._entries[key]
+				self.misses += 1
+				return None
+
+			self._entries.move_to_end(key)
+			self.hits += 1
+
+		return value, stored_at
+
+	def _put(self, kind: str, file_id: str, value: dict, valid_until: Optional[datetime]):
+		if valid_until is None:
+			return
+
+		with self._lock:
+			self._entries[(kind, file_id)] = (value, valid_until, time.monotonic())
+			self._entries.move_to_end((kind, file_id))
+
+			while len(self._entries) > self.max_size:
+				self._entries.popitem(last=False)
+
+	def get_ticket(self, file_id: str) -> Optional[dict]:
+		"""
+		Returns a still valid download ticket. Its wait_time is reduced by the time passed since it was issued.
+
+		Args:
+		    - file_id (str): The ID of the file.
+
+		Returns:
+		    - Optional[dict]: The ticket as returned by Stream.dlticket, or None on a cache miss.
+		"""
+		entry = self._get("ticket", file_id)
+		if entry is None:
+			return None
+
+		ticket, stored_at = entry
+		return {
+			**ticket,
+			"wait_time": max(0, int(round(ticket["wait_time"] - (time.monotonic() - stored_at)))),
+		}
+
+	def put_ticket(self, file_id: str, ticket: dict):
+		"""
+		Stores a download ticket until its valid_until.
+
+		Args:
+		    - file_id (str): The ID of the file.
+		    - ticket (dict): The ticket as returned by Stream.dlticket.
+
+		Returns:
+		    - None
+		"""
+		self._put("ticket", file_id, ticket, ticket.get("valid_until"))
+
+	def get_link(self, file_id: str) -> Optional[dict]:
+		"""
+		Returns a still valid download link.
+
+		Args:
+		    - file_id (str): The ID of the file.
+
+		Returns:
+		    - Optional[dict]: The link as returned by Stream.download_link, or None on a cache miss.
+		"""
+		entry = self._get("link", file_id)
+		return entry[0] if entry is not None else None
+
+	def put_link(self, file_id: str, link: dict, valid_until: Optional[datetime]):
+		"""
+		Stores a download link until the given time, usually the valid_until of the ticket it was resolved with.
+
+		Args:
+		    - file_id (str): The ID of the file.
+		    - link (dict): The link as returned by Stream.download_link.
+		    - valid_until (Optional[datetime]): The time the link expires. Links without expiry are not stored.
+
+		Returns:
+		    - None
+		"""
+		self._put("link", file_id, link, valid_until)
+
+	def invalidate(self, file_id: str):
+		"""
+		Drops the cached ticket and link of a file.
+
+		Args:
+		    - file_id (str): The ID of the file.
+
+		Returns:
+		    - None
+		"""
+		with self._lock:
+			self._entries.pop(("ticket", file_id), None)
+			self._entries.pop(("link", file_id), None)
+
+	def stats(self) -> dict:
+		"""
+		Returns the hit and miss counters and the number of cached entries.
+
+		Returns:
+		    - dict: A dictionary with the keys 'hits', 'misses' and 'entries'.
+		"""
+		with self._lock:
+			return {
+				"hits"   : self.hits,
+				"misses" : self.misses,
+				"entries": len(self._entries),
+			}
+
+	def __len__(self) -> int:
+		return len(self._entries)
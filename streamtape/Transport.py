@@ -0,0 +1,297 @@
+import json
+import threading
+import time
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
+
+from streamtape.Metrics import AfterHook, BeforeHook, Metrics, endpoint_of
+from streamtape.Retry import AimdLimiter, RetryPolicy
+from streamtape.SingleFlight import SingleFlight, request_key
+
+if TYPE_CHECKING:
+	import requests
+
+TimeoutType = Union[float, Tuple[float, float]]
+
+
+class Transport:
+	pool_connections: int = 10
+	pool_maxsize: int = 10
+	timeout: Optional[TimeoutType] = (10, 120)
+	retry: Optional[RetryPolicy] = None
+	limiter: Optional[AimdLimiter] = None
+	json_loads: Callable[[bytes], Any] = staticmethod(json.loads)
+
+	_default: Optional["Transport"] = None
+	_default_lock = threading.Lock()
+
+	def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10, pool_sizes: Optional[Dict[str, int]] = None,
+				 timeout: Optional[TimeoutType] = (10, 120), retry: Optional[RetryPolicy] = RetryPolicy(),
+				 limiter: Optional[AimdLimiter] = None, json_loads: Optional[Callable[[bytes], Any]] = None,
+				 metrics: Optional[Metrics] = None, single_flight: bool = False):
+		"""
+		Initializes a pooled HTTP transport which can be shared between all API classes. The requests session is
+		only created (and requests only imported) when the first request is sent.
+
+		Args:
+		    - pool_connections (int, optional): The number of hosts to keep connection pools for. Defaults to 10.
+		    - pool_maxsize (int, optional): The number of keep-alive connections kept per host. Defaults to 10.
+		    - pool_sizes (dict, optional): Per-host overrides of pool_maxsize, keyed by URL prefix
+		      (e.g. {"https://api.streamtape.com": 32}). Defaults to None.
+		    - timeout (float | tuple, optional): Default (connect, read) timeout in seconds. Defaults to (10, 120).
+		    - retry (RetryPolicy, optional): When idempotent requests are retried, None disables retries.
+		      Defaults to 3 retries with exponential back-off and jitter on network errors, 429, 5xx and 509.
+		    - limiter (AimdLimiter, optional): Adaptive limit of the requests in flight, shrinking on 509/5xx
+		      and growing on successes. Defaults to an AimdLimiter between 1 and 4 * pool_maxsize.
+		    - json_loads (callable, optional): Decodes response bodies from bytes, e.g. orjson.loads for large
+		      listings. Defaults to json.loads.
+		    - metrics (Metrics, optional): Records counters and latency histograms of every request. Defaults to None.
+		    - single_flight (bool, optional): Merges identical read requests (same URL and parameters, sent with
+		      coalesce=True) which are in flight at the same time into one network call whose response is shared by
+		      every caller, so treat responses as read-only. Defaults to False.
+
+		Returns:
+		    - None
+
+		Example:
+		    >>> with Transport(pool_maxsize=32) as transport:
+		    ...     manager = FileManager(API_USER_KEY, API_PASSWORD, transport=transport)
+		    ...     manager.list_data()
+		"""
+		self.pool_connections = pool_connections
+		self.pool_maxsize = pool_maxsize
+		self.timeout = timeout
+		self.retry = retry
+		self.limiter = limiter or AimdLimiter(initial_limit=pool_maxsize, max_limit=4 * pool_maxsize)
+		self.json_loads = json_loads or json.loads
+		self.pool_sizes: Dict[str, int] = dict(pool_sizes or {})
+		self._session: Optional["requests.Session"] = None
+		self._session_lock = threading.Lock()
+		self.before_request: List[BeforeHook] = []
+		self.after_request: List[AfterHook] = []
+		self.metrics = metrics.instrument(self) if metrics is not None else None
+		self.single_flight = SingleFlight() if single_flight else None
+
+	@property
+	def session(self) -> "requests.Session":
+		"""
+		The pooled requests session, created on first use.
+
+		Returns:
+		    - requests.Session: The session.
+		"""
+		if self._session is None:
+			with self._session_lock:
+				if self._session is None:
+					import requests
+					from requests.adapters import HTTPAdapter
+
+					session = requests.Session()
+					adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize)
+					session.mount("https://", adapter)
+					session.mount("http://", adapter)
+
+					for prefix, size in self.pool_sizes.items():
+						session.mount(prefix, HTTPAdapter(pool_connections=1, pool_maxsize=size))
+
+					self._session = session
+
+		return self._session
+
+	def mount(self, prefix: str, pool_maxsize: int):
+		"""
+		Mounts a dedicated connection pool for every URL starting with the given prefix.
+
+		Args:
+		    - prefix (str): The URL prefix, e.g. "https://api.streamtape.com".
+		    - pool_maxsize (int): The number of keep-alive connections kept for this prefix.
+
+		Returns:
+		    - None
+		"""
+		self.pool_sizes[prefix] = pool_maxsize
+
+		if self._session is not None:
+			from requests.adapters import HTTPAdapter
+
+			self._session.mount(prefix, HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize))
+
+	def add_hook(self, before: Optional[BeforeHook] = None, after: Optional[AfterHook] = None):
+		"""
+		Registers instrumentation hooks which run around every request attempt, retries included.
+
+		Args:
+		    - before (callable, optional): Called with the request context, a dictionary with the keys 'method',
+		      'url', 'endpoint' (e.g. "file/listfolder") and 'attempt'. Defaults to None.
+		    - after (callable, optional): Called with the request context, the decoded response (None after a
+		      network error) and the duration of the attempt in seconds. Defaults to None.
+
+		Returns:
+		    - None
+		"""
+		if before is not None:
+			self.before_request.append(before)
+		if after is not None:
+			self.after_request.append(after)
+
+	def remove_hook(self, before: Optional[BeforeHook] = None, after: Optional[AfterHook] = None):
+		"""
+		Removes hooks registered with add_hook.
+
+		Args:
+		    - before (callable, optional): The pre-request hook. Defaults to None.
+		    - after (callable, optional): The post-request hook. Defaults to None.
+
+		Returns:
+		    - None
+		"""
+		if before in self.before_request:
+			self.before_request.remove(before)
+		if after in self.after_request:
+			self.after_request.remove(after)
+
+	def _decode(self, response: "requests.Response") -> dict:
+		try:
+			body = self.json_loads(response.content)
+		except ValueError:
+			body = None
+
+		try:
+			status = int(body["status"])
+		except (TypeError, KeyError, ValueError):
+			status = response.status_code if response.status_code != 200 else 502
+			return {"status": status, "msg": f"Unexpected response (HTTP {response.status_code}): {response.text[:200]}", "result": None}
+
+		return {**body, "status": status}
+
+	def request(self, url: str, type_request: str = 'GET', data=None, parameters: Optional[dict] = None,
+				files: Optional[dict] = None, headers: Optional[dict] = None, timeout: Optional[TimeoutType] = None,
+				idempotent: Optional[bool] = None, coalesce: bool = False) -> dict:
+		"""
+		Sends a HTTP request over the pooled session and returns the decoded JSON body.
+
+		Idempotent requests which fail with a network error or a retryable status (HTTP or API status, e.g. 509)
+		are sent again after an exponential back-off with jitter, honouring Retry-After. Every API call passes
+		the adaptive limiter, which shrinks on 509/5xx and grows on successes. Requests with a body (uploads)
+		bypass it, so long uploads to the upload servers neither hold its slots nor throttle API calls. With single_flight enabled,
+		identical read requests (coalesce=True) in flight at the same time share one network call.
+
+		Args:
+		    - url (str): The URL to send the request to.
+		    - type_request (str, optional): The type of request to send. Defaults to 'GET'.
+		    - data (optional): The data to send with the request. Defaults to None.
+		    - parameters (dict, optional): The parameters to include in the request. Defaults to None.
+		    - files (dict, optional): The files to include in the request. Defaults to None.
+		    - headers (dict, optional): Additional request headers. Defaults to None.
+		    - timeout (float | tuple, optional): Overrides the default timeout for this call. Defaults to None.
+		    - idempotent (bool, optional): Whether the request may be retried. Defaults to True for GET and
+		      False for every other request type.
+		    - coalesce (bool, optional): Whether the request is a read which may share the response of an identical
+		      request in flight when single_flight is enabled. Never set it for requests with side effects, e.g.
+		      file/ul returns a single-use upload URL. Defaults to False.
+
+		Returns:
+		    - dict: The decoded JSON response. Bodies which are not API responses and network errors after the
+		      last attempt are returned as {"status": <code>, "msg": <description>, "result": None}.
+		"""
+		if idempotent is None:
+			idempotent = type_request.upper() == 'GET'
+
+		send = partial(self._send, url, type_request, data, parameters, files, headers, timeout, idempotent)
+		if coalesce and self.single_flight is not None and type_request.upper() == 'GET' and data is None and files is None:
+			return self.single_flight.do(request_key(url, parameters, headers), send)
+
+		return send()
+
+	def _send(self, url: str, type_request: str, data, parameters: Optional[dict], files: Optional[dict],
+			  headers: Optional[dict], timeout: Optional[TimeoutType], idempotent: bool) -> dict:
+		from requests import ConnectionError, Timeout
+
+		limited = data is None and files is None
+
+		attempt = 0
+		while True:
+			retry_after: Optional[float] = None
+			context = {"method": type_request.upper(), "url": url, "endpoint": endpoint_of(url), "attempt": attempt}
+			for hook in self.before_request:
+				hook(context)
+
+			congested: Optional[bool] = None
+			if limited:
+				self.limiter.acquire()
+			started = time.perf_counter()
+			try:
+				response = self.session.request(type_request.upper(), url, data=data, params=parameters, files=files,
+												headers=headers, timeout=timeout or self.timeout)
+				body = self._decode(response)
+				status = body["status"]
+				retry_after = RetryPolicy.parse_retry_after(response.headers.get("Retry-After"))
+				congested = status == 509 or 500 <= status < 600
+			except (ConnectionError, Timeout) as e:
+				status = None
+				body = {"status": 503, "msg": f"{type(e).__name__}: {e}", "result": None}
+			finally:
+				# Unexpected errors (invalid schema, broken encodings, ...) must not leak the slot
+				if limited:
+					self.limiter.release(congested)
+
+			elapsed = time.perf_counter() - started
+			for hook in self.after_request:
+				hook(context, body if status is not None else None, elapsed)
+
+			if status == 200 or not idempotent or self.retry is None or not self.retry.should_retry(status, attempt):
+				return body
+
+			time.sleep(self.retry.backoff(attempt, retry_after))
+			attempt += 1
+
+	def raw_request(self, url: str, type_request: str = 'GET', headers: Optional[dict] = None, stream: bool = True,
+					timeout: Optional[TimeoutType] = None) -> "requests.Response":
+		"""
+		Sends a HTTP request over the pooled session and returns the undecoded response, e.g. to stream a download.
+		Close the response (or use it as a context manager) to give the connection back to the pool.
+
+		Args:
+		    - url (str): The URL to send the request to.
+		    - type_request (str, optional): The type of request to send. Defaults to 'GET'.
+		    - headers (dict, optional): Additional request headers. Defaults to None.
+		    - stream (bool, optional): Defer downloading the body until it is read. Defaults to True.
+		    - timeout (float | tuple, optional): Overrides the default timeout for this call. Defaults to None.
+
+		Returns:
+		    - requests.Response: The response.
+		"""
+		return self.session.request(type_request.upper(), url, headers=headers, stream=stream,
+									timeout=timeout or self.timeout)
+
+	def close(self):
+		"""
+		Closes all pooled connections of the transport.
+
+		Returns:
+		    - None
+		"""
+		if self._session is not None:
+			self._session.close()
+			self._session = None
+
+	def __enter__(self) -> "Transport":
+		return self
+
+	def __exit__(self, exc_type, exc_val, exc_tb):
+		self.close()
+
+	@classmethod
+	def default(cls) -> "Transport":
+		"""
+		Returns the process-wide transport used by API classes which were created without an explicit transport.
+
+		Returns:
+		    - Transport: The shared default transport.
+		"""
+		if cls._default is None:
+			with cls._default_lock:
+				if cls._default is None:
+					cls._default = cls()
+
+		return cls._default
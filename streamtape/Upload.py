@@ -1,23 +1,135 @@
-import hashlib
-from typing import Optional
+from typing import Iterable, Iterator, Optional, Tuple
 
 from streamtape.ApiResponse import ApiResponse
 from streamtape.BaseConfig import BaseConfig
+from streamtape.DigestCache import DigestCache
+from streamtape.Hasher import Hasher
+from streamtape.Multipart import MultipartFile, ProgressCallback
+from streamtape.Transport import Transport
+from streamtape.UploadManager import UploadManager
 
 
 class Upload(BaseConfig):
 	parameter: str = "file"
+	chunk_size: int = 8 * 1024 * 1024
+	digest_cache: Optional[DigestCache] = None
+	hasher: Optional[Hasher] = None
 
-	def __init__(self, user: str, password: str):
-		super().__init__(user, password)
+	def __init__(self, user: str, password: str, transport: Optional[Transport] = None,
+				 digest_cache: Optional[DigestCache] = None, hasher: Optional[Hasher] = None):
+		"""
+		Initializes the upload class.
+
+		Args:
+		    - user (str): The username for the API authentication.
+		    - password (str): The password for the API authentication.
+		    - transport (Transport, optional): The pooled transport to send requests with. Defaults to the shared transport.
+		    - digest_cache (DigestCache, optional): Cache of file digests, so unchanged files are not hashed again
+		      on retries and re-runs. Defaults to None.
+		    - hasher (Hasher, optional): The hashing engine, e.g. one with a process pool for bulk uploads.
+		      Defaults to a Hasher with 8 MiB memory-mapped reads.
+
+		Returns:
+		    - None
+		"""
+		super().__init__(user, password, transport)
+		self.digest_cache = digest_cache
+		self.hasher = hasher or Hasher()
+
+	@staticmethod
+	def sha256(file_path: str, chunk_size: int = 8 * 1024 * 1024) -> str:
+		"""
+		Computes the SHA-256 digest of a file. The file is memory-mapped and hashed in large slices,
+		so no intermediate copies of the data are made.
+
+		Args:
+		    - file_path (str): The path of the file to hash.
+		    - chunk_size (int, optional): The number of bytes hashed at once. Defaults to 8 MiB.
+
+		Returns:
+		    - str: The hex digest of the file.
+		"""
+		return Hasher(read_size=chunk_size).hash_file(file_path)
+
+	def digest(self, file_path: str) -> str:
+		"""
+		Returns the SHA-256 digest of a file computed by the hasher, served from the digest cache if one is set.
+
+		Args:
+		    - file_path (str): The path of the file to hash.
+
+		Returns:
+		    - str: The hex digest of the file.
+		"""
+		if self.digest_cache is not None:
+			return self.digest_cache.digest(file_path, self.hasher.hash_file)
+
+		return self.hasher.hash_file(file_path)
+
+	def upload_url(self, sha256: str, folder_id: Optional[str] = None) -> dict:
+		"""
+		Requests an upload URL for a file with the given digest.
+
+		Args:
+		    - sha256 (str): The hex digest of the file.
+		    - folder_id (Optional[str], optional): The ID of the folder where the file will be uploaded. Defaults to None.
+
+		Returns:
+		    - dict: A dictionary containing the "url" to upload to and its "valid_until",
+		      or an error response dictionary.
+		"""
+		url = self.url_query(f"{self.parameter}/ul", query={
+			"sha256": sha256,
+			"folder": folder_id
+		})
+		response: Optional[ApiResponse] = self.send_request(url)
 
-	def upload(self, file_path: str, folder_id: Optional[str] = None) -> dict:
+		if response is not None:
+			if response["status"] == 200:
+				return response["result"]
+			else:
+				return ApiResponse.error_response(response["status"], response["msg"])
+		else:
+			return ApiResponse.error_response(404, "Couldn't send request")
+
+	def send_file(self, upload_url: str, file_path: str, chunk_size: Optional[int] = None,
+				  progress: Optional[ProgressCallback] = None) -> dict:
+		"""
+		Streams a file to an upload URL returned by upload_url.
+
+		Args:
+		    - upload_url (str): The URL to upload the file to.
+		    - file_path (str): The path of the file to be uploaded.
+		    - chunk_size (Optional[int], optional): The number of bytes sent at once. Defaults to 8 MiB.
+		    - progress (Optional[callable], optional): Called while sending with
+		      (bytes_sent, total_bytes, bytes_per_second). Defaults to None.
+
+		Returns:
+		    - dict: The result of the upload or an error response dictionary.
+		"""
+		body = MultipartFile(file_path, "file1", chunk_size=chunk_size or self.chunk_size, progress=progress)
+		file_upload_response = self.send_request(upload_url, type_request='POST', data=body, headers=body.headers)
+
+		if file_upload_response["status"] == 200:
+			return file_upload_response["result"]
+		else:
+			return ApiResponse.error_response(file_upload_response["status"], file_upload_response["msg"])
+
+	def upload(self, file_path: str, folder_id: Optional[str] = None, chunk_size: Optional[int] = None,
+			   progress: Optional[ProgressCallback] = None) -> dict:
 		"""
 		Uploads a file to the server and returns the response.
 
+		The file is hashed first (the API needs the digest to hand out an upload URL), unless the digest cache
+		already knows it, and then streamed to the upload server as a multipart body in large chunks, so memory
+		use stays bounded regardless of the file size.
+
 		Args:
 		    - file_path (str): The path of the file to be uploaded.
 		    - folder_id (Optional[str], optional): The ID of the folder where the file will be uploaded. Defaults to None.
+		    - chunk_size (Optional[int], optional): The number of bytes sent at once. Defaults to 8 MiB.
+		    - progress (Optional[callable], optional): Called while sending with
+		      (bytes_sent, total_bytes, bytes_per_second). Defaults to None.
 
 		Returns:
 		    - dict: A dictionary containing the following information:
@@ -29,33 +141,25 @@ class Upload(BaseConfig):
 		    - ApiResponse: If the upload request fails, an error response is returned.
 
 		"""
-		sha256_hash = hashlib.sha256()
-		response: Optional[ApiResponse] = None
+		upload_url = self.upload_url(self.digest(file_path), folder_id)
 
-		with open(file_path, "rb") as f:
-			for byte_block in iter(lambda: f.read(4096), b""):
-				sha256_hash.update(byte_block)
-			sha256 = sha256_hash.hexdigest()
+		if upload_url.get("error"):
+			return upload_url
 
-			url = self.url_query(f"{self.parameter}/ul", query={
-				"sha256": sha256,
-				"folder": folder_id
-			})
-			response = BaseConfig.send_request(url)
+		return self.send_file(upload_url["url"], file_path, chunk_size, progress)
 
-			f.close()
+	def upload_many(self, file_paths: Iterable[str], folder_id: Optional[str] = None, max_workers: int = 8,
+					max_in_flight: int = 4) -> Iterator[Tuple[str, dict]]:
+		"""
+		Uploads many files concurrently, see UploadManager.upload_many.
 
-		if response is not None:
-			if response["status"] == 200:
-				file_upload_response = BaseConfig.send_request(response["result"]["url"], type_request='POST', files={
-					"file1": open(file_path, 'rb')
-				})
-
-				if file_upload_response["status"] == 200:
-					return file_upload_response["result"]
-				else:
-					return ApiResponse.error_response(file_upload_response["status"], file_upload_response["msg"])
-			else:
-				return ApiResponse.error_response(response["status"], response["msg"])
-		else:
-			return ApiResponse.error_response(404, "Couldn't send request")
+		Args:
+		    - file_paths (Iterable[str]): The paths of the files to be uploaded.
+		    - folder_id (Optional[str], optional): The ID of the folder where the files will be uploaded. Defaults to None.
+		    - max_workers (int, optional): The number of files hashed and prepared at the same time. Defaults to 8.
+		    - max_in_flight (int, optional): The number of file bodies sent at the same time. Defaults to 4.
+
+		Returns:
+		    - Iterator[Tuple[str, dict]]: (file_path, result) tuples in the order the uploads finish.
+		"""
+		return UploadManager(self, max_workers, max_in_flight).upload_many(file_paths, folder_id)
@@ -0,0 +1,95 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Optional, Tuple
+
+from streamtape.ApiResponse import ApiResponse
+
+if TYPE_CHECKING:
+	from streamtape.Upload import Upload
+
+ResultCallback = Callable[[str, dict], None]
+
+
+class UploadManager:
+	max_workers: int = 8
+	max_in_flight: int = 4
+
+	def __init__(self, uploader: "Upload", max_workers: int = 8, max_in_flight: int = 4,
+				 on_result: Optional[ResultCallback] = None):
+		"""
+		Uploads many files concurrently. Files are hashed and get their upload URLs in parallel on a pool of
+		max_workers threads, while at most max_in_flight file bodies are streamed at the same time. Workers which
+		finished hashing wait for a free sending slot, so the uplink stays busy during the hash and handshake phases.
+
+		Use a transport with pool_maxsize of at least max_workers to keep every worker on a warm connection.
+
+		Args:
+		    - uploader (Upload): The upload class used for every file.
+		    - max_workers (int, optional): The number of files hashed and prepared at the same time. Defaults to 8.
+		    - max_in_flight (int, optional): The number of file bodies sent at the same time. Defaults to 4.
+		    - on_result (callable, optional): Called with (file_path, result) whenever a file finished. Defaults to None.
+
+		Returns:
+		    - None
+
+		Example:
+		    >>> manager = UploadManager(Upload(API_USER_KEY, API_PASSWORD), max_workers=16, max_in_flight=4)
+		    >>> for file_path, result in manager.upload_many(["a.mp4", "b.mp4"], "folder_id"):
+		    ...     print(file_path, result)
+		"""
+		self.uploader = uploader
+		self.max_workers = max_workers
+		self.max_in_flight = max_in_flight
+		self.on_result = on_result
+		self._in_flight = threading.BoundedSemaphore(max_in_flight)
+
+	def _upload(self, file_path: str, folder_id: Optional[str]) -> dict:
+		try:
+			upload_url = self.uploader.upload_url(self.uploader.digest(file_path), folder_id)
+			if upload_url.get("error"):
+				return upload_url
+
+			with self._in_flight:
+				return self.uploader.send_file(upload_url["url"], file_path)
+		except (FileNotFoundError, IsADirectoryError, PermissionError) as e:
+			return ApiResponse.error_response(400, f"{os.path.basename(file_path)}: {e}")
+		except Exception as e:
+			return ApiResponse.error_response(500, str(e))
+
+	def upload_many(self, file_paths: Iterable[str], folder_id: Optional[str] = None) -> Iterator[Tuple[str, dict]]:
+		"""
+		Uploads the files and yields the results in the order the uploads finish. A failing file never stops
+		the others, its result is an error response dictionary instead.
+
+		Args:
+		    - file_paths (Iterable[str]): The paths of the files to be uploaded.
+		    - folder_id (Optional[str], optional): The ID of the folder where the files will be uploaded. Defaults to None.
+
+		Returns:
+		    - Iterator[Tuple[str, dict]]: (file_path, result) tuples. The result is the upload result
+		      or an error response dictionary.
+		"""
+		return self.upload_to((file_path, folder_id) for file_path in file_paths)
+
+	def upload_to(self, items: Iterable[Tuple[str, Optional[str]]]) -> Iterator[Tuple[str, dict]]:
+		"""
+		Like upload_many, but every file has its own target folder.
+
+		Args:
+		    - items (Iterable[Tuple[str, Optional[str]]]): (file_path, folder_id) tuples.
+
+		Returns:
+		    - Iterator[Tuple[str, dict]]: (file_path, result) tuples in the order the uploads finish.
+		"""
+		with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+			futures = {executor.submit(self._upload, file_path, folder_id): file_path for file_path, folder_id in items}
+
+			for future in as_completed(futures):
+				file_path = futures[future]
+				result = future.result()
+
+				if self.on_result is not None:
+					self.on_result(file_path, result)
+
+				yield file_path, result
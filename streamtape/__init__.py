@@ -0,0 +1,21 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+	from streamtape.Facade import Client
+
+__all__ = ["Client"]
+
+
+def __getattr__(name: str):
+	# Resolved on first access so `import streamtape` stays cheap.
+	if name == "Client":
+		from streamtape.Facade import Client
+
+		globals()["Client"] = Client
+		return Client
+
+	raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+	return sorted(list(globals()) + __all__)